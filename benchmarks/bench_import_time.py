@@ -0,0 +1,59 @@
+"""
+Measure module import cost with ``python -X importtime``.
+
+Reports the total import time of a module, its heaviest imports, and whether
+heavy optional dependencies were pulled in.
+
+Usage:
+    python -m benchmarks.bench_import_time [module ...] [--top N] [--runs R]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ('requests', 'reportlab', 'PyPDF2', 'docx', 'httpx')
+_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$')
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_profile(module):
+    """Import ``module`` in a fresh interpreter and return [(cumulative_us, self_us, depth, name)]."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((int(cumulative_us), int(self_us), len(indent) // 2, name))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('modules', nargs='*', default=['main', 'components', 'components.forms'])
+    parser.add_argument('--top', type=int, default=10, help='heaviest direct imports to list')
+    parser.add_argument('--runs', type=int, default=3, help='fresh interpreters per module')
+    args = parser.parse_args()
+
+    for module in args.modules:
+        totals = []
+        for _ in range(args.runs):
+            rows = import_profile(module)
+            totals.append(sum(row[0] for row in rows if row[2] == 0))
+        loaded = {row[3].split('.')[0] for row in rows}
+        heavy = [name for name in HEAVY_MODULES if name in loaded]
+        print(f"{module}: {statistics.median(totals) / 1000:.1f} ms median over {args.runs} runs; "
+              f"heavy deps loaded: {', '.join(heavy) or 'none'}")
+        direct = sorted((row for row in rows if row[2] == 1), reverse=True)[:args.top]
+        for cumulative_us, _, _, name in direct:
+            print(f"    {cumulative_us / 1000:8.1f} ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark PDF rendering: per-call style building vs compiled templates vs batch.
+
+Usage:
+    python -m benchmarks.bench_pdf_generator [--count N]
+"""
+import argparse
+import time
+from io import BytesIO
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate
+
+from benchmarks.sample_resumes import resume_record
+from utils import pdf_generator
+from utils.process_pool import shutdown_executor
+
+
+def legacy_generate_pdf(personal_info, education, experience, skills, template):
+    """Rendering as it was before templates were compiled: styles rebuilt per call."""
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = getSampleStyleSheet()
+    color = {'Professional': colors.navy, 'Modern': colors.darkgreen}.get(template, colors.black)
+    title_style = ParagraphStyle('CustomTitle', parent=styles['Heading1'], fontSize=24,
+                                 textColor=color, spaceAfter=30)
+    compiled = pdf_generator.CompiledTemplate(template, title_style, styles['Heading2'],
+                                              styles['Normal'], {'pagesize': letter})
+    doc.build(pdf_generator._build_story(personal_info, education, experience, skills, compiled))
+    return buffer.getvalue()
+
+
+def timed(label, count, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:22s} {elapsed / count * 1000:7.2f} ms/doc  {count / elapsed:8.1f} docs/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=300, help='resumes to render')
+    args = parser.parse_args()
+
+    resumes = [resume_record(seed) for seed in range(args.count)]
+    args_list = [(r['personal_info'], r['education'], r['experience'], r['skills'], r['template'])
+                 for r in resumes]
+
+    timed('legacy (per-call)', args.count, lambda: [legacy_generate_pdf(*a) for a in args_list])
+    timed('compiled templates', args.count, lambda: [pdf_generator.generate_pdf(*a) for a in args_list])
+    pdf_generator.generate_pdfs(resumes[:8])  # warm up workers
+    timed('generate_pdfs (pool)', args.count, lambda: pdf_generator.generate_pdfs(resumes))
+    shutdown_executor()
+
+
+if __name__ == '__main__':
+    main()
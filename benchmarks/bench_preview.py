@@ -0,0 +1,91 @@
+"""
+Benchmark preview rerun latency versus number of education/experience entries.
+
+Runs components.preview.render_preview inside Streamlit's AppTest harness and
+compares it with the previous one-element-per-line rendering.
+
+Usage:
+    python -m benchmarks.bench_preview [--entries 5 20 80] [--reruns N]
+"""
+import argparse
+import logging
+import time
+
+from streamlit.testing.v1 import AppTest
+
+
+def legacy_app():
+    import streamlit as st
+
+    st.markdown('<div class="preview-container">', unsafe_allow_html=True)
+    if st.session_state.personal_info:
+        st.markdown(f"# {st.session_state.personal_info.get('name', '')}")
+        st.markdown(f"📧 {st.session_state.personal_info.get('email', '')}")
+        st.markdown(f"📱 {st.session_state.personal_info.get('phone', '')}")
+        st.markdown("---")
+    if any(edu.get('institution') for edu in st.session_state.education):
+        st.markdown("## Education")
+        for edu in st.session_state.education:
+            if edu.get('institution'):
+                st.markdown(f"**{edu.get('institution')}**")
+                st.markdown(f"{edu.get('degree')} - {edu.get('graduation_year')}")
+        st.markdown("---")
+    if any(exp.get('company') for exp in st.session_state.experience):
+        st.markdown("## Professional Experience")
+        for exp in st.session_state.experience:
+            if exp.get('company'):
+                st.markdown(f"**{exp.get('company')}**")
+                st.markdown(f"*{exp.get('position')} ({exp.get('duration')})*")
+                st.markdown(exp.get('description', ''))
+        st.markdown("---")
+    if st.session_state.skills:
+        st.markdown("## Skills")
+        st.markdown(", ".join(st.session_state.skills))
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+def memoized_app():
+    from components.preview import render_preview
+
+    render_preview("Professional")
+
+
+def rerun_latency(app, entries, reruns):
+    from benchmarks.sample_resumes import resume_record
+
+    record = resume_record(0, positions=entries)
+    record['education'] = record['education'] * entries
+    at = AppTest.from_function(app, default_timeout=60)
+    for key in ('personal_info', 'education', 'experience', 'skills'):
+        at.session_state[key] = record[key]
+    at.run()
+    # AppTest session_state access outside a script run logs a warning per call
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith('streamlit'):
+            logging.getLogger(name).setLevel(logging.ERROR)
+    samples = []
+    for index in range(reruns):
+        # Simulate a keystroke in one field: only the skills section changes
+        at.session_state['skills'] = record['skills'] + [f"Skill {index}"]
+        start = time.perf_counter()
+        at.run()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2], len(at.markdown)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entries', type=int, nargs='+', default=[5, 20, 80])
+    parser.add_argument('--reruns', type=int, default=15)
+    args = parser.parse_args()
+    print(f"{'entries':>7}  {'legacy ms':>9} {'elements':>8}  {'memoized ms':>11} {'elements':>8}")
+    for entries in args.entries:
+        legacy, legacy_elements = rerun_latency(legacy_app, entries, args.reruns)
+        memoized, memoized_elements = rerun_latency(memoized_app, entries, args.reruns)
+        print(f"{entries:7d}  {legacy * 1000:9.1f} {legacy_elements:8d}  "
+              f"{memoized * 1000:11.1f} {memoized_elements:8d}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark cohort scoring with the resume analysis engine.
+
+Usage:
+    python -m benchmarks.bench_resume_analysis [--count N] [--chunksize N]
+"""
+import argparse
+import time
+
+from benchmarks.sample_resumes import resume_lines
+from utils import resume_analysis
+from utils.process_pool import get_executor, shutdown_executor
+from utils.resume_cache import get_cache
+from utils.text_extraction import structure_lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=5000, help='synthetic resumes to score')
+    parser.add_argument('--chunksize', type=int, default=64, help='resumes per worker task')
+    args = parser.parse_args()
+
+    resumes = [structure_lines(resume_lines(seed, positions=4 + seed % 4)) for seed in range(args.count)]
+    print(f"cohort: {len(resumes)} resumes")
+    cache = get_cache('analysis')
+
+    cache.clear()
+    start = time.perf_counter()
+    resume_analysis.analyze_batch(resumes, args.chunksize, parallel=False)
+    serial = time.perf_counter() - start
+    print(f"serial:       {serial:7.2f}s  {len(resumes) / serial:9.1f} resumes/s")
+
+    get_executor()
+    resume_analysis.analyze_batch(resumes[:args.chunksize * 2], args.chunksize)  # warm up workers
+    cache.clear()
+    start = time.perf_counter()
+    results = resume_analysis.analyze_batch(resumes, args.chunksize)
+    pooled = time.perf_counter() - start
+    print(f"process pool: {pooled:7.2f}s  {len(resumes) / pooled:9.1f} resumes/s  ({serial / pooled:.1f}x)")
+
+    start = time.perf_counter()
+    resume_analysis.analyze_batch(resumes, args.chunksize)
+    cached = time.perf_counter() - start
+    print(f"cached:       {cached:7.2f}s  {len(resumes) / cached:9.1f} resumes/s")
+
+    mean = sum(result['score'] for result in results) / len(results)
+    print(f"mean score {mean:.1f}")
+    shutdown_executor()
+
+
+if __name__ == '__main__':
+    main()
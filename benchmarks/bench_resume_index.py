@@ -0,0 +1,72 @@
+"""
+Benchmark indexing throughput and query latency of the local resume index.
+
+Usage:
+    python -m benchmarks.bench_resume_index [--count N] [--queries N]
+"""
+import argparse
+import random
+import tempfile
+import time
+
+from benchmarks.load_test import percentile
+from benchmarks.sample_resumes import FIRMS, SCHOOLS, resume_lines
+from utils.resume_index import ResumeIndex
+
+TERMS = ['python', 'sql', 'pricing', 'margin', 'markets', 'mckinsey', 'bain', 'kearney',
+         'wharton', 'insead', 'negotiated', 'launched', 'operations', 'strategy']
+
+
+def make_queries(count, seed=0):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        words = rng.sample(TERMS, rng.randint(1, 3))
+        if rng.random() < 0.3:
+            words.append('+' + rng.choice(FIRMS).split()[0].lower())
+        if rng.random() < 0.2:
+            words.append('-' + rng.choice(SCHOOLS).split()[0].lower())
+        queries.append(' '.join(words))
+    return queries
+
+
+def report(label, index, queries):
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query, limit=20)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    print(f"{label:14s} p50 {percentile(latencies, 0.5):7.2f} ms  p95 {percentile(latencies, 0.95):7.2f} ms  "
+          f"p99 {percentile(latencies, 0.99):7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000, help='synthetic resumes to index')
+    parser.add_argument('--queries', type=int, default=500)
+    args = parser.parse_args()
+
+    texts = ['\n'.join(resume_lines(seed, positions=3 + seed % 4)) for seed in range(args.count)]
+    queries = make_queries(args.queries)
+    with tempfile.TemporaryDirectory() as directory:
+        index = ResumeIndex(directory)
+        start = time.perf_counter()
+        for seed, text in enumerate(texts):
+            index.add(text, email=f"candidate{seed}@example.com", name=f"Candidate {seed}")
+        index.flush()
+        elapsed = time.perf_counter() - start
+        print(f"indexed {len(texts)} resumes in {elapsed:.2f}s ({len(texts) / elapsed:.0f}/s), "
+              f"{index.stats()['segments']} segment(s)")
+        report('warm', index, queries)
+        index.close()
+
+        start = time.perf_counter()
+        index = ResumeIndex(directory)
+        print(f"reopened in {(time.perf_counter() - start) * 1000:.0f} ms")
+        report('reopened', index, queries)
+        index.close()
+
+
+if __name__ == '__main__':
+    main()
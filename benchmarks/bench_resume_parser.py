@@ -0,0 +1,34 @@
+"""
+Micro-benchmark for ResumeParser contact and position extraction.
+
+Usage:
+    python -m benchmarks.bench_resume_parser [--count N] [--repeat R]
+"""
+import argparse
+import time
+
+from benchmarks.sample_resumes import resume_lines
+from utils.resume_parser import ResumeParser
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=2000, help='distinct resume texts')
+    parser.add_argument('--repeat', type=int, default=5, help='timed passes over the corpus')
+    args = parser.parse_args()
+
+    texts = ['\n'.join(resume_lines(seed)) for seed in range(args.count)]
+    resume_parser = ResumeParser()
+    resume_parser.parse_many(texts[:100])
+
+    best = float('inf')
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        resume_parser.parse_many(texts)
+        best = min(best, time.perf_counter() - start)
+    print(f"{len(texts)} resumes in {best * 1000:.1f} ms (best of {args.repeat}): "
+          f"{len(texts) / best:,.0f} resumes/s, {best / len(texts) * 1e6:.1f} us/resume")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark local resume text extraction, serial versus the process pool.
+
+Usage:
+    python -m benchmarks.bench_text_extraction [--count N] [--corpus DIR]
+"""
+import argparse
+import os
+import time
+
+from benchmarks.sample_resumes import corpus
+from utils import text_extraction
+from utils.process_pool import get_executor, shutdown_executor
+from utils.resume_cache import get_cache
+from utils.resume_parser import process_resume
+
+
+def load_corpus(directory):
+    files = []
+    for name in sorted(os.listdir(directory)):
+        if name.lower().endswith(('.pdf', '.docx')):
+            with open(os.path.join(directory, name), 'rb') as resume_file:
+                files.append((name, resume_file.read()))
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=200, help='synthetic resumes to generate')
+    parser.add_argument('--corpus', help='directory of real PDF/DOCX resumes to use instead')
+    args = parser.parse_args()
+
+    files = load_corpus(args.corpus) if args.corpus else corpus(args.count)
+    total_mb = sum(len(content) for _, content in files) / (1024 * 1024)
+    print(f"corpus: {len(files)} files, {total_mb:.1f} MB")
+
+    start = time.perf_counter()
+    for name, content in files:
+        text_extraction.extract_text(content, name)
+    serial = time.perf_counter() - start
+    print(f"serial:       {serial:7.2f}s  {len(files) / serial:8.1f} files/s")
+
+    get_executor()
+    text_extraction.extract_batch(files[:os.cpu_count() or 1])  # warm up workers
+    start = time.perf_counter()
+    results = text_extraction.extract_batch(files)
+    pooled = time.perf_counter() - start
+    errors = sum(result['status'] != 'success' for result in results)
+    print(f"process pool: {pooled:7.2f}s  {len(files) / pooled:8.1f} files/s"
+          f"  ({serial / pooled:.1f}x, {errors} errors)")
+
+    name, content = files[0]
+    get_cache('parsed').clear()
+    for label in ('process_resume (cold)', 'process_resume (cached)'):
+        start = time.perf_counter()
+        process_resume('', content, name)
+        print(f"{label:24s} {(time.perf_counter() - start) * 1000:8.2f} ms")
+    shutdown_executor()
+
+
+if __name__ == '__main__':
+    main()
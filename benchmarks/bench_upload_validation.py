@@ -0,0 +1,86 @@
+"""
+Benchmark upload pre-validation against fully decoding large files.
+
+Builds a large multi-page PDF and a DOCX padded with a stored media blob,
+then times inspect_upload (magic bytes, trailer, page-tree scan, ZIP central
+directory) versus opening every page with PyPDF2 / python-docx.
+
+Usage:
+    python -m benchmarks.bench_upload_validation [--pages N] [--media-mb N] [--repeat N]
+"""
+import argparse
+import io
+import os
+import time
+import zipfile
+
+from benchmarks.sample_resumes import make_docx, resume_lines
+from utils.upload_validation import inspect_upload
+
+
+def make_large_pdf(pages):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=letter, pageCompression=0)
+    lines = resume_lines(0, positions=8)
+    for _ in range(pages):
+        for index, line in enumerate(lines * 2):
+            pdf.drawString(50, 750 - index * 10, line)
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def make_large_docx(media_mb):
+    buffer = io.BytesIO(make_docx(resume_lines(0, positions=8)))
+    with zipfile.ZipFile(buffer, 'a', compression=zipfile.ZIP_STORED) as archive:
+        archive.writestr('word/media/image1.png', os.urandom(media_mb * 1024 * 1024))
+    return buffer.getvalue()
+
+
+def decode_pdf(content):
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(io.BytesIO(content))
+    return sum(len(page.extract_text() or '') for page in reader.pages)
+
+
+def decode_docx(content):
+    import docx
+
+    return sum(len(paragraph.text) for paragraph in docx.Document(io.BytesIO(content)).paragraphs)
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, default=400, help='pages in the large PDF')
+    parser.add_argument('--media-mb', type=int, default=15, help='size of the DOCX media blob')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    samples = [
+        ('pdf', 'large.pdf', make_large_pdf(args.pages), decode_pdf),
+        ('docx', 'large.docx', make_large_docx(args.media_mb), decode_docx),
+    ]
+    for label, name, content, decode in samples:
+        info = inspect_upload(content, name, max_bytes=len(content), max_pages=0)
+        size_mb = len(content) / (1024 * 1024)
+        print(f"{label}: {size_mb:.1f} MB, {info.pages} pages")
+        checked = timed(lambda: inspect_upload(content, name, max_bytes=len(content), max_pages=0),
+                        args.repeat)
+        decoded = timed(lambda: decode(content), 1)
+        print(f"  pre-validation: {checked:9.2f} ms  ({size_mb / checked * 1000:8.1f} MB/s)")
+        print(f"  full decode:    {decoded:9.2f} ms  ({decoded / checked:.0f}x slower)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""
+End-to-end load test against the local mock downstream.
+
+Starts utils.mock_downstream with the requested latency/error rate, points
+the webhook at it and drives N concurrent virtual users through either
+send_to_webhook directly or the form submission path (upload pre-validation
+plus WebhookQueue.enqueue, then background delivery), reporting p50/p95/p99
+latency and throughput.
+
+Usage:
+    python -m benchmarks.load_test [--scenario webhook|form] [--users N] [--requests N]
+        [--latency S] [--jitter S] [--error-rate F] [--queue-workers N]
+"""
+import argparse
+import io
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.sample_resumes import make_pdf, resume_lines
+from utils import http_transport, webhook
+from utils.logging_config import configure_logging
+from utils.mock_downstream import MockDownstream
+from utils.resume_model import PersonalInfo
+from utils.upload_validation import check_upload
+from utils.webhook_queue import WebhookQueue
+
+PDF_TYPE = 'application/pdf'
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+
+def run_load(action: Callable[[int, int], bool], users: int, requests: int) -> Dict[str, Any]:
+    """
+    Run ``action(user, iteration)`` ``requests`` times from each of ``users`` threads.
+
+    Returns:
+        Report with request/error counts, elapsed seconds, throughput and
+        latency percentiles in milliseconds
+    """
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+    start_line = threading.Barrier(users + 1)
+
+    def virtual_user(user: int) -> None:
+        nonlocal errors
+        start_line.wait()
+        for iteration in range(requests):
+            started = time.perf_counter()
+            try:
+                ok = action(user, iteration)
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                errors += not ok
+
+    threads = [threading.Thread(target=virtual_user, args=(user,), daemon=True) for user in range(users)]
+    for thread in threads:
+        thread.start()
+    start_line.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        'requests': len(ordered),
+        'errors': errors,
+        'elapsed': elapsed,
+        'throughput': len(ordered) / elapsed if elapsed else 0.0,
+        'latency_ms': {
+            'mean': sum(ordered) / len(ordered) * 1000 if ordered else 0.0,
+            'p50': percentile(ordered, 0.50) * 1000,
+            'p95': percentile(ordered, 0.95) * 1000,
+            'p99': percentile(ordered, 0.99) * 1000,
+            'max': (ordered[-1] if ordered else 0.0) * 1000,
+        },
+    }
+
+
+def format_report(label: str, report: Dict[str, Any]) -> str:
+    latency = report['latency_ms']
+    return (f"{label:18s} {report['requests']:6d} req  {report['errors']:4d} err  "
+            f"{report['throughput']:8.1f} req/s  p50 {latency['p50']:8.1f} ms  "
+            f"p95 {latency['p95']:8.1f} ms  p99 {latency['p99']:8.1f} ms")
+
+
+def _form_data(user: int, iteration: int) -> PersonalInfo:
+    return PersonalInfo(first_name=f"User{user}", last_name=f"Load{iteration}",
+                        email=f"user{user}.{iteration}@example.com")
+
+
+def webhook_scenario(content: bytes, users: int, requests: int) -> Dict[str, Any]:
+    def action(user: int, iteration: int) -> bool:
+        file_data = ('resume.pdf', io.BytesIO(content), PDF_TYPE)
+        return webhook.send_to_webhook(_form_data(user, iteration), file_data)
+
+    return run_load(action, users, requests)
+
+
+def form_scenario(content: bytes, users: int, requests: int, queue_workers: int,
+                  drain_timeout: float) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as directory:
+        queue = WebhookQueue(webhook.send_to_webhook, db_path=f"{directory}/queue.db",
+                             spool_dir=f"{directory}/spool", workers=queue_workers,
+                             base_delay=0.1, max_delay=1.0, poll_interval=0.05)
+        queue.start()
+
+        def action(user: int, iteration: int) -> bool:
+            upload = io.BytesIO(content)
+            if check_upload(upload, 'resume.pdf'):
+                return False
+            queue.enqueue(_form_data(user, iteration), ('resume.pdf', upload, PDF_TYPE))
+            return True
+
+        report = run_load(action, users, requests)
+        drain_started = time.perf_counter()
+        while queue.depth() and time.perf_counter() - drain_started < drain_timeout:
+            time.sleep(0.05)
+        report['drain_elapsed'] = time.perf_counter() - drain_started
+        report['queue'] = queue.stats()
+        queue.stop()
+        queue.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scenario', choices=['webhook', 'form'], default='webhook')
+    parser.add_argument('--users', type=int, default=16, help='concurrent virtual users')
+    parser.add_argument('--requests', type=int, default=25, help='requests per virtual user')
+    parser.add_argument('--latency', type=float, default=0.2, help='mock downstream latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.1, help='extra random downstream latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of downstream failures')
+    parser.add_argument('--queue-workers', type=int, default=8, help='delivery workers (form scenario)')
+    parser.add_argument('--drain-timeout', type=float, default=120.0)
+    args = parser.parse_args()
+
+    # Simulated downstream failures would otherwise flood the report with error logs
+    configure_logging(level='CRITICAL', log_file='', log_format='text', force=True)
+    content = make_pdf(resume_lines(0))
+    with MockDownstream(args.latency, args.jitter, args.error_rate, seed=0) as downstream:
+        webhook.WEBHOOK_URL = downstream.url
+        print(f"mock downstream {downstream.url}: latency {args.latency}s + {args.jitter}s jitter, "
+              f"error rate {args.error_rate:.0%}; {args.users} users x {args.requests} requests")
+        if args.scenario == 'webhook':
+            print(format_report('send_to_webhook', webhook_scenario(content, args.users, args.requests)))
+        else:
+            report = form_scenario(content, args.users, args.requests, args.queue_workers,
+                                   args.drain_timeout)
+            print(format_report('form submit (ack)', report))
+            queue = report['queue']
+            latency = queue['latency']
+            if latency['count']:
+                print(f"{'queue delivery':18s} {latency['count']:6d} delivered  "
+                      f"{queue['counts']['dead']:4d} dead  p50 {latency['p50'] * 1000:8.1f} ms  "
+                      f"p95 {latency['p95'] * 1000:8.1f} ms  max {latency['max'] * 1000:8.1f} ms  "
+                      f"(drained {report['drain_elapsed']:.1f}s after the last submit)")
+        print(f"downstream: {downstream.stats()}")
+    http_transport.close_session()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Synthetic resume corpus used by the benchmarks.
+"""
+import io
+import random
+from typing import List, Tuple
+
+FIRMS = ['McKinsey & Company', 'Boston Consulting Group', 'Bain & Company', 'Deloitte',
+         'Accenture', 'Oliver Wyman', 'Kearney', 'Roland Berger', 'PwC Strategy&']
+ROLES = ['Engagement Manager', 'Senior Consultant', 'Associate', 'Consultant', 'Principal']
+VERBS = ['Led', 'Delivered', 'Designed', 'Reduced', 'Grew', 'Built', 'Negotiated', 'Launched']
+SCHOOLS = ['Harvard Business School', 'Wharton School', 'INSEAD', 'Stanford GSB', 'LBS']
+
+
+def resume_lines(seed: int, positions: int = 4) -> List[str]:
+    """Return the text lines of one synthetic consultant resume."""
+    rng = random.Random(seed)
+    lines = [
+        f"Candidate {seed} Example",
+        f"Chicago, IL | candidate{seed}@example.com | (312) 555-{seed % 10000:04d}",
+        f"linkedin.com/in/candidate{seed}",
+        "",
+        "PROFESSIONAL SUMMARY",
+        "Management consultant with experience in growth strategy and operations.",
+        "",
+        "PROFESSIONAL EXPERIENCE",
+    ]
+    year = 2024
+    for _ in range(positions):
+        start = year - rng.randint(1, 3)
+        lines.append(f"{rng.choice(ROLES)} - {rng.choice(FIRMS)} (Jan {start} - Dec {year})")
+        for _ in range(4):
+            lines.append(f"• {rng.choice(VERBS)} a {rng.randint(5, 40)}-person program that "
+                         f"improved margin by {rng.randint(2, 30)}% across {rng.randint(2, 12)} markets")
+        lines.append("")
+        year = start
+    lines += ["EDUCATION", f"{rng.choice(SCHOOLS)} - MBA, {year - 2}", "",
+              "SKILLS", "Financial modeling, SQL, Python, stakeholder management"]
+    return lines
+
+
+def make_pdf(lines: List[str]) -> bytes:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=letter)
+    y = 750
+    for line in lines:
+        if y < 60:
+            pdf.showPage()
+            y = 750
+        pdf.drawString(50, y, line)
+        y -= 14
+    pdf.save()
+    return buffer.getvalue()
+
+
+def make_docx(lines: List[str]) -> bytes:
+    import docx
+
+    document = docx.Document()
+    for line in lines:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def corpus(count: int, positions: int = 4) -> List[Tuple[str, bytes]]:
+    """Build ``count`` resumes, alternating between PDF and DOCX."""
+    files = []
+    for seed in range(count):
+        lines = resume_lines(seed, positions)
+        if seed % 2:
+            files.append((f"resume_{seed}.docx", make_docx(lines)))
+        else:
+            files.append((f"resume_{seed}.pdf", make_pdf(lines)))
+    return files
+
+
+def resume_record(seed: int, positions: int = 4) -> dict:
+    """Return one synthetic resume in the generate_pdf/preview dict layout."""
+    rng = random.Random(seed)
+    return {
+        'personal_info': {'name': f"Candidate {seed}", 'email': f"candidate{seed}@example.com",
+                          'phone': f"(312) 555-{seed % 10000:04d}"},
+        'education': [{'institution': rng.choice(SCHOOLS), 'degree': 'MBA',
+                       'graduation_year': str(2010 + seed % 10)}],
+        'experience': [{'company': rng.choice(FIRMS), 'position': rng.choice(ROLES),
+                        'duration': f"{2020 - index} - {2021 - index}",
+                        'description': f"{rng.choice(VERBS)} a {rng.randint(5, 40)}-person program."}
+                       for index in range(positions)],
+        'skills': ['Financial modeling', 'SQL', 'Python', 'Stakeholder management'],
+        'template': ['Professional', 'Modern', 'Classic'][seed % 3],
+    }
@@ -1,9 +1,19 @@
 """
 Resume Builder Components Package
 Contains UI components and form handlers for the resume builder application.
+
+Submodules are imported on first attribute access so importing the package
+does not pull in every component (and its dependencies) up front.
 """
-from .forms import render_personal_info, render_education, render_experience, render_skills
-from .preview import render_preview
+import importlib
+
+_EXPORTS = {
+    'render_personal_info': 'forms',
+    'render_education': 'forms',
+    'render_experience': 'forms',
+    'render_skills': 'forms',
+    'render_preview': 'preview',
+}
 
 __all__ = [
     'render_personal_info',
@@ -12,3 +22,11 @@ __all__ = [
     'render_skills',
     'render_preview'
 ]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
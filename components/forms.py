@@ -1,22 +1,22 @@
 import streamlit as st
-import os
-import tempfile
 import logging
-import time
 from datetime import datetime, timezone
-import requests
-import json
+
+from utils.resume_model import PersonalInfo
+from utils.streaming_upload import file_size as upload_size
+from utils.upload_validation import check_upload
 
 logger = logging.getLogger(__name__)
 
-def send_to_webhook(form_data, file_content=None):
+def send_to_webhook(form_data, file_data=None):
     """
-    This function is deprecated. Use the implementation in main.py instead.
+    This function is deprecated. Use utils.webhook.send_to_webhook instead.
     This wrapper is kept temporarily for backward compatibility.
     """
-    logger.warning("Using deprecated webhook function in forms.py. Please update to use main.py implementation.")
-    from main import send_to_webhook as main_webhook
-    return main_webhook(form_data, file_content)
+    logger.warning("Using deprecated webhook function in forms.py. Please update to use utils.webhook.")
+    from utils.webhook import send_to_webhook as deliver_to_webhook
+
+    return deliver_to_webhook(form_data, file_data)
 
 def render_personal_info():
     """Render the personal information form with file upload."""
@@ -54,9 +54,10 @@ def render_personal_info():
 
         if uploaded_file is not None:
             st.info(f"File selected: {uploaded_file.name}")
-            file_size = len(uploaded_file.getvalue()) / (1024 * 1024)  # Convert to MB
-            if file_size > 10:  # 10MB limit
-                st.warning(f"File size ({file_size:.1f}MB) exceeds 10MB limit")
+            file_size = upload_size(uploaded_file) / (1024 * 1024)  # Convert to MB
+            upload_error = check_upload(uploaded_file, uploaded_file.name)
+            if upload_error:
+                st.warning(f"This file cannot be submitted: {upload_error}")
             else:
                 st.success(f"File size: {file_size:.1f}MB (Ready for processing)")
 
@@ -70,19 +71,25 @@ def render_personal_info():
                 st.error("Please upload your resume")
                 return
 
+            upload_error = check_upload(uploaded_file, uploaded_file.name)
+            if upload_error:
+                st.error(f"Your resume could not be accepted: {upload_error}")
+                return
+
+            personal_info = PersonalInfo(first_name=first_name, last_name=last_name, email=email)
+            st.session_state.personal_info = personal_info
+
             form_data = {
-                'first_name': first_name,
-                'last_name': last_name,
-                'email': email,
+                **personal_info.to_dict(),
                 'professional_level': 'Individual Contributor',  # Set default value
                 'timestamp': current_time
             }
 
-            file_content = None
+            file_data = None
             if uploaded_file:
-                file_content = uploaded_file.getvalue()
+                file_data = (uploaded_file.name, uploaded_file, uploaded_file.type)
 
-            if send_to_webhook(form_data, file_content):
+            if send_to_webhook(form_data, file_data):
                 st.success("✅ Information submitted successfully!")
                 st.balloons()
             else:
@@ -1,7 +1,19 @@
+import json
+from functools import lru_cache
+
 import streamlit as st
 
-def render_preview(template):
-    st.markdown("""
+from utils.resume_model import (
+    Education,
+    Experience,
+    PersonalInfo,
+    as_education,
+    as_experience,
+    as_personal_info,
+    as_skills,
+)
+
+PREVIEW_CSS = """
         <style>
         .preview-container {
             border: 1px solid #ddd;
@@ -10,41 +22,92 @@ def render_preview(template):
             background-color: white;
         }
         </style>
-    """, unsafe_allow_html=True)
+    """
+
+
+def _content_key(rows):
+    """Compact JSON of a section's rows; identical content maps to the same cache entry."""
+    return json.dumps(rows, separators=(',', ':'), ensure_ascii=False)
+
+
+# Each section's markdown is built once per distinct content and reused across reruns.
+@lru_cache(maxsize=256)
+def _personal_info_markdown(content):
+    personal_info = PersonalInfo.from_row(json.loads(content))
+    return "\n\n".join([
+        f"# {personal_info.display_name}",
+        f"📧 {personal_info.email}",
+        f"📱 {personal_info.phone}",
+        "---",
+    ])
+
+
+@lru_cache(maxsize=256)
+def _education_markdown(content):
+    lines = ["## Education"]
+    for edu in map(Education.from_row, json.loads(content)):
+        if edu.institution:
+            lines.append(f"**{edu.institution}**")
+            lines.append(f"{edu.degree} - {edu.graduation_year}")
+    lines.append("---")
+    return "\n\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def _experience_markdown(content):
+    lines = ["## Professional Experience"]
+    for exp in map(Experience.from_row, json.loads(content)):
+        if exp.company:
+            lines.append(f"**{exp.company}**")
+            lines.append(f"*{exp.position} ({exp.duration})*")
+            lines.append(exp.description)
+    lines.append("---")
+    return "\n\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def _skills_markdown(content):
+    return "## Skills\n\n" + ", ".join(json.loads(content))
+
+
+def preview_sections(personal_info, education, experience, skills):
+    """
+    Return (section, markdown) pairs for the non-empty preview sections.
+
+    Accepts resume model objects or the legacy dicts/lists.
+    """
+    personal_info = as_personal_info(personal_info)
+    education = as_education(education)
+    experience = as_experience(experience)
+    skills = as_skills(skills)
+
+    sections = []
+    if personal_info:
+        sections.append(('personal_info', _personal_info_markdown(_content_key(personal_info.to_row()))))
+    if any(edu.institution for edu in education):
+        rows = [edu.to_row() for edu in education]
+        sections.append(('education', _education_markdown(_content_key(rows))))
+    if any(exp.company for exp in experience):
+        rows = [exp.to_row() for exp in experience]
+        sections.append(('experience', _experience_markdown(_content_key(rows))))
+    if skills:
+        sections.append(('skills', _skills_markdown(_content_key(skills.to_row()))))
+    return sections
+
+
+def render_preview(template):
+    st.markdown(PREVIEW_CSS, unsafe_allow_html=True)
 
     with st.container():
         st.markdown('<div class="preview-container">', unsafe_allow_html=True)
-        
-        # Personal Information
-        if st.session_state.personal_info:
-            st.markdown(f"# {st.session_state.personal_info.get('name', '')}")
-            st.markdown(f"📧 {st.session_state.personal_info.get('email', '')}")
-            st.markdown(f"📱 {st.session_state.personal_info.get('phone', '')}")
-            st.markdown("---")
-
-        # Education Section
-        if any(edu.get('institution') for edu in st.session_state.education):
-            st.markdown("## Education")
-            for edu in st.session_state.education:
-                if edu.get('institution'):
-                    st.markdown(f"**{edu.get('institution')}**")
-                    st.markdown(f"{edu.get('degree')} - {edu.get('graduation_year')}")
-            st.markdown("---")
-
-        # Experience Section
-        if any(exp.get('company') for exp in st.session_state.experience):
-            st.markdown("## Professional Experience")
-            for exp in st.session_state.experience:
-                if exp.get('company'):
-                    st.markdown(f"**{exp.get('company')}**")
-                    st.markdown(f"*{exp.get('position')} ({exp.get('duration')})*")
-                    st.markdown(exp.get('description', ''))
-            st.markdown("---")
-
-        # Skills Section
-        if st.session_state.skills:
-            st.markdown("## Skills")
-            st.markdown(", ".join(st.session_state.skills))
 
-        st.markdown('</div>', unsafe_allow_html=True)
+        # One markdown element per section instead of one per line
+        for _, markdown in preview_sections(
+            st.session_state.personal_info,
+            st.session_state.education,
+            st.session_state.experience,
+            st.session_state.skills,
+        ):
+            st.markdown(markdown)
 
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -1,67 +1,96 @@
 import streamlit as st
 import os
-import sys
 import logging
 from typing import Optional
-import json
-import requests
-from datetime import datetime, timezone
-
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('app.log')
-    ]
-)
-logger = logging.getLogger(__name__)
 
-def send_to_webhook(form_data: dict, file_data: Optional[tuple] = None) -> bool:
-    """Send form data to webhook with improved logging and validation."""
-    try:
-        webhook_url = "https://hooks.zapier.com/hooks/catch/274092/2km31m2/"
-        logger.info(f"[{datetime.now(timezone.utc).isoformat()}] Initiating webhook submission...")
-
-        if not webhook_url:
-            logger.error("Webhook URL not configured")
-            return False
-
-        form_data['timestamp'] = datetime.now(timezone.utc).isoformat()
-
-        payload = {
-            "first_name": form_data.get("first_name", "").strip(),
-            "last_name": form_data.get("last_name", "").strip(),
-            "email": form_data.get("email", "").strip(),
-            "timestamp": form_data["timestamp"]
-        }
-
-        files = None
-        if file_data:
-            file_name, file_content, file_type = file_data
-            files = {
-                'resume': (file_name, file_content, file_type)
-            }
-            logger.debug(f"File details - Name: {file_name}, Type: {file_type}, Size: {len(file_content)} bytes")
-
-        response = requests.post(
-            webhook_url,
-            data=payload,
-            files=files,
-            timeout=30
-        )
+from utils import metrics
+from utils.config import JOB_STATUS_CACHE_SECONDS, LOCAL_ANALYSIS
+from utils.idempotency import idempotency_key
+from utils.job_status import ANALYZED, FAILED, analyze_in_background, get_job_store, is_settled
+from utils.logging_config import configure_logging, correlation_scope
+from utils.resume_model import PersonalInfo
+from utils.upload_validation import check_upload
+from utils.webhook_queue import WebhookQueue
+
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles", "custom.css")
+
+# Progress bar position for each job state
+JOB_PROGRESS = {"queued": 10, "uploading": 40, "delivered": 75, "analyzed": 100, "failed": 100}
 
-        if response.status_code == 200:
-            logger.info("Webhook submission successful")
-            return True
+# Configure logging (level, format and file via LOG_* environment variables)
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# Prometheus endpoint / periodic dump when METRICS_ENABLED is set
+metrics.start_exporters()
+
+@st.cache_resource
+def get_webhook_queue() -> WebhookQueue:
+    """Create the process-wide delivery queue and start its workers once per server."""
+    # Imported here so requests is only loaded once a submission needs delivering
+    from utils.webhook import send_to_webhook
+
+    queue = WebhookQueue(send_to_webhook, on_status=get_job_store().transition)
+    queue.start()
+    return queue
+
+@st.cache_resource
+def load_css(path: str = CSS_PATH) -> str:
+    """Read the stylesheet once and return it wrapped in a style tag."""
+    with open(path, encoding="utf-8") as css_file:
+        return f"<style>\n{css_file.read()}\n</style>"
+
+@st.cache_data(ttl=JOB_STATUS_CACHE_SECONDS, show_spinner=False)
+def load_job(job_id: str) -> Optional[dict]:
+    """Read a job's status; cached briefly so sessions refreshing together share one read."""
+    return get_job_store().get(job_id)
+
+def render_job_status(job_id: str):
+    """Show the submission's progress, with a refresh button until the job settles."""
+    job = load_job(job_id)
+    if job is None:
+        return
+
+    st.markdown("### Submission Status")
+    progress = 100 if is_settled(job) else JOB_PROGRESS.get(job["state"], 0)
+    st.progress(progress, text=f"Status: {job['state'].capitalize()}")
+    if job["state"] == FAILED:
+        st.error("We could not deliver your resume. Please submit it again.")
+    elif job["detail"]:
+        st.caption(job["detail"])
+
+    analysis = job["analysis"]
+    if analysis and job["state"] == ANALYZED:
+        if "error" in analysis:
+            st.caption("A preliminary score is not available for this file.")
         else:
-            logger.error(f"Webhook failed. Status: {response.status_code}, Response: {response.text}")
-            return False
+            st.metric("Preliminary score", f"{analysis['score']:.0f} / 100")
+            for item in analysis["feedback"][:3]:
+                st.markdown(f"- {item}")
 
-    except Exception as e:
-        logger.error(f"Error sending data to webhook: {str(e)}")
-        return False
+    # Nothing polls on a timer: a click reruns the script, which reads the cached status
+    if not is_settled(job):
+        st.button("Refresh status", key="refresh_job_status")
+
+def validate_submission(first_name: str, last_name: str, email: str, uploaded_file) -> Optional[str]:
+    """Return the error message to show for an incomplete submission, or None."""
+    if not all([first_name, last_name, email]):
+        return "Please fill in all required fields"
+
+    if not uploaded_file:
+        return "Please upload your resume"
+
+    if not all([st.session_state.get("consultant_check", False),
+              st.session_state.get("seeking_check", False),
+              st.session_state.get("feedback_check", False)]):
+        return "Please confirm all eligibility requirements"
+
+    # Reject corrupt, mislabelled or oversized files before anything is queued
+    upload_error = check_upload(uploaded_file, uploaded_file.name)
+    if upload_error:
+        return f"Your resume could not be accepted: {upload_error}"
+
+    return None
 
 def main():
     """Main application entry point"""
@@ -73,33 +102,8 @@ def main():
             initial_sidebar_state="collapsed"
         )
 
-        # CSS Styles
-        st.markdown("""
-        <style>
-        /* Main container for requirements section */
-        .requirements-container {
-            margin-top: 0.5rem;
-            padding: 0.5rem;
-        }
-
-        /* Text container */
-        .requirement-text {
-            flex: 1;
-            margin: 0;
-            line-height: 1.4;
-            padding: 0.25rem 0;
-            display: flex;
-            align-items: center;
-        }
-
-        /* Checkbox container adjustment */
-        .stCheckbox {
-            margin: 0 !important;
-            padding: 0 !important;
-            transform: translateY(-2px) !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        # CSS Styles (read once per server process)
+        st.markdown(load_css(), unsafe_allow_html=True)
 
         # Header
         st.title("ResumeRocket5 Prototype")
@@ -182,34 +186,42 @@ def main():
                     submit_button = st.form_submit_button("Upload Document")
 
                     if submit_button:
-                        if not all([first_name, last_name, email]):
-                            st.error("Please fill in all required fields")
-                            return
-
-                        if not uploaded_file:
-                            st.error("Please upload your resume")
-                            return
-
-                        if not all([st.session_state.get("consultant_check", False),
-                                  st.session_state.get("seeking_check", False),
-                                  st.session_state.get("feedback_check", False)]):
-                            st.error("Please confirm all eligibility requirements")
+                        with metrics.stage_timer('validation'):
+                            error = validate_submission(first_name, last_name, email, uploaded_file)
+                        if error:
+                            metrics.SUBMISSIONS.inc('invalid')
+                            st.error(error)
                             return
 
-                        form_data = {
-                            'first_name': first_name,
-                            'last_name': last_name,
-                            'email': email,
-                        }
-
-                        if send_to_webhook(form_data, (uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type)):
-                            st.success("""
-                                Message received! You will receive analysis by email shortly. 
-                                If it does not arrive within 15 minutes, please check your spam folder.
-                            """)
-                            st.balloons()
-                        else:
-                            st.error("There was an error submitting your application. Please try again.")
+                        form_data = PersonalInfo(first_name=first_name, last_name=last_name, email=email)
+                        # Same submission, same job: a double click shows the existing job
+                        job_id = idempotency_key(email, uploaded_file)[:16]
+
+                        with correlation_scope():
+                            try:
+                                started = get_job_store().create(job_id, email)
+                                get_webhook_queue().enqueue(
+                                    form_data,
+                                    (uploaded_file.name, uploaded_file, uploaded_file.type),
+                                    job_id=job_id
+                                )
+                                if LOCAL_ANALYSIS and started:
+                                    analyze_in_background(job_id, uploaded_file, uploaded_file.name)
+                            except Exception as e:
+                                metrics.SUBMISSIONS.inc('failure')
+                                logger.error("Error queueing submission: %s", e)
+                                st.error("There was an error submitting your application. Please try again.")
+                            else:
+                                metrics.SUBMISSIONS.inc('success')
+                                st.session_state.job_id = job_id
+                                st.success("""
+                                    Message received! You will receive analysis by email shortly. 
+                                    If it does not arrive within 15 minutes, please check your spam folder.
+                                """)
+                                st.balloons()
+
+                if st.session_state.get("job_id"):
+                    render_job_status(st.session_state.job_id)
 
         # Footer
         st.markdown("""
@@ -221,7 +233,7 @@ def main():
         """, unsafe_allow_html=True)
 
     except Exception as e:
-        logger.error(f"Application error: {str(e)}")
+        logger.exception("Application error: %s", e)
         st.error("An unexpected error occurred. Please try again.")
 
 if __name__ == "__main__":
@@ -229,5 +241,5 @@ if __name__ == "__main__":
         logger.debug("Starting main application...")
         main()
     except Exception as e:
-        logger.error(f"Application failed to start: {str(e)}")
+        logger.error("Application failed to start: %s", e)
         st.error("Application failed to start. Please try again.")
\ No newline at end of file
@@ -0,0 +1,92 @@
+import unittest
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils import http_transport
+from utils.async_webhook import AsyncWebhookClient, TokenBucket, deliver_all
+from utils.resume_model import PersonalInfo
+
+
+class FakeReceiver(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.peak = max(server.peak, server.in_flight)
+            server.hits += 1
+            throttle = server.throttle_first > 0
+            server.throttle_first -= 1
+        time.sleep(0.01)
+        with server.lock:
+            server.in_flight -= 1
+        self.send_response(429 if throttle else 200)
+        if throttle:
+            self.send_header('Retry-After', '0')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@unittest.skipIf(http_transport.httpx is None, 'httpx is not installed')
+class TestAsyncWebhook(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), FakeReceiver)
+        self.server.lock = threading.Lock()
+        self.server.in_flight = self.server.peak = self.server.hits = 0
+        self.server.throttle_first = 0
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hook"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _submissions(self, count):
+        return [({'first_name': 'A', 'last_name': 'B', 'email': f'{i}@example.com'},
+                 (f'{i}.pdf', b'%PDF-1.4 test', 'application/pdf')) for i in range(count)]
+
+    def test_concurrency_limit(self):
+        results = deliver_all(self._submissions(40), url=self.url, concurrency=4, rate=1000)
+        self.assertEqual(results, [True] * 40)
+        self.assertLessEqual(self.server.peak, 4)
+
+    def test_personal_info_form_data(self):
+        form_data = PersonalInfo(first_name='A', last_name='B', email='a@example.com')
+        results = deliver_all([(form_data, ('a.pdf', b'%PDF-1.4 test', 'application/pdf'))], url=self.url)
+        self.assertEqual(results, [True])
+        self.assertEqual(self.server.hits, 1)
+
+    def test_throttled_requests_are_retried_with_backpressure(self):
+        self.server.throttle_first = 5
+
+        async def run():
+            async with AsyncWebhookClient(url=self.url, concurrency=8, rate=1000, base_delay=0.01) as client:
+                results = await client.send_many(self._submissions(10))
+                return results, client
+
+        results, client = asyncio.run(run())
+        self.assertEqual(results, [True] * 10)
+        self.assertEqual(client.counters['throttled'], 5)
+        self.assertEqual(self.server.hits, 15)
+        self.assertLess(client._buckets[f"127.0.0.1:{self.server.server_port}"].rate, 1000)
+
+    def test_token_bucket_limits_rate(self):
+        async def run():
+            bucket = TokenBucket(rate=50, capacity=1)
+            start = time.monotonic()
+            for _ in range(11):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        self.assertGreaterEqual(asyncio.run(run()), 0.18)
+
+
+if __name__ == '__main__':
+    unittest.main()
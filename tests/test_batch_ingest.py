@@ -0,0 +1,101 @@
+import unittest
+import csv
+import os
+import tempfile
+from unittest.mock import patch
+
+from benchmarks.sample_resumes import make_docx, make_pdf, resume_lines
+from utils import config, resume_cache
+from utils.batch_ingest import BatchIngestor, load_manifest, scan_directory
+from utils.resume_index import ResumeIndex
+from utils.process_pool import shutdown_executor
+
+
+class TestBatchIngest(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_executor()
+
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.data_dir.cleanup)
+        # Keep result caches out of the developer's data directory
+        for patcher in (patch.object(config, 'DATA_DIR', self.data_dir.name),
+                        patch.object(resume_cache, '_caches', {})):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        self._write('a.pdf', make_pdf(resume_lines(1)))
+        self._write('b.docx', make_docx(['Jane Roe', 'jane@roe.io', '', 'EXPERIENCE', 'Consultant, Bain 2020 - 2022']))
+        self._write('notes.txt', b'not a resume')
+        self.delivered = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name, content):
+        with open(os.path.join(self.dir, name), 'wb') as output:
+            output.write(content)
+
+    def _deliver(self, form_data, file_data):
+        self.delivered.append((form_data['email'], file_data[0]))
+        return True
+
+    def test_manifest_validates_and_dedups(self):
+        manifest = os.path.join(self.dir, 'cohort.csv')
+        with open(manifest, 'w', newline='') as output:
+            writer = csv.writer(output)
+            writer.writerow(['first_name', 'last_name', 'email', 'file'])
+            writer.writerow(['Ann', 'Lee', 'ann@example.com', 'a.pdf'])
+            writer.writerow(['Ann', 'Lee', 'ANN@example.com', 'a.pdf'])
+            writer.writerow(['Bo', 'Kim', 'not-an-email', 'b.docx'])
+            writer.writerow(['Cy', 'Day', 'cy@example.com', 'missing.pdf'])
+            writer.writerow(['Di', 'Ng', 'di@example.com', 'notes.txt'])
+
+        report = BatchIngestor(self._deliver, workers=4).run(load_manifest(manifest))
+        self.assertEqual(report['counts'], {'ok': 1, 'duplicate': 1, 'rejected': 3})
+        self.assertEqual(self.delivered, [('ann@example.com', 'a.pdf')])
+
+    def test_failed_delivery_does_not_mark_row_as_duplicate(self):
+        manifest = os.path.join(self.dir, 'cohort.csv')
+        with open(manifest, 'w', newline='') as output:
+            writer = csv.writer(output)
+            writer.writerow(['first_name', 'last_name', 'email', 'file'])
+            writer.writerow(['Ann', 'Lee', 'ann@example.com', 'a.pdf'])
+            writer.writerow(['Ann', 'Lee', 'ann@example.com', 'a.pdf'])
+        outcomes = [False, True]
+
+        def deliver(form_data, file_data):
+            self.delivered.append((form_data['email'], file_data[0]))
+            return outcomes.pop(0)
+
+        report = BatchIngestor(deliver, workers=1).run(load_manifest(manifest))
+        self.assertEqual([r['status'] for r in report['results']], ['failed', 'ok'])
+        self.assertEqual(len(self.delivered), 2)
+
+    def test_accepted_resumes_are_indexed(self):
+        with tempfile.TemporaryDirectory() as index_dir:
+            index = ResumeIndex(index_dir)
+            try:
+                BatchIngestor(None, workers=2, index=index).run(scan_directory(self.dir))
+                results = index.search('bain')
+                self.assertEqual([(r['email'], r['file_name']) for r in results], [('jane@roe.io', 'b.docx')])
+                self.assertEqual(results[0]['name'], 'Jane Roe')
+            finally:
+                index.close()
+
+    def test_directory_fills_contact_details_from_resume(self):
+        items = scan_directory(self.dir)
+        self.assertEqual([os.path.basename(item.file_path) for item in items], ['a.pdf', 'b.docx'])
+
+        report = BatchIngestor(self._deliver, workers=2).run(items)
+        statuses = {os.path.basename(r['file']): r['status'] for r in report['results']}
+        self.assertEqual(statuses['b.docx'], 'ok')
+        self.assertIn(('jane@roe.io', 'b.docx'), self.delivered)
+        # The synthetic PDF's first line is not a person's name
+        self.assertEqual(statuses['a.pdf'], 'rejected')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils import http_transport
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.server.client_ports.add(self.client_address[1])
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpTransport(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        self.server.client_ports = set()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hook"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        http_transport.close_session()
+
+    def tearDown(self):
+        http_transport.close_session()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_session_is_shared(self):
+        self.assertIs(http_transport.get_session(), http_transport.get_session())
+
+    def test_sequential_posts_reuse_connection(self):
+        for _ in range(5):
+            response = http_transport.post(self.url, data={'email': 'a@example.com'})
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.server.client_ports), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import io
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from utils import http_transport, idempotency, webhook
+from utils.idempotency import RecentKeys, idempotency_key
+from utils.webhook_queue import WebhookQueue
+
+
+class HeaderCaptureHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.server.keys.append(self.headers.get(idempotency.HEADER))
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestIdempotencyKey(unittest.TestCase):
+    def test_key_depends_on_email_and_content(self):
+        upload = io.BytesIO(b'%PDF-1.4 resume')
+        upload.seek(3)
+        key = idempotency_key('Ann@Example.com ', upload)
+        self.assertEqual(upload.tell(), 3)
+        self.assertEqual(key, idempotency_key('ann@example.com', b'%PDF-1.4 resume'))
+        self.assertNotEqual(key, idempotency_key('bob@example.com', b'%PDF-1.4 resume'))
+        self.assertNotEqual(key, idempotency_key('ann@example.com', b'%PDF-1.4 other'))
+
+    def test_recent_keys_expire_and_are_bounded(self):
+        recent = RecentKeys(ttl=60, max_items=2)
+        self.assertTrue(recent.claim('a'))
+        self.assertFalse(recent.claim('a'))
+        recent.release('a')
+        self.assertTrue(recent.claim('a'))
+        recent.claim('b')
+        recent.claim('c')
+        self.assertEqual(len(recent), 2)
+        self.assertNotIn('a', recent)
+
+        with patch('utils.idempotency.time.monotonic', return_value=10 ** 9):
+            self.assertEqual(len(recent), 0)
+
+    def test_only_delivered_keys_are_sent(self):
+        recent = RecentKeys(ttl=60, max_items=10)
+        recent.claim('a')
+        self.assertFalse(recent.is_sent('a'))
+        recent.mark_sent('a')
+        self.assertTrue(recent.is_sent('a'))
+        self.assertFalse(recent.claim('a'))
+
+
+class TestIdempotentDelivery(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), HeaderCaptureHandler)
+        self.server.keys = []
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{self.server.server_port}/hook"
+        for patcher in (patch.object(webhook, 'WEBHOOK_URL', url), patch.object(idempotency, '_recent', None)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        http_transport.close_session()
+        self.file_data = ('cv.pdf', b'%PDF-1.4 resume', 'application/pdf')
+
+    def tearDown(self):
+        http_transport.close_session()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_duplicate_webhook_submission_is_skipped(self):
+        form_data = {'email': 'ann@example.com'}
+        self.assertTrue(webhook.send_to_webhook(dict(form_data), self.file_data))
+        self.assertTrue(webhook.send_to_webhook(dict(form_data), self.file_data))
+        self.assertEqual(self.server.keys, [idempotency_key('ann@example.com', self.file_data[1])])
+
+    def test_in_flight_duplicate_is_not_reported_delivered(self):
+        key = idempotency_key('ann@example.com', self.file_data[1])
+        idempotency.recent_keys().claim(key)
+        self.assertFalse(webhook.send_to_webhook({'email': 'ann@example.com'}, self.file_data))
+        self.assertEqual(self.server.keys, [])
+
+        # The first attempt failed: the retry is sent
+        idempotency.recent_keys().release(key)
+        self.assertTrue(webhook.send_to_webhook({'email': 'ann@example.com'}, self.file_data))
+        self.assertEqual(self.server.keys, [key])
+
+    def test_failed_submission_can_be_retried(self):
+        self.server.statuses = [500]
+        self.assertFalse(webhook.send_to_webhook({'email': 'ann@example.com'}, self.file_data))
+        self.assertTrue(webhook.send_to_webhook({'email': 'ann@example.com'}, self.file_data))
+        self.assertEqual(len(self.server.keys), 2)
+
+    def test_queue_stores_duplicates_once(self):
+        with tempfile.TemporaryDirectory() as directory:
+            queue = WebhookQueue(webhook.send_to_webhook, db_path=f"{directory}/queue.sqlite3",
+                                 spool_dir=f"{directory}/spool")
+            try:
+                first = queue.enqueue({'email': 'ann@example.com'}, self.file_data)
+                self.assertEqual(queue.enqueue({'email': 'ANN@example.com'}, self.file_data), first)
+                self.assertNotEqual(queue.enqueue({'email': 'bob@example.com'}, self.file_data), first)
+                self.assertEqual(queue.depth(), 2)
+            finally:
+                queue.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
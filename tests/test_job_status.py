@@ -0,0 +1,175 @@
+import unittest
+import io
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+from benchmarks.sample_resumes import make_pdf, resume_lines
+from utils import config, job_status, resume_cache, resume_index
+from utils.job_status import JobStore
+from utils.resume_index import ResumeIndex
+from utils.webhook_queue import WebhookQueue
+
+
+class TestJobStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = JobStore(f"{self.tmp.name}/jobs.sqlite3")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_transitions_are_validated(self):
+        self.store.create('job1', 'a@example.com')
+        self.assertEqual(self.store.get('job1')['state'], job_status.QUEUED)
+        self.assertFalse(self.store.transition('job1', job_status.DELIVERED))
+        self.assertTrue(self.store.transition('job1', job_status.UPLOADING, 'attempt 1'))
+        self.assertTrue(self.store.transition('job1', job_status.DELIVERED))
+        self.assertFalse(self.store.transition('job1', job_status.FAILED))
+        self.assertFalse(self.store.transition('missing', job_status.UPLOADING))
+        self.assertEqual(self.store.counts()[job_status.DELIVERED], 1)
+
+    def test_analysis_completes_delivered_job_in_either_order(self):
+        analysis = {'score': 72.5, 'feedback': ['Quantify impact.']}
+        for job_id, analysis_first in (('early', True), ('late', False)):
+            self.store.create(job_id)
+            self.store.transition(job_id, job_status.UPLOADING)
+            if analysis_first:
+                self.store.record_analysis(job_id, analysis)
+                self.assertEqual(self.store.get(job_id)['state'], job_status.UPLOADING)
+            self.store.transition(job_id, job_status.DELIVERED)
+            if not analysis_first:
+                self.store.record_analysis(job_id, analysis)
+            job = self.store.get(job_id)
+            self.assertEqual(job['state'], job_status.ANALYZED)
+            self.assertEqual(job['analysis'], analysis)
+
+    def test_resubmitting_failed_job_requeues_it(self):
+        self.assertTrue(self.store.create('job1'))
+        self.store.transition('job1', job_status.FAILED, 'HTTP 500')
+        self.assertTrue(self.store.create('job1'))
+        job = self.store.get('job1')
+        self.assertEqual(job['state'], job_status.QUEUED)
+        self.assertIsNone(job['detail'])
+
+    def test_job_starts_over_after_idempotency_window(self):
+        self.store.create('job1')
+        self.store.transition('job1', job_status.UPLOADING)
+        self.store.transition('job1', job_status.DELIVERED)
+        self.assertFalse(self.store.create('job1'))
+        self.assertEqual(self.store.get('job1')['state'], job_status.DELIVERED)
+
+        with patch.object(job_status, 'IDEMPOTENCY_TTL_SECONDS', 0):
+            self.assertTrue(self.store.create('job1'))
+        self.assertEqual(self.store.get('job1')['state'], job_status.QUEUED)
+        self.assertTrue(self.store.transition('job1', job_status.UPLOADING))
+
+    def _wait_for_analysis(self, job_id, timeout=10.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            analysis = self.store.get(job_id)['analysis']
+            if analysis is not None:
+                return analysis
+            time.sleep(0.01)
+        self.fail(f"no analysis recorded for {job_id}")
+
+    def _local_analysis(self):
+        """Keep spooled uploads, caches and the index in the test's directory."""
+        index = ResumeIndex(f"{self.tmp.name}/index")
+        for patcher in (patch.object(config, 'DATA_DIR', self.tmp.name),
+                        patch.object(resume_cache, '_caches', {}),
+                        patch.object(resume_index, '_index', index)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return index
+
+    def test_analysis_indexes_and_scores_upload(self):
+        index = self._local_analysis()
+        self.store.create('job1', 'ann@example.com')
+        try:
+            upload = io.BytesIO(make_pdf(resume_lines(1)))
+            self.assertTrue(job_status.analyze_in_background('job1', upload, 'cv.pdf', self.store))
+            self.assertGreater(self._wait_for_analysis('job1')['score'], 0)
+            self.assertEqual([(r['email'], r['file_name']) for r in index.search('+consultant')],
+                             [('ann@example.com', 'cv.pdf')])
+            self.assertEqual(os.listdir(os.path.join(self.tmp.name, 'analysis_spool')), [])
+        finally:
+            index.close()
+
+    def test_unparseable_upload_still_settles(self):
+        index = self._local_analysis()
+        self.store.create('job1')
+        try:
+            job_status.analyze_in_background('job1', b'%PDF-1.4 truncated', 'cv.pdf', self.store)
+            self.assertIn('error', self._wait_for_analysis('job1'))
+        finally:
+            index.close()
+        self.store.transition('job1', job_status.UPLOADING)
+        self.store.transition('job1', job_status.DELIVERED)
+        self.assertTrue(job_status.is_settled(self.store.get('job1')))
+
+    def test_background_analysis_is_skipped_when_done_pending_or_backlogged(self):
+        self.store.create('done')
+        self.store.record_analysis('done', {'score': 50.0, 'feedback': []})
+        self.assertFalse(job_status.analyze_in_background('done', b'', 'cv.pdf', self.store))
+
+        self.store.create('job1')
+        with patch.object(job_status, '_analysis_pending', {'job1'}):
+            self.assertFalse(job_status.analyze_in_background('job1', b'', 'cv.pdf', self.store))
+        self.assertIsNone(self.store.get('job1')['analysis'])
+        # A busy server records that no analysis is coming, so the job can settle
+        with patch.object(job_status, 'JOB_ANALYSIS_BACKLOG', 0):
+            self.assertFalse(job_status.analyze_in_background('job1', b'', 'cv.pdf', self.store))
+        self.assertIn('error', self.store.get('job1')['analysis'])
+
+    def test_delivered_job_settles_without_local_analysis(self):
+        self.store.create('job1')
+        self.store.transition('job1', job_status.UPLOADING)
+        self.store.transition('job1', job_status.DELIVERED)
+        self.assertFalse(job_status.is_settled(self.store.get('job1')))
+        with patch.object(job_status, 'LOCAL_ANALYSIS', False):
+            self.assertTrue(job_status.is_settled(self.store.get('job1')))
+
+
+class TestQueueJobStatus(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = JobStore(f"{self.tmp.name}/jobs.sqlite3")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def _wait_for_state(self, job_id, state, timeout=5.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.store.get(job_id)['state'] == state:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def _run(self, deliver, job_id, **kwargs):
+        queue = WebhookQueue(deliver, db_path=f"{self.tmp.name}/queue.sqlite3",
+                             spool_dir=f"{self.tmp.name}/spool", base_delay=0.01,
+                             poll_interval=0.01, on_status=self.store.transition, **kwargs)
+        self.store.create(job_id)
+        queue.enqueue({'email': f'{job_id}@example.com'}, job_id=job_id)
+        queue.start()
+        return queue
+
+    def test_delivered_job(self):
+        queue = self._run(lambda form_data, file_data: True, 'ok')
+        self.assertTrue(self._wait_for_state('ok', job_status.DELIVERED))
+        queue.close()
+
+    def test_dead_lettered_job_fails(self):
+        queue = self._run(lambda form_data, file_data: False, 'bad', max_attempts=2)
+        self.assertTrue(self._wait_for_state('bad', job_status.FAILED))
+        queue.close()
+        self.assertEqual(self.store.get('bad')['detail'], 'Webhook delivery failed')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import json
+import logging
+import os
+import tempfile
+import threading
+
+from utils import logging_config
+
+
+class TestLoggingConfig(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.tmp.name, 'app.log')
+        root = logging.getLogger()
+        self.saved = (list(root.handlers), root.level)
+
+    def tearDown(self):
+        logging_config.shutdown_logging()
+        root = logging.getLogger()
+        root.handlers[:] = self.saved[0]
+        root.setLevel(self.saved[1])
+        self.tmp.cleanup()
+
+    def _records(self):
+        logging_config.shutdown_logging()
+        with open(self.log_file) as log:
+            return [json.loads(line) for line in log]
+
+    def test_json_records_carry_correlation_id(self):
+        logging_config.configure_logging(level='INFO', log_file=self.log_file, log_format='json', force=True)
+        logger = logging.getLogger('tests.logging')
+        logger.debug("suppressed %s", 'debug')
+        with logging_config.correlation_scope('abc123'):
+            logger.info("submission %s queued", 7, extra={'queue_depth': 3})
+        logger.warning("outside")
+
+        records = self._records()
+        self.assertEqual([r['msg'] for r in records], ['submission 7 queued', 'outside'])
+        self.assertEqual(records[0]['correlation_id'], 'abc123')
+        self.assertEqual(records[0]['queue_depth'], 3)
+        self.assertEqual(records[1]['correlation_id'], '-')
+
+    def test_exceptions_keep_traceback_in_exc_info(self):
+        logging_config.configure_logging(level='INFO', log_file=self.log_file, log_format='json', force=True)
+        try:
+            raise ValueError("bad upload")
+        except ValueError:
+            logging.getLogger('tests.logging').exception("parse failed for %s", 'cv.pdf')
+
+        record, = self._records()
+        self.assertEqual(record['msg'], 'parse failed for cv.pdf')
+        self.assertIn('Traceback', record['exc_info'])
+        self.assertIn('ValueError: bad upload', record['exc_info'])
+
+    def test_correlation_ids_are_per_thread(self):
+        logging_config.configure_logging(level='INFO', log_file=self.log_file, log_format='json', force=True)
+        logger = logging.getLogger('tests.logging')
+
+        def work(correlation_id):
+            with logging_config.correlation_scope(correlation_id):
+                logger.info(correlation_id)
+
+        threads = [threading.Thread(target=work, args=(f'id{i}',)) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(all(r['msg'] == r['correlation_id'] for r in self._records()))
+
+    def test_configure_is_idempotent(self):
+        logging_config.configure_logging(log_file=self.log_file, force=True)
+        handlers = list(logging.getLogger().handlers)
+        logging_config.configure_logging(log_file=self.log_file)
+        self.assertEqual(logging.getLogger().handlers, handlers)
+
+
+if __name__ == '__main__':
+    unittest.main()
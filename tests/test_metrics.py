@@ -0,0 +1,58 @@
+import unittest
+import threading
+import urllib.request
+
+from utils import metrics
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.was_enabled = metrics.is_enabled()
+
+    def tearDown(self):
+        metrics.enable(self.was_enabled)
+
+    def test_disabled_instrumentation_records_nothing(self):
+        metrics.enable(False)
+        histogram = metrics.Histogram('test_disabled_seconds', 'test', ['stage'])
+        counter = metrics.Counter('test_disabled_total', 'test')
+        with histogram.time('read'):
+            pass
+        counter.inc()
+        self.assertIs(metrics.stage_timer('read'), metrics._NOOP)
+        self.assertEqual(histogram.count('read'), 0)
+        self.assertEqual(counter.value(), 0)
+
+    def test_histogram_and_counter_render_prometheus_text(self):
+        metrics.enable(True)
+        histogram = metrics.Histogram('test_seconds', 'Stage time.', ['stage'], buckets=(0.1, 1.0))
+        histogram.observe(0.05, 'read')
+        histogram.observe(0.5, 'read')
+        histogram.observe(5.0, 'read')
+        counter = metrics.Counter('test_total', 'Outcomes.', ['outcome'])
+        counter.inc('success')
+        counter.inc('success', amount=2)
+
+        lines = histogram.render() + counter.render()
+        self.assertIn('test_seconds_bucket{stage="read",le="0.1"} 1', lines)
+        self.assertIn('test_seconds_bucket{stage="read",le="1"} 2', lines)
+        self.assertIn('test_seconds_bucket{stage="read",le="+Inf"} 3', lines)
+        self.assertIn('test_seconds_count{stage="read"} 3', lines)
+        self.assertIn('test_total{outcome="success"} 3', lines)
+
+    def test_metrics_endpoint(self):
+        metrics.enable(True)
+        with metrics.stage_timer('validation'):
+            pass
+        server = metrics.ThreadingHTTPServer(('127.0.0.1', 0), metrics._MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            body = urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics").read().decode()
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertIn('resumerocket_stage_seconds_count{stage="validation"}', body)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import io
+import unittest
+from unittest.mock import patch
+
+from benchmarks.load_test import percentile, run_load
+from utils import http_transport, idempotency, webhook
+from utils.mock_downstream import MockDownstream
+
+
+class TestMockDownstream(unittest.TestCase):
+    def setUp(self):
+        http_transport.close_session()
+        recent = patch.object(idempotency, '_recent', None)
+        recent.start()
+        self.addCleanup(recent.stop)
+
+    def tearDown(self):
+        http_transport.close_session()
+
+    def test_send_to_webhook_against_mock(self):
+        with MockDownstream(latency=0.0) as downstream, \
+                patch.object(webhook, 'WEBHOOK_URL', downstream.url):
+            file_data = ('resume.pdf', io.BytesIO(b'%PDF-1.4 resume'), 'application/pdf')
+            self.assertTrue(webhook.send_to_webhook({'email': 'a@example.com'}, file_data))
+            stats = downstream.stats()
+        self.assertEqual(stats['requests'], 1)
+        self.assertGreater(stats['bytes'], len(b'%PDF-1.4 resume'))
+
+    def test_simulated_errors(self):
+        with MockDownstream(latency=0.0, error_rate=1.0) as downstream, \
+                patch.object(webhook, 'WEBHOOK_URL', downstream.url):
+            self.assertFalse(webhook.send_to_webhook({'email': 'a@example.com'}))
+            self.assertEqual(downstream.stats()['errors'], 1)
+
+    def test_run_load_reports_percentiles(self):
+        with MockDownstream(latency=0.01, error_rate=0.5, seed=1) as downstream, \
+                patch.object(webhook, 'WEBHOOK_URL', downstream.url):
+            report = run_load(lambda user, i: webhook.send_to_webhook({'email': f'{user}.{i}@x.io'}), 4, 5)
+        self.assertEqual(report['requests'], 20)
+        self.assertEqual(report['errors'], downstream.stats()['errors'])
+        latency = report['latency_ms']
+        self.assertGreaterEqual(latency['p50'], 10)
+        self.assertLessEqual(latency['p50'], latency['p95'])
+        self.assertLessEqual(latency['p95'], latency['p99'])
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.50), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
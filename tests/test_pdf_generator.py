@@ -0,0 +1,62 @@
+import unittest
+import io
+import os
+import tempfile
+
+from benchmarks.sample_resumes import resume_record
+from utils import pdf_generator
+from utils.process_pool import shutdown_executor
+
+
+class TestPdfGenerator(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_executor()
+
+    def test_templates_are_compiled_once(self):
+        self.assertIs(pdf_generator.get_template('Modern'), pdf_generator.get_template('Modern'))
+        self.assertIs(pdf_generator.get_template('Modern').normal,
+                      pdf_generator.get_template('Professional').normal)
+
+    def test_unknown_template_falls_back_to_classic(self):
+        self.assertEqual(pdf_generator.get_template('Fancy').name, 'Classic')
+
+    def test_generate_pdf(self):
+        record = resume_record(1)
+        pdf = pdf_generator.generate_pdf(record['personal_info'], record['education'],
+                                         record['experience'], record['skills'], record['template'])
+        self.assertTrue(pdf.startswith(b'%PDF-'))
+
+    def test_generate_pdfs_preserves_order(self):
+        records = [resume_record(seed) for seed in range(3)]
+        records[1]['experience'] = records[1]['experience'] * 20
+        pdfs = pdf_generator.generate_pdfs(records)
+        self.assertEqual(len(pdfs), 3)
+        self.assertGreater(len(pdfs[1]), len(pdfs[0]))
+
+    def test_write_pdf_and_iter_pdf_match_generate_pdf(self):
+        record = resume_record(2)
+        args = (record['personal_info'], record['education'], record['experience'],
+                record['skills'], record['template'])
+        expected = pdf_generator.generate_pdf(*args)
+
+        stream = io.BytesIO()
+        pdf_generator.write_pdf(stream, *args)
+        chunks = list(pdf_generator.iter_pdf(*args, chunk_size=512))
+        # Documents embed a creation timestamp and id, so compare structure, not bytes
+        self.assertEqual(len(stream.getvalue()), len(expected))
+        self.assertEqual(len(b''.join(chunks)), len(expected))
+        self.assertTrue(all(len(chunk) <= 512 for chunk in chunks))
+
+    def test_export_pdfs_writes_files(self):
+        records = [resume_record(seed) for seed in range(2)]
+        records[0]['file_name'] = 'first.pdf'
+        with tempfile.TemporaryDirectory() as directory:
+            paths = pdf_generator.export_pdfs(records, directory)
+            self.assertEqual([os.path.basename(path) for path in paths], ['first.pdf', 'resume_1.pdf'])
+            with open(paths[1], 'rb') as pdf_file:
+                self.assertEqual(pdf_file.read(5), b'%PDF-')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from components import preview
+
+
+class TestPreviewSections(unittest.TestCase):
+    def setUp(self):
+        for builder in (preview._personal_info_markdown, preview._education_markdown,
+                        preview._experience_markdown, preview._skills_markdown):
+            builder.cache_clear()
+        self.personal_info = {'name': 'Jane Roe', 'email': 'jane@roe.io', 'phone': '555'}
+        self.education = [{'institution': 'INSEAD', 'degree': 'MBA', 'graduation_year': '2018'},
+                          {'institution': ''}]
+        self.experience = [{'company': 'Bain', 'position': 'Consultant', 'duration': '2019 - 2022',
+                            'description': 'Pricing work'}]
+
+    def test_sections_markdown(self):
+        sections = dict(preview.preview_sections(self.personal_info, self.education,
+                                                 self.experience, ['SQL', 'Python']))
+        self.assertEqual(list(sections), ['personal_info', 'education', 'experience', 'skills'])
+        self.assertIn('**INSEAD**\n\nMBA - 2018', sections['education'])
+        self.assertIn('*Consultant (2019 - 2022)*', sections['experience'])
+        self.assertEqual(sections['skills'], '## Skills\n\nSQL, Python')
+
+    def test_empty_sections_are_skipped(self):
+        self.assertEqual(preview.preview_sections({}, [{'institution': ''}], [], []), [])
+
+    def test_only_changed_sections_are_rebuilt(self):
+        preview.preview_sections(self.personal_info, self.education, self.experience, ['SQL'])
+        preview.preview_sections(dict(self.personal_info), list(self.education),
+                                 self.experience, ['SQL', 'Excel'])
+        self.assertEqual(preview._education_markdown.cache_info().misses, 1)
+        self.assertEqual(preview._education_markdown.cache_info().hits, 1)
+        self.assertEqual(preview._skills_markdown.cache_info().misses, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
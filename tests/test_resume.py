@@ -36,5 +36,25 @@ linkedin.com/in/johndoe
         self.assertEqual(position['duration'], 'Jan 2023 - Present')
         self.assertTrue('Tech Corp' in position['company'])
 
+    def test_contact_fields_do_not_span_lines(self):
+        text = "Jane Roe\nAustin\nBoston, MA\nPhone: 617.555.0100 | jane@roe.io"
+        contact_info = self.parser._extract_contact_info(text)
+        self.assertEqual(contact_info['location'], 'Boston, MA')
+        self.assertEqual(contact_info['phone'], '617.555.0100')
+        self.assertEqual(contact_info['email'], 'jane@roe.io')
+
+    def test_date_ranges_are_not_phone_numbers(self):
+        text = "Jane Roe\nConsultant, Bain 2019 - 2021\n2021 - 2023"
+        self.assertEqual(self.parser._extract_contact_info(text)['phone'], 'No information available')
+
+    def test_parse_combines_contact_and_position(self):
+        profile = self.parser.parse(
+            "Jane Roe\njane@roe.io\nEngagement Manager at McKinsey, Sep 2020 - Present"
+        )
+        self.assertEqual(profile.contact.email, 'jane@roe.io')
+        self.assertEqual(profile.position['title'], 'Engagement Manager')
+        self.assertEqual(profile.position['company'], 'McKinsey')
+        self.assertEqual(profile.to_dict()['position']['duration'], 'Sep 2020 - Present')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import tempfile
+from unittest.mock import patch
+
+from benchmarks.sample_resumes import resume_lines
+from utils import config, resume_analysis, resume_cache
+from utils.process_pool import shutdown_executor
+from utils.resume_cache import get_cache
+from utils.text_extraction import structure_lines
+
+WEAK_RESUME = """Jane Doe
+
+EXPERIENCE
+Consultant, Bain & Company 2019 - 2021
+• Responsible for client decks
+• Helped the team with research
+"""
+
+
+class TestResumeAnalysis(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_executor()
+
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.data_dir.cleanup)
+        # Keep result caches out of the developer's data directory
+        for patcher in (patch.object(config, 'DATA_DIR', self.data_dir.name),
+                        patch.object(resume_cache, '_caches', {})):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_strong_resume_passes_bullet_rules(self):
+        result = resume_analysis.analyze_resume('\n'.join(resume_lines(3)))
+        for name in ('quantified_impact', 'action_verbs', 'sections', 'weak_phrases', 'contact'):
+            self.assertTrue(result['rules'][name]['passed'], name)
+        self.assertEqual(result['stats']['bullets'], 16)
+        self.assertGreater(result['score'], 90)
+
+    def test_weak_resume_gets_feedback(self):
+        result = resume_analysis.analyze_resume(WEAK_RESUME)
+        self.assertEqual(result['stats']['bullets'], 2)
+        self.assertFalse(result['rules']['weak_phrases']['passed'])
+        self.assertIn('education, skills', result['rules']['sections']['message'])
+        self.assertIn('email and phone', result['rules']['contact']['message'])
+        # Feedback leads with the highest-weight rule
+        self.assertTrue(result['feedback'][0].startswith('Only 0 of 2'))
+        self.assertLess(result['score'], 30)
+
+    def test_quantified_ignores_years(self):
+        self.assertIsNone(resume_analysis._QUANTIFIED.search('Joined the team in 2019'))
+        for bullet in ('Cut costs by 12%', 'Saved $4M', 'Led a 12-person team', 'Grew revenue 3x'):
+            self.assertIsNotNone(resume_analysis._QUANTIFIED.search(bullet), bullet)
+
+    def test_batch_on_pool_matches_serial_and_caches(self):
+        resumes = [structure_lines(resume_lines(seed)) for seed in range(12)] + [WEAK_RESUME]
+        serial = resume_analysis.analyze_batch(resumes, chunksize=4, parallel=False)
+        get_cache('analysis').clear()
+        pooled = resume_analysis.analyze_batch(resumes, chunksize=4)
+        self.assertEqual(pooled, serial)
+        self.assertEqual(resume_analysis.analyze_batch([{'status': 'success', 'data': resumes[0]}]),
+                         serial[:1])
+        self.assertEqual(get_cache('analysis').stats()['memory_items'], 13)
+
+    def test_parse_error_does_not_fail_batch(self):
+        results = resume_analysis.analyze_batch([{'status': 'error', 'message': 'Unsupported file'}, WEAK_RESUME])
+        self.assertEqual(results[0], {'status': 'error', 'message': 'Unsupported file'})
+        self.assertEqual(results[1], resume_analysis.analyze_resume(WEAK_RESUME))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import os
+import tempfile
+import time
+
+from utils.resume_cache import ResumeCache, content_key
+
+
+class TestResumeCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _cache(self, **kwargs):
+        kwargs.setdefault('disk_dir', self.tmp.name)
+        return ResumeCache('test', **kwargs)
+
+    def test_content_key_depends_on_bytes_and_version(self):
+        self.assertEqual(content_key(b'abc', 'v1'), content_key(b'abc', 'v1'))
+        self.assertNotEqual(content_key(b'abc', 'v1'), content_key(b'abc', 'v2'))
+        self.assertNotEqual(content_key(b'abc', 'v1'), content_key(b'abd', 'v1'))
+
+    def test_memory_lru_falls_back_to_disk(self):
+        cache = self._cache(max_items=2)
+        for key in ('a', 'b', 'c'):
+            cache.set(key * 4, {'value': key})
+        self.assertEqual(cache.get('cccc'), {'value': 'c'})
+        self.assertEqual(cache.get('aaaa'), {'value': 'a'})
+        self.assertIsNone(cache.get('zzzz'))
+        stats = cache.stats()
+        self.assertEqual((stats['memory_hits'], stats['disk_hits'], stats['misses']), (1, 1, 1))
+
+    def test_entries_persist_across_instances(self):
+        self._cache().set('abcd', [1, 2, 3])
+        self.assertEqual(self._cache().get('abcd'), [1, 2, 3])
+
+    def test_ttl_expiry(self):
+        cache = self._cache(ttl=0.05)
+        cache.set('abcd', 'value')
+        time.sleep(0.1)
+        self.assertIsNone(cache.get('abcd'))
+        self.assertFalse(os.path.exists(cache._path('abcd')))
+
+    def test_disk_size_eviction(self):
+        cache = self._cache(max_items=1, max_disk_bytes=2000)
+        for index in range(20):
+            cache.set(f'key{index:02d}', 'x' * 200)
+            time.sleep(0.002)
+        self.assertLessEqual(cache.stats()['disk_bytes'], 2000)
+        self.assertGreater(cache.stats()['evictions'], 0)
+        self.assertEqual(cache.get('key19'), 'x' * 200)
+
+    def test_get_or_compute_only_computes_once(self):
+        cache = self._cache()
+        calls = []
+        compute = lambda: calls.append(1) or {'parsed': True}
+        self.assertEqual(cache.get_or_compute('abcd', compute), {'parsed': True})
+        self.assertEqual(cache.get_or_compute('abcd', compute), {'parsed': True})
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
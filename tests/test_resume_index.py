@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+
+from utils.resume_index import ResumeIndex, tokenize
+
+DOCS = [
+    ("Senior consultant at McKinsey. Python, SQL and pricing strategy.", "ann@example.com"),
+    ("Engagement manager at Bain. Python Python Python modelling.", "bob@example.com"),
+    ("Associate at McKinsey. Operations and supply chain.", "cat@example.com"),
+    ("Intern at Kearney. Python basics.", "dan@example.com"),
+]
+
+
+class TestResumeIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index = self._open(flush_every=2, max_segments=1)
+        self.ids = [self.index.add(text, email=email) for text, email in DOCS]
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp.cleanup()
+
+    def _open(self, **kwargs):
+        return ResumeIndex(self.tmp.name, **kwargs)
+
+    def _emails(self, query):
+        return [result['email'] for result in self.index.search(query)]
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("Led M&A work in C++ and Node.js."), ['led', 'm&a', 'work', 'c++', 'node.js'])
+
+    def test_bm25_ranks_term_frequency(self):
+        self.assertEqual(self._emails('python')[0], 'bob@example.com')
+        self.assertEqual(set(self._emails('python')), {'ann@example.com', 'bob@example.com', 'dan@example.com'})
+
+    def test_required_and_excluded_terms(self):
+        self.assertEqual(self._emails('python +mckinsey'), ['ann@example.com', 'cat@example.com'])
+        self.assertEqual(set(self._emails('+mckinsey')), {'ann@example.com', 'cat@example.com'})
+        self.assertNotIn('dan@example.com', self._emails('python -intern'))
+        self.assertEqual(self._emails('+nonexistent python'), [])
+
+    def test_duplicate_submission_is_stored_once(self):
+        self.assertEqual(self.index.add(DOCS[0][0], email='ANN@example.com'), self.ids[0])
+        self.assertEqual(len(self.index), len(DOCS))
+
+    def test_same_text_from_another_submitter_is_kept(self):
+        self.index.add(DOCS[0][0], email='other@example.com')
+        self.assertEqual(len(self.index), len(DOCS) + 1)
+        self.assertEqual(set(self._emails('+pricing')), {'ann@example.com', 'other@example.com'})
+
+    def test_segments_are_merged_and_persisted(self):
+        stats = self.index.stats()
+        self.assertEqual((stats['segments'], stats['buffered']), (1, 0))
+        self.assertEqual(len([name for name in os.listdir(self.tmp.name) if name.endswith('.postings')]), 1)
+
+        self.index.add("Principal at BCG. Python and healthcare.", email='eve@example.com')
+        self.index.close()
+        self.index = self._open()
+        self.assertEqual(self._emails('healthcare'), ['eve@example.com'])
+        self.assertEqual(len(self.index), len(DOCS) + 1)
+
+    def test_unflushed_documents_are_recovered(self):
+        self.index.add("Principal at BCG. Healthcare.", email='eve@example.com')
+        reopened = self._open()  # without close(): the new document was only buffered
+        try:
+            self.assertEqual(reopened.stats()['buffered'], 1)
+            self.assertEqual([result['email'] for result in reopened.search('healthcare')],
+                             ['eve@example.com'])
+        finally:
+            reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
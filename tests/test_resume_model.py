@@ -0,0 +1,54 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from utils import resume_model
+from utils.resume_model import Education, Experience, PersonalInfo, Resume, Skills
+
+
+class TestResumeModel(unittest.TestCase):
+    def setUp(self):
+        self.resume = Resume(
+            PersonalInfo(first_name='Jane', last_name='Roe', email='jane@roe.io', phone='555'),
+            [Education('INSEAD', 'MBA', '2018')],
+            [Experience('Bain', 'Consultant', '2019 - 2022', 'Pricing work')],
+            Skills(['SQL', 'Python']),
+        )
+
+    def test_json_round_trip_is_compact(self):
+        data = self.resume.dumps()
+        self.assertEqual(Resume.loads(data), self.resume)
+        self.assertNotIn('first_name', data)
+        self.assertLess(len(data), len(json.dumps(self.resume.to_dict())))
+
+    def test_packb_round_trip(self):
+        self.assertEqual(Resume.unpackb(self.resume.packb()), self.resume)
+        with patch.object(resume_model, 'msgpack', None):
+            packed = self.resume.packb()
+            self.assertEqual(packed, self.resume.dumps().encode('utf-8'))
+            self.assertEqual(Resume.unpackb(packed), self.resume)
+
+    def test_from_legacy_dict(self):
+        resume = Resume.from_dict({
+            'personal_info': {'name': 'Jane Roe', 'email': 'jane@roe.io', 'unknown': 'x'},
+            'education': [{'institution': 'INSEAD', 'graduation_year': 2018}],
+            'skills': ['SQL'],
+        })
+        self.assertEqual(resume.personal_info.display_name, 'Jane Roe')
+        self.assertEqual(resume.education[0].graduation_year, '2018')
+        self.assertEqual(resume.experience, [])
+        self.assertEqual(resume.template, 'Classic')
+        self.assertEqual(Resume.from_dict(resume.to_dict()), resume)
+
+    def test_records_are_slotted(self):
+        for record in (self.resume, self.resume.personal_info, self.resume.education[0],
+                       self.resume.experience[0], self.resume.skills):
+            self.assertFalse(hasattr(record, '__dict__'))
+
+    def test_empty_personal_info_is_falsy(self):
+        self.assertFalse(PersonalInfo())
+        self.assertTrue(PersonalInfo(email='jane@roe.io'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import io
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from utils import webhook
+from utils.streaming_upload import MultipartStream, file_size
+
+
+def parse_multipart(body, content_type):
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    return {part.get_param('name', header='content-disposition'): part for part in message.iter_parts()}
+
+
+class CaptureHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.server.captured = (self.headers, self.rfile.read(int(self.headers['Content-Length'])))
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestStreamingUpload(unittest.TestCase):
+    def test_file_size_preserves_position(self):
+        fileobj = io.BytesIO(b'x' * 1000)
+        fileobj.seek(10)
+        self.assertEqual(file_size(fileobj), 1000)
+        self.assertEqual(fileobj.tell(), 10)
+
+    def test_multipart_body_is_chunked_and_well_formed(self):
+        content = bytes(range(256)) * 1024
+        stream = MultipartStream({'email': 'a@example.com'}, 'resume', 'cv.pdf',
+                                 io.BytesIO(content), 'application/pdf', chunk_size=4096)
+        chunks = list(stream)
+        body = b''.join(chunks)
+
+        self.assertEqual(len(body), len(stream))
+        self.assertTrue(all(len(chunk) <= 4096 for chunk in chunks))
+        parts = parse_multipart(body, stream.content_type)
+        self.assertEqual(parts['email'].get_content(), 'a@example.com')
+        self.assertEqual(parts['resume'].get_filename(), 'cv.pdf')
+        self.assertEqual(parts['resume'].get_payload(decode=True), content)
+
+    def test_send_to_webhook_streams_file_object(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), CaptureHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/hook"
+        try:
+            content = b'%PDF-1.4 ' + b'0' * 300000
+            form_data = {'first_name': 'Ada', 'last_name': 'Lovelace', 'email': 'ada@example.com'}
+            with mock.patch.object(webhook, 'WEBHOOK_URL', url):
+                self.assertTrue(webhook.send_to_webhook(
+                    form_data, ('cv.pdf', io.BytesIO(content), 'application/pdf')))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        headers, body = server.captured
+        parts = parse_multipart(body, headers['Content-Type'])
+        self.assertEqual(parts['first_name'].get_content(), 'Ada')
+        self.assertEqual(parts['resume'].get_payload(decode=True), content)
+
+
+if __name__ == '__main__':
+    unittest.main()
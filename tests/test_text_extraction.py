@@ -0,0 +1,62 @@
+import unittest
+import tempfile
+from unittest.mock import patch
+
+from benchmarks.sample_resumes import make_docx, make_pdf, resume_lines
+from utils import config, resume_cache, text_extraction
+from utils.process_pool import shutdown_executor
+from utils.resume_parser import process_resume
+
+
+class TestTextExtraction(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_executor()
+
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.data_dir.cleanup)
+        # Keep result caches out of the developer's data directory
+        for patcher in (patch.object(config, 'DATA_DIR', self.data_dir.name),
+                        patch.object(resume_cache, '_caches', {})):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_structure_lines(self):
+        result = text_extraction.structure_lines([
+            "Jane Roe", "jane@example.com", "",
+            "EXPERIENCE",
+            "Consultant - Bain & Company (2021 - Present)",
+            "• Led pricing work", "• Cut costs by 12%", "",
+            "Education", "INSEAD - MBA",
+        ])
+        self.assertEqual(result['contact'], ["Jane Roe", "jane@example.com"])
+        self.assertEqual(result['sections']['experience'], [
+            "Consultant - Bain & Company (2021 - Present)", "Led pricing work", "Cut costs by 12%",
+        ])
+        self.assertEqual(result['sections']['education'], ["INSEAD - MBA"])
+
+    def test_extract_pdf_and_docx(self):
+        lines = resume_lines(7)
+        for name, content in [('cv.pdf', make_pdf(lines)), ('cv.docx', make_docx(lines))]:
+            result = text_extraction.extract_text(content, name)
+            self.assertEqual(result['file_type'], name.rsplit('.', 1)[1])
+            self.assertIn('candidate7@example.com', ' '.join(result['contact']))
+            self.assertEqual(len(result['sections']['experience']), 4 * 5)
+
+    def test_unsupported_file_type(self):
+        with self.assertRaises(ValueError):
+            text_extraction.extract_text(b'plain text', 'notes.txt')
+
+    def test_batch_and_process_resume_use_pool(self):
+        files = [('a.docx', make_docx(resume_lines(1))), ('b.txt', b'nope')]
+        results = text_extraction.extract_batch(files)
+        self.assertEqual([r['status'] for r in results], ['success', 'error'])
+
+        processed = process_resume('', make_pdf(resume_lines(2)), 'b.pdf')
+        self.assertEqual(processed['status'], 'success')
+        self.assertIn('skills', processed['data']['sections'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import io
+import unittest
+import zipfile
+
+from benchmarks.sample_resumes import make_docx, make_pdf, resume_lines
+from utils.upload_validation import InvalidUpload, check_upload, inspect_upload
+
+
+class TestUploadValidation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pdf = make_pdf(resume_lines(1, positions=30))
+        cls.docx = make_docx(resume_lines(2))
+
+    def test_valid_pdf_counts_pages(self):
+        info = inspect_upload(self.pdf, 'resume.pdf')
+        self.assertEqual(info.file_type, 'pdf')
+        self.assertEqual(info.size, len(self.pdf))
+        self.assertEqual(info.pages, 4)
+
+    def test_valid_docx(self):
+        self.assertEqual(inspect_upload(self.docx, 'resume.docx').file_type, 'docx')
+
+    def test_file_position_is_restored(self):
+        upload = io.BytesIO(self.pdf)
+        upload.seek(7)
+        self.assertIsNone(check_upload(upload, 'resume.pdf'))
+        self.assertEqual(upload.tell(), 7)
+
+    def test_rejections(self):
+        cases = {
+            'empty': (b'', 'resume.pdf'),
+            'not a PDF or DOCX': (b'hello world', 'resume.pdf'),
+            'named .docx': (self.pdf, 'resume.docx'),
+            'truncated': (self.pdf[:len(self.pdf) // 2], 'resume.pdf'),
+            'DOCX file appears': (self.docx[:len(self.docx) // 2], 'resume.docx'),
+        }
+        for expected, (content, name) in cases.items():
+            with self.subTest(expected):
+                self.assertIn(expected, check_upload(content, name))
+
+    def test_limits(self):
+        with self.assertRaisesRegex(InvalidUpload, 'limit is 1MB'):
+            inspect_upload(b'%PDF-' + b'0' * (1024 * 1024), 'big.pdf', max_bytes=1024 * 1024)
+        with self.assertRaisesRegex(InvalidUpload, '4 pages'):
+            inspect_upload(self.pdf, 'resume.pdf', max_pages=3)
+
+    def test_zip_without_document_is_rejected(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            archive.writestr('readme.txt', 'hello')
+        self.assertIn('not a Word document', check_upload(buffer.getvalue(), 'resume.docx'))
+
+
+if __name__ == '__main__':
+    unittest.main()
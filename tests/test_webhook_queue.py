@@ -0,0 +1,116 @@
+import unittest
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from utils.webhook_queue import WebhookQueue
+
+
+class StubWebhookHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.server.hits += 1
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self.send_response(status)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestWebhookQueue(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubWebhookHandler)
+        self.server.hits = 0
+        self.server.statuses = []
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hook"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def _deliver(self, form_data, file_data=None):
+        files = {'resume': file_data} if file_data else None
+        return requests.post(self.url, data=form_data, files=files, timeout=5).status_code == 200
+
+    def _queue(self, **kwargs):
+        return WebhookQueue(self._deliver, db_path=f"{self.tmp.name}/queue.sqlite3",
+                            spool_dir=f"{self.tmp.name}/spool", base_delay=0.01,
+                            poll_interval=0.01, **kwargs)
+
+    def _wait_for(self, predicate, timeout=5.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_enqueue_returns_before_delivery_and_retries(self):
+        self.server.statuses = [500, 503]
+        queue = self._queue()
+        queue.enqueue({'email': 'a@example.com'}, ('cv.pdf', b'%PDF-1.4', 'application/pdf'))
+        self.assertEqual(queue.depth(), 1)
+
+        queue.start()
+        self.assertTrue(self._wait_for(lambda: queue.depth() == 0))
+        stats = queue.stats()
+        queue.close()
+        self.assertEqual(self.server.hits, 3)
+        self.assertEqual(stats['counts']['delivered'], 1)
+        self.assertEqual(stats['latency']['count'], 1)
+
+    def test_dead_letter_after_max_attempts(self):
+        self.server.statuses = [500] * 10
+        queue = self._queue(max_attempts=2)
+        queue.start()
+        queue.enqueue({'email': 'b@example.com'})
+        self.assertTrue(self._wait_for(lambda: queue.stats()['counts']['dead'] == 1))
+        dead = queue.dead_letters()
+        queue.close()
+        self.assertEqual(self.server.hits, 2)
+        self.assertEqual(dead[0]['attempts'], 2)
+
+    def test_pending_submissions_survive_restart(self):
+        queue = self._queue()
+        queue.enqueue({'email': 'c@example.com'})
+        queue.close()
+
+        restarted = self._queue()
+        restarted.start()
+        self.assertTrue(self._wait_for(lambda: restarted.depth() == 0))
+        restarted.close()
+        self.assertEqual(self.server.hits, 1)
+
+    def test_row_claimed_by_another_process_is_not_claimed_again(self):
+        queue, other = self._queue(), self._queue()
+        queue.enqueue({'email': 'd@example.com'})
+        conn = queue._conn
+        claimed = []
+
+        class RacingConnection:
+            """Lets the other queue claim the row between our SELECT and UPDATE."""
+            def execute(self, sql, *params):
+                result = conn.execute(sql, *params)
+                if sql.startswith("SELECT * FROM submissions") and not claimed:
+                    claimed.append(other._claim()[0])
+                return result
+
+        queue._conn = RacingConnection()
+        try:
+            self.assertEqual(queue._claim(), (None, None))
+            self.assertIsNotNone(claimed[0])
+        finally:
+            queue._conn = conn
+            queue.close()
+            other.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+"""
+Module for high-volume asynchronous webhook delivery.
+
+Used for replaying failed submissions and bulk-forwarding to the downstream
+automation. Deliveries share a pooled httpx client, a semaphore caps the number
+in flight, and a token bucket per endpoint limits the request rate. When the
+receiver answers 429 or 5xx, every sender to that endpoint pauses (honouring
+Retry-After) and the endpoint's rate is halved, recovering gradually as
+requests succeed again.
+"""
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from utils import http_transport
+from utils.config import WEBHOOK_URL
+from utils.idempotency import HEADER, idempotency_key
+from utils.resume_model import PersonalInfo
+from utils.webhook import build_payload
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Async token bucket allowing ``rate`` requests per second with bursts of ``capacity``."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.max_rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def throttle(self, floor: float = 0.5) -> None:
+        """Halve the rate after the receiver pushed back."""
+        self._refill()
+        self.rate = max(floor, self.rate / 2)
+
+    def recover(self) -> None:
+        """Step the rate back up towards its configured maximum after a success."""
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+
+class AsyncWebhookClient:
+    """Concurrency- and rate-limited async webhook sender with backpressure."""
+
+    def __init__(self, url: Optional[str] = None, concurrency: int = 32, rate: float = 20.0,
+                 burst: Optional[float] = None, max_attempts: int = 5, base_delay: float = 1.0,
+                 max_delay: float = 60.0, timeout: float = http_transport.DEFAULT_TIMEOUT):
+        """
+        Args:
+            url: Webhook endpoint (defaults to WEBHOOK_URL)
+            concurrency: Maximum deliveries in flight
+            rate: Requests per second allowed per endpoint
+            burst: Token bucket capacity per endpoint (defaults to ``rate``)
+            max_attempts: Attempts per submission before giving up
+            base_delay: Backoff delay in seconds after the first retryable failure
+            max_delay: Upper bound for backoff and Retry-After pauses
+            timeout: Per-request timeout in seconds
+        """
+        self.url = url or WEBHOOK_URL
+        self.concurrency = concurrency
+        self.rate = rate
+        self.burst = burst
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+
+        self._client = None
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._paused_until: Dict[str, float] = {}
+        self.counters = {'delivered': 0, 'failed': 0, 'retries': 0, 'throttled': 0}
+
+    async def __aenter__(self) -> "AsyncWebhookClient":
+        self._client = http_transport.create_async_client(self.concurrency, timeout=self.timeout)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._client.aclose()
+        self._client = None
+
+    def _bucket(self, host: str) -> TokenBucket:
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return self._buckets[host]
+
+    async def _wait_for_endpoint(self, host: str) -> None:
+        pause = self._paused_until.get(host, 0.0) - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+        await self._bucket(host).acquire()
+
+    def _retry_delay(self, response: Any, attempt: int) -> float:
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return min(self.max_delay, float(retry_after))
+            except ValueError:
+                pass
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def send(self, form_data: Union[dict, PersonalInfo], file_data: Optional[tuple] = None,
+                   url: Optional[str] = None) -> bool:
+        """
+        Deliver one submission, retrying retryable failures with backoff.
+
+        Args:
+            form_data: Form fields (dict or PersonalInfo) to forward
+            file_data: Optional (file_name, file_content, file_type) tuple
+            url: Override the client's endpoint for this submission
+
+        Returns:
+            True when the receiver answered 200
+        """
+        url = url or self.url
+        host = urlsplit(url).netloc
+        # build_payload stamps dicts in place; keep the caller's dict untouched
+        payload = build_payload(dict(form_data) if isinstance(form_data, dict) else form_data)
+        headers = {HEADER: idempotency_key(payload['email'], file_data[1] if file_data else None)}
+
+        async with self._semaphore:
+            for attempt in range(1, self.max_attempts + 1):
+                await self._wait_for_endpoint(host)
+                files = None
+                if file_data:
+                    file_name, file_content, file_type = file_data
+                    if hasattr(file_content, 'seek'):
+                        file_content.seek(0)
+                    files = {'resume': (file_name, file_content, file_type)}
+
+                response = None
+                try:
+                    response = await self._client.post(url, data=payload, files=files, headers=headers)
+                except Exception as e:
+                    logger.warning("Async delivery to %s failed (attempt %d): %s", host, attempt, e)
+                else:
+                    if response.status_code == 200:
+                        self._bucket(host).recover()
+                        self.counters['delivered'] += 1
+                        return True
+                    if response.status_code not in RETRYABLE_STATUSES:
+                        logger.error("Async delivery rejected with status %d", response.status_code)
+                        break
+                    # Receiver is overloaded: slow every sender to this endpoint down
+                    self.counters['throttled'] += 1
+                    self._bucket(host).throttle()
+
+                if attempt < self.max_attempts:
+                    delay = self._retry_delay(response, attempt)
+                    self._paused_until[host] = max(self._paused_until.get(host, 0.0),
+                                                   time.monotonic() + delay)
+                    self.counters['retries'] += 1
+
+        self.counters['failed'] += 1
+        return False
+
+    async def send_many(self, submissions: Iterable[Tuple[Union[dict, PersonalInfo], Optional[tuple]]]) -> List[bool]:
+        """
+        Deliver many submissions with at most ``concurrency`` in flight.
+
+        Submissions are pulled lazily from the iterable, so large replays do not
+        need every file loaded up front.
+
+        Returns:
+            Delivery outcome per submission, in input order
+        """
+        items = iter(enumerate(submissions))
+        results: Dict[int, bool] = {}
+
+        async def worker() -> None:
+            for index, (form_data, file_data) in items:
+                results[index] = await self.send(form_data, file_data)
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return [results[index] for index in range(len(results))]
+
+
+def deliver_all(submissions: Iterable[Tuple[Union[dict, PersonalInfo], Optional[tuple]]], **kwargs: Any) -> List[bool]:
+    """Synchronous entry point: deliver ``submissions`` with an AsyncWebhookClient."""
+    async def run() -> List[bool]:
+        async with AsyncWebhookClient(**kwargs) as client:
+            return await client.send_many(submissions)
+
+    return asyncio.run(run())
@@ -0,0 +1,291 @@
+"""
+Module for headless bulk ingestion of resumes.
+
+Reads either a CSV manifest of (first_name, last_name, email, file) rows or a
+directory of PDF/DOCX files, validates and de-duplicates the submissions by
+email + content hash, then parses and delivers them concurrently with bounded
+parallelism while reporting progress and throughput.
+
+Usage:
+    python -m utils.batch_ingest cohort.csv --workers 8
+    python -m utils.batch_ingest resumes/ --deliver queue
+    python -m utils.batch_ingest resumes/ --deliver none --index
+"""
+import argparse
+import csv
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from utils.logging_config import configure_logging
+from utils.resume_cache import content_key
+from utils.resume_index import ResumeIndex
+from utils.resume_parser import NOT_AVAILABLE, process_resume
+from utils.upload_validation import check_upload
+
+logger = logging.getLogger(__name__)
+
+MIME_TYPES = {
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+}
+MANIFEST_FIELDS = ('first_name', 'last_name', 'email', 'file')
+_EMAIL = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
+@dataclass
+class IngestItem:
+    """One resume to ingest; name and email may be filled in from the parsed resume."""
+    file_path: str
+    first_name: str = ''
+    last_name: str = ''
+    email: str = ''
+
+
+def load_manifest(csv_path: str) -> List[IngestItem]:
+    """
+    Read a CSV manifest with first_name, last_name, email and file columns.
+
+    Relative file paths are resolved against the manifest's directory.
+    """
+    base_dir = os.path.dirname(os.path.abspath(csv_path))
+    with open(csv_path, newline='', encoding='utf-8-sig') as manifest:
+        reader = csv.DictReader(manifest)
+        missing = [field for field in MANIFEST_FIELDS if field not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"Manifest is missing columns: {', '.join(missing)}")
+        return [
+            IngestItem(
+                file_path=os.path.join(base_dir, row['file'].strip()),
+                first_name=row['first_name'].strip(),
+                last_name=row['last_name'].strip(),
+                email=row['email'].strip(),
+            )
+            for row in reader
+        ]
+
+
+def scan_directory(directory: str) -> List[IngestItem]:
+    """List PDF/DOCX files in ``directory``; contact details come from parsing."""
+    return [
+        IngestItem(file_path=os.path.join(directory, name))
+        for name in sorted(os.listdir(directory))
+        if os.path.splitext(name)[1].lower() in MIME_TYPES
+    ]
+
+
+def check_file(item: IngestItem) -> Optional[str]:
+    """Return why the item's file cannot be ingested, or None if it looks fine."""
+    extension = os.path.splitext(item.file_path)[1].lower()
+    if extension not in MIME_TYPES:
+        return f"unsupported file type '{extension or '?'}'"
+    if not os.path.isfile(item.file_path):
+        return "file not found"
+    with open(item.file_path, 'rb') as resume_file:
+        return check_upload(resume_file, item.file_path)
+
+
+def check_fields(item: IngestItem) -> Optional[str]:
+    """Return why the item's contact fields are invalid, or None if they are complete."""
+    if not all([item.first_name, item.last_name, item.email]):
+        return "missing first name, last name or email"
+    if not _EMAIL.match(item.email):
+        return f"invalid email '{item.email}'"
+    return None
+
+
+def _fill_from_profile(item: IngestItem, profile: Dict[str, Any]) -> None:
+    contact = profile.get('contact', {})
+    if not item.email and contact.get('email', NOT_AVAILABLE) != NOT_AVAILABLE:
+        item.email = contact['email']
+    name = contact.get('name', NOT_AVAILABLE)
+    if name != NOT_AVAILABLE and not (item.first_name and item.last_name):
+        first, _, last = name.partition(' ')
+        item.first_name = item.first_name or first
+        item.last_name = item.last_name or last
+
+
+class BatchIngestor:
+    """Validate, de-duplicate, parse and deliver a batch of resumes concurrently."""
+
+    def __init__(self, deliver: Optional[Callable[[dict, Optional[tuple]], Any]] = None,
+                 workers: int = 8, progress: Optional[Callable[[str], None]] = None,
+                 index: Optional[ResumeIndex] = None):
+        """
+        Args:
+            deliver: Called with (form_data, file_data) per accepted resume, e.g.
+                send_to_webhook or WebhookQueue.enqueue; None parses only
+            workers: Resumes processed concurrently
+            progress: Called with a one-line status after each resume
+            index: Local search index that accepted resumes are added to
+        """
+        self.deliver = deliver
+        self.index = index
+        self.workers = workers
+        self.progress = progress
+        self._lock = threading.Lock()
+        self._seen: set = set()
+        self._done = 0
+        self._total = 0
+        self._started = 0.0
+        self.results: List[Dict[str, Any]] = []
+
+    def _claim(self, email: str, digest: str) -> Optional[tuple]:
+        key = (email.lower(), digest)
+        with self._lock:
+            if key in self._seen:
+                return None
+            self._seen.add(key)
+            return key
+
+    def _release(self, key: tuple) -> None:
+        with self._lock:
+            self._seen.discard(key)
+
+    def _process(self, item: IngestItem) -> Dict[str, Any]:
+        result = {'file': item.file_path, 'email': item.email}
+        error = check_file(item)
+        if error:
+            return {**result, 'status': 'rejected', 'reason': error}
+
+        with open(item.file_path, 'rb') as resume_file:
+            content = resume_file.read()
+        digest = content_key(content)
+        # Held while the item is processed; released unless it is ingested, so an
+        # identical row after a failure is retried rather than reported as a duplicate
+        claim = None
+        try:
+            # Manifest rows already carry an email, so duplicates can skip parsing
+            if item.email:
+                claim = self._claim(item.email, digest)
+                if claim is None:
+                    return {**result, 'status': 'duplicate'}
+
+            file_name = os.path.basename(item.file_path)
+            parsed = process_resume(item.file_path, content, file_name)
+            if parsed['status'] != 'success':
+                return {**result, 'status': 'failed', 'reason': parsed['message']}
+            _fill_from_profile(item, parsed['data'].get('profile', {}))
+            result['email'] = item.email
+
+            error = check_fields(item)
+            if error:
+                return {**result, 'status': 'rejected', 'reason': error}
+            if claim is None:
+                claim = self._claim(item.email, digest)
+                if claim is None:
+                    return {**result, 'status': 'duplicate'}
+
+            if self.index is not None:
+                self.index.add_parsed(parsed, email=item.email, file_name=file_name,
+                                      name=f"{item.first_name} {item.last_name}".strip())
+
+            if self.deliver is not None:
+                form_data = {'first_name': item.first_name, 'last_name': item.last_name, 'email': item.email}
+                file_type = MIME_TYPES[os.path.splitext(file_name)[1].lower()]
+                if self.deliver(form_data, (file_name, content, file_type)) is False:
+                    return {**result, 'status': 'failed', 'reason': 'delivery failed'}
+            claim = None
+            return {**result, 'status': 'ok'}
+        finally:
+            if claim is not None:
+                self._release(claim)
+
+    def _run_one(self, item: IngestItem) -> Dict[str, Any]:
+        try:
+            result = self._process(item)
+        except Exception as e:
+            logger.error("Error ingesting %s: %s", item.file_path, e)
+            result = {'file': item.file_path, 'email': item.email, 'status': 'failed', 'reason': str(e)}
+        with self._lock:
+            self._done += 1
+            done = self._done
+            rate = done / max(time.perf_counter() - self._started, 1e-9)
+        if self.progress:
+            detail = f" ({result['reason']})" if 'reason' in result else ''
+            self.progress(f"[{done}/{self._total}] {result['status']:9s} "
+                          f"{os.path.basename(item.file_path)}{detail}  {rate:.1f} files/s")
+        return result
+
+    def run(self, items: Iterable[IngestItem]) -> Dict[str, Any]:
+        """
+        Ingest ``items`` with at most ``workers`` in flight.
+
+        Returns:
+            Report with per-status counts, elapsed seconds, throughput and the
+            per-file results
+        """
+        items = list(items)
+        self._total = len(items)
+        self._started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            self.results = list(executor.map(self._run_one, items))
+        elapsed = time.perf_counter() - self._started
+
+        counts: Dict[str, int] = {}
+        for result in self.results:
+            counts[result['status']] = counts.get(result['status'], 0) + 1
+        return {
+            'total': len(items),
+            'counts': counts,
+            'elapsed': elapsed,
+            'throughput': len(items) / elapsed if elapsed else 0.0,
+            'results': self.results,
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk-ingest resumes from a CSV manifest or directory.")
+    parser.add_argument('source', help='CSV manifest (first_name,last_name,email,file) or directory')
+    parser.add_argument('--workers', type=int, default=8, help='resumes processed concurrently')
+    parser.add_argument('--deliver', choices=['direct', 'queue', 'none'], default='direct',
+                        help='send to the webhook now, enqueue for the app server to deliver, or parse only')
+    parser.add_argument('--index', action='store_true',
+                        help='also add accepted resumes to the local search index '
+                             '(shared with the app server: run while it is stopped)')
+    parser.add_argument('--quiet', action='store_true', help='only print the final report')
+    args = parser.parse_args(argv)
+
+    configure_logging(level='WARNING', log_file='', log_format='text')
+    items = scan_directory(args.source) if os.path.isdir(args.source) else load_manifest(args.source)
+
+    queue = None
+    deliver = None
+    if args.deliver == 'direct':
+        from utils.webhook import send_to_webhook
+        deliver = send_to_webhook
+    elif args.deliver == 'queue':
+        from utils.webhook_queue import WebhookQueue
+        from utils.webhook import send_to_webhook
+        # Enqueue only: the app server's workers own delivery (and crash recovery) for
+        # this queue, and a second set of workers here would contend for its rows
+        queue = WebhookQueue(send_to_webhook)
+        deliver = queue.enqueue
+
+    index = ResumeIndex() if args.index else None
+    progress = None if args.quiet else (lambda line: print(line, file=sys.stderr))
+    report = BatchIngestor(deliver, workers=args.workers, progress=progress, index=index).run(items)
+    if queue is not None:
+        print(f"queued; the running app server delivers them (queue depth {queue.depth()})")
+        queue.close()
+    if index is not None:
+        print(f"indexed; {len(index)} resumes searchable")
+        index.close()
+
+    counts = ', '.join(f"{status}={count}" for status, count in sorted(report['counts'].items()))
+    print(f"ingested {report['total']} resumes in {report['elapsed']:.2f}s "
+          f"({report['throughput']:.1f} files/s): {counts}")
+    for result in report['results']:
+        if result['status'] not in ('ok', 'duplicate'):
+            print(f"  {result['status']}: {result['file']} - {result.get('reason', '')}")
+    return 0 if report['counts'].get('failed', 0) == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
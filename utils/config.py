@@ -0,0 +1,64 @@
+"""
+Module for shared runtime configuration.
+"""
+import os
+
+WEBHOOK_URL = os.environ.get(
+    "WEBHOOK_URL", "https://hooks.zapier.com/hooks/catch/274092/2km31m2/"
+)
+DATA_DIR = os.environ.get("RESUMEROCKET_DATA_DIR", os.path.join(os.getcwd(), "data"))
+
+# Outbound HTTP connection pooling
+HTTP_POOL_CONNECTIONS = int(os.environ.get("HTTP_POOL_CONNECTIONS", "4"))
+HTTP_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", "16"))
+HTTP_POOL_BLOCK = os.environ.get("HTTP_POOL_BLOCK", "false").lower() in ("1", "true", "yes")
+HTTP_KEEPALIVE_EXPIRY = float(os.environ.get("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_ENABLE_HTTP2 = os.environ.get("HTTP_ENABLE_HTTP2", "true").lower() in ("1", "true", "yes")
+
+
+def data_path(*parts: str) -> str:
+    """
+    Build a path inside the local data directory, creating it if needed.
+
+    Args:
+        *parts: Path components relative to the data directory
+
+    Returns:
+        Absolute path to the requested location
+    """
+    os.makedirs(DATA_DIR, exist_ok=True)
+    return os.path.join(DATA_DIR, *parts)
+
+# Worker processes for CPU-bound parsing and rendering (0 = one per CPU)
+PARSER_WORKERS = int(os.environ.get("PARSER_WORKERS", "0"))
+
+# Content-addressed result cache
+CACHE_MEMORY_ITEMS = int(os.environ.get("CACHE_MEMORY_ITEMS", "256"))
+CACHE_DISK_BYTES = int(os.environ.get("CACHE_DISK_BYTES", str(256 * 1024 * 1024)))
+CACHE_TTL_SECONDS = float(os.environ.get("CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# Upload pre-validation limits
+UPLOAD_MAX_BYTES = int(os.environ.get("UPLOAD_MAX_BYTES", str(20 * 1024 * 1024)))
+UPLOAD_MAX_PAGES = int(os.environ.get("UPLOAD_MAX_PAGES", "20"))
+UPLOAD_MAX_UNCOMPRESSED = int(os.environ.get("UPLOAD_MAX_UNCOMPRESSED", str(100 * 1024 * 1024)))
+
+# Submission idempotency (duplicate window and remembered keys)
+IDEMPOTENCY_TTL_SECONDS = float(os.environ.get("IDEMPOTENCY_TTL_SECONDS", str(24 * 3600)))
+IDEMPOTENCY_MAX_KEYS = int(os.environ.get("IDEMPOTENCY_MAX_KEYS", "10000"))
+
+# Submission job tracking (status cache lifetime; in-process parsing, indexing and scoring of uploads)
+JOB_STATUS_CACHE_SECONDS = float(os.environ.get("JOB_STATUS_CACHE_SECONDS", "3"))
+LOCAL_ANALYSIS = os.environ.get("LOCAL_ANALYSIS", "true").lower() in ("1", "true", "yes")
+JOB_ANALYSIS_BACKLOG = int(os.environ.get("JOB_ANALYSIS_BACKLOG", "8"))
+
+# Logging
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "json").lower()
+LOG_FILE = os.environ.get("LOG_FILE", "app.log")
+LOG_MAX_BYTES = int(os.environ.get("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+LOG_BACKUP_COUNT = int(os.environ.get("LOG_BACKUP_COUNT", "5"))
+
+# Metrics (disabled unless METRICS_ENABLED is set)
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "false").lower() in ("1", "true", "yes")
+METRICS_PORT = int(os.environ.get("METRICS_PORT", "0"))
+METRICS_DUMP_INTERVAL = float(os.environ.get("METRICS_DUMP_INTERVAL", "0"))
@@ -0,0 +1,125 @@
+"""
+Module for pooled, keep-alive HTTP transport shared by all outbound traffic.
+
+A single requests.Session per process keeps TCP/TLS connections open between
+submissions so bursts reuse connections instead of paying a new handshake each
+time. An optional httpx-based async client (with HTTP/2 when the h2 package is
+installed) is available for concurrent delivery.
+"""
+import logging
+import os
+import threading
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.config import (
+    HTTP_ENABLE_HTTP2,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_POOL_BLOCK,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+)
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _build_session(pool_connections: int, pool_maxsize: int, pool_block: bool) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide pooled session, creating it on first use.
+
+    Pool sizing comes from the HTTP_POOL_* settings: HTTP_POOL_CONNECTIONS is the
+    number of hosts kept in the pool, HTTP_POOL_MAXSIZE the connections kept
+    alive per host, and HTTP_POOL_BLOCK turns that size into a hard per-host limit.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session(HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_POOL_BLOCK)
+                logger.debug("Created pooled HTTP session (hosts=%d, per-host=%d, block=%s)",
+                             HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_POOL_BLOCK)
+    return _session
+
+
+def post(url: str, timeout: float = DEFAULT_TIMEOUT, **kwargs: Any) -> requests.Response:
+    """Send a POST request over the pooled session."""
+    return get_session().post(url, timeout=timeout, **kwargs)
+
+
+def close_session() -> None:
+    """Close pooled connections; the next request opens a fresh session."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def _reset_after_fork() -> None:
+    # Pooled sockets must not be shared with a forked child process.
+    global _session, _session_lock
+    _session = None
+    _session_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def create_async_client(max_connections: Optional[int] = None, **kwargs: Any) -> "httpx.AsyncClient":
+    """
+    Create a pooled async client for concurrent delivery.
+
+    Async clients are bound to the event loop they are used on, so callers own
+    the returned client and should close it with ``await client.aclose()``.
+    HTTP/2 is negotiated when enabled and the h2 package is installed.
+
+    Args:
+        max_connections: Total connection limit (defaults to HTTP_POOL_MAXSIZE)
+        **kwargs: Extra arguments forwarded to httpx.AsyncClient
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    if httpx is None:
+        raise RuntimeError("httpx is required for the async client (pip install httpx)")
+    max_connections = max_connections or HTTP_POOL_MAXSIZE
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+    )
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return httpx.AsyncClient(limits=limits, http2=HTTP_ENABLE_HTTP2 and _HAS_H2, **kwargs)
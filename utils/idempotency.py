@@ -0,0 +1,124 @@
+"""
+Module for submission idempotency keys.
+
+A key is derived from the submitter's email and the resume's content hash,
+so a double-clicked "Upload Document", a Streamlit rerun or a re-run batch
+maps to the same key. Keys are remembered for a bounded time and count;
+a duplicate of a delivered submission is short-circuited locally, one whose
+first attempt is still in flight is reported as not delivered, and the key
+travels downstream in an Idempotency-Key header so the receiver can
+de-duplicate as well.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import IO, Optional, Tuple, Union
+
+from utils.config import IDEMPOTENCY_MAX_KEYS, IDEMPOTENCY_TTL_SECONDS
+from utils.streaming_upload import DEFAULT_CHUNK_SIZE, as_file
+
+HEADER = "Idempotency-Key"
+
+
+def idempotency_key(email: str, content: Union[bytes, IO[bytes], None] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """
+    Derive the idempotency key for a submission.
+
+    Args:
+        email: Submitter's email; compared case-insensitively
+        content: Resume bytes or a seekable file object (hashed in chunks,
+            position restored); None for submissions without a file
+
+    Returns:
+        Hex digest identifying the (email, content) pair
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(email.strip().lower().encode("utf-8") + b"\0")
+    if content is not None:
+        fileobj = as_file(content)
+        position = fileobj.tell()
+        fileobj.seek(0)
+        try:
+            for chunk in iter(lambda: fileobj.read(chunk_size), b""):
+                digest.update(chunk)
+        finally:
+            fileobj.seek(position)
+    return digest.hexdigest()
+
+
+class RecentKeys:
+    """
+    Thread-safe set of keys that expire after ``ttl`` seconds, capped at ``max_items``.
+
+    A key is claimed while its submission is in flight and marked sent once
+    it has been delivered.
+    """
+
+    def __init__(self, ttl: float = IDEMPOTENCY_TTL_SECONDS, max_items: int = IDEMPOTENCY_MAX_KEYS):
+        self.ttl = ttl
+        self.max_items = max_items
+        # key -> (claimed or sent at, sent)
+        self._keys: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        # Oldest first: stop at the first key that is still fresh
+        while self._keys:
+            key, (added_at, _) = next(iter(self._keys.items()))
+            if now - added_at < self.ttl and len(self._keys) <= self.max_items:
+                break
+            self._keys.popitem(last=False)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            self._prune(time.monotonic())
+            return key in self._keys
+
+    def claim(self, key: str) -> bool:
+        """Record ``key`` as in flight and return True, or return False if it is already held."""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            if key in self._keys:
+                return False
+            self._keys[key] = (now, False)
+            self._prune(now)
+            return True
+
+    def mark_sent(self, key: str) -> None:
+        """Record that ``key`` was delivered; the ttl restarts from now."""
+        with self._lock:
+            self._keys.pop(key, None)
+            self._keys[key] = (time.monotonic(), True)
+
+    def is_sent(self, key: str) -> bool:
+        """Return True if ``key`` was delivered (as opposed to only claimed)."""
+        with self._lock:
+            self._prune(time.monotonic())
+            entry = self._keys.get(key)
+            return entry is not None and entry[1]
+
+    def release(self, key: str) -> None:
+        """Forget ``key`` so the submission can be retried."""
+        with self._lock:
+            self._keys.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._prune(time.monotonic())
+            return len(self._keys)
+
+
+_recent: Optional[RecentKeys] = None
+_recent_lock = threading.Lock()
+
+
+def recent_keys() -> RecentKeys:
+    """Return the process-wide store of keys sent or being sent."""
+    global _recent
+    with _recent_lock:
+        if _recent is None:
+            _recent = RecentKeys()
+        return _recent
@@ -0,0 +1,255 @@
+"""
+Module for tracking submission jobs.
+
+Every submission gets a job whose state moves through queued, uploading,
+delivered and analyzed (or failed), recorded in a local SQLite table as the
+delivery queue and the local analysis progress. A job id is derived from the
+submission's idempotency key, so like a queued submission it is reused within
+the idempotency window and started over after it. The UI only reads this
+table (through a short-lived cache), so a session never waits on the webhook
+or the analysis.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Dict, Optional, Set, Union
+
+from utils.config import IDEMPOTENCY_TTL_SECONDS, JOB_ANALYSIS_BACKLOG, LOCAL_ANALYSIS, data_path
+from utils.streaming_upload import copy_to_path
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+UPLOADING = "uploading"
+DELIVERED = "delivered"
+ANALYZED = "analyzed"
+FAILED = "failed"
+
+TRANSITIONS = {
+    QUEUED: {UPLOADING, FAILED},
+    UPLOADING: {UPLOADING, DELIVERED, QUEUED, FAILED},
+    DELIVERED: {ANALYZED},
+    ANALYZED: set(),
+    # A failed job starts over when the same submission is sent again
+    FAILED: {QUEUED},
+}
+# States a job no longer leaves on its own
+FINAL_STATES = frozenset({ANALYZED, FAILED})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    email TEXT,
+    state TEXT NOT NULL,
+    detail TEXT,
+    analysis TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs (state);
+"""
+
+
+class JobStore:
+    """SQLite-backed job states with validated transitions."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Args:
+            db_path: SQLite database file (defaults to the data directory)
+        """
+        self.db_path = db_path or data_path("jobs.sqlite3")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def create(self, job_id: str, email: str = "") -> bool:
+        """
+        Register a queued job.
+
+        An existing job is kept unless it had failed or was created outside
+        the idempotency window (when the queue accepts the submission again);
+        either way it starts over as queued. Its analysis is kept, since the
+        id is derived from the same content.
+
+        Returns:
+            True if the job was created or started over
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT state, created_at FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                self._conn.execute(
+                    "INSERT INTO jobs (id, email, state, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (job_id, email, QUEUED, now, now),
+                )
+            elif row["state"] == FAILED or row["created_at"] <= now - IDEMPOTENCY_TTL_SECONDS:
+                self._conn.execute(
+                    "UPDATE jobs SET state = ?, detail = NULL, created_at = ?, updated_at = ? WHERE id = ?",
+                    (QUEUED, now, now, job_id),
+                )
+            else:
+                return False
+        return True
+
+    def transition(self, job_id: str, state: str, detail: Optional[str] = None) -> bool:
+        """
+        Move a job to ``state`` if the transition is allowed.
+
+        A job reaching 'delivered' whose analysis is already recorded moves on
+        to 'analyzed'.
+
+        Returns:
+            True if the job changed state
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT state, analysis FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None or state not in TRANSITIONS[row["state"]]:
+                logger.debug("Ignoring job %s transition %s -> %s", job_id,
+                             row["state"] if row else None, state)
+                return False
+            if state == DELIVERED and row["analysis"] is not None:
+                state = ANALYZED
+            self._conn.execute(
+                "UPDATE jobs SET state = ?, detail = ?, updated_at = ? WHERE id = ?",
+                (state, detail, time.time(), job_id),
+            )
+        return True
+
+    def record_analysis(self, job_id: str, analysis: Dict[str, Any]) -> None:
+        """
+        Store the local analysis; a job that is already delivered becomes 'analyzed'.
+
+        ``analysis`` is {'score', 'feedback'}, or {'error'} when none could be made.
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET analysis = ?, updated_at = ?,"
+                " state = CASE WHEN state = ? THEN ? ELSE state END WHERE id = ?",
+                (json.dumps(analysis), time.time(), DELIVERED, ANALYZED, job_id),
+            )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the job as a dict (analysis decoded), or None if unknown."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["analysis"] = json.loads(job["analysis"]) if job["analysis"] else None
+        return job
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of jobs in each state."""
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        counts = dict.fromkeys(TRANSITIONS, 0)
+        counts.update({row[0]: row[1] for row in rows})
+        return counts
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_store: Optional[JobStore] = None
+_store_lock = threading.Lock()
+_analysis_executor: Optional[ThreadPoolExecutor] = None
+_analysis_pending: Set[str] = set()
+
+
+def get_job_store() -> JobStore:
+    """Return the process-wide job store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = JobStore()
+        return _store
+
+
+def is_settled(job: Dict[str, Any]) -> bool:
+    """
+    Return True once a job will not change without a new submission.
+
+    With local analysis off, nothing moves a delivered job on to 'analyzed'.
+    """
+    return job["state"] in FINAL_STATES or (job["state"] == DELIVERED and not LOCAL_ANALYSIS)
+
+
+def _analyze(store: JobStore, job_id: str, path: str, file_name: str) -> None:
+    from utils.resume_analysis import analyze_resume
+    from utils.resume_index import get_resume_index
+    from utils.resume_parser import process_resume
+
+    try:
+        parsed = process_resume(path, None, file_name)
+        if parsed['status'] != 'success':
+            logger.warning("Local analysis of job %s skipped: %s", job_id, parsed['message'])
+            store.record_analysis(job_id, {'error': parsed['message']})
+            return
+        # Keep the submission searchable locally, whatever happens downstream
+        job = store.get(job_id) or {}
+        get_resume_index().add_parsed(parsed, email=job.get('email') or '', file_name=file_name)
+        result = analyze_resume(parsed)
+        store.record_analysis(job_id, {'score': result['score'], 'feedback': result['feedback']})
+    except Exception as e:
+        logger.error("Local analysis of job %s failed: %s", job_id, e)
+        store.record_analysis(job_id, {'error': 'Analysis failed'})
+    finally:
+        os.remove(path)
+        with _store_lock:
+            _analysis_pending.discard(job_id)
+
+
+def analyze_in_background(job_id: str, upload: Union[bytes, IO[bytes]], file_name: str,
+                          store: Optional[JobStore] = None) -> bool:
+    """
+    Parse, index and score the resume off the calling thread, recording the score on the job.
+
+    The upload is spooled to disk here, so waiting jobs hold a file path
+    rather than the file's bytes. Jobs already analyzed or being analyzed are
+    skipped. A job arriving while JOB_ANALYSIS_BACKLOG uploads are waiting or
+    in progress gets an error analysis instead, like one whose file cannot be
+    parsed, so it still settles once delivered.
+
+    Returns:
+        True if the analysis was scheduled
+    """
+    global _analysis_executor
+    store = store or get_job_store()
+    job = store.get(job_id)
+    if job is None or (job["analysis"] is not None and "error" not in job["analysis"]):
+        return False
+    with _store_lock:
+        if job_id in _analysis_pending:
+            return False
+        if len(_analysis_pending) >= JOB_ANALYSIS_BACKLOG:
+            busy = True
+        else:
+            busy = False
+            _analysis_pending.add(job_id)
+            if _analysis_executor is None:
+                _analysis_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="job-analysis")
+    if busy:
+        logger.warning("Skipping local analysis of job %s: %d analyses pending",
+                       job_id, len(_analysis_pending))
+        store.record_analysis(job_id, {'error': 'Analysis skipped while the server is busy'})
+        return False
+
+    spool_dir = data_path("analysis_spool")
+    os.makedirs(spool_dir, exist_ok=True)
+    path = os.path.join(spool_dir, uuid.uuid4().hex)
+    try:
+        copy_to_path(upload, path)
+    except Exception:
+        with _store_lock:
+            _analysis_pending.discard(job_id)
+        raise
+    _analysis_executor.submit(_analyze, store, job_id, path, file_name)
+    return True
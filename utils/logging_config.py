@@ -0,0 +1,168 @@
+"""
+Module for application-wide logging setup and request tracing.
+
+Log calls only enqueue records; a QueueListener thread does the formatting and
+the (rotating) file and console I/O, so request handlers never block on disk.
+Records are emitted as JSON lines by default and carry the correlation id of
+the submission being processed.
+
+Configured through LOG_LEVEL, LOG_FORMAT (json|text), LOG_FILE (empty to
+disable), LOG_MAX_BYTES and LOG_BACKUP_COUNT.
+"""
+import atexit
+import contextlib
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+from utils.config import LOG_BACKUP_COUNT, LOG_FILE, LOG_FORMAT, LOG_LEVEL, LOG_MAX_BYTES
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(correlation_id)s] %(message)s'
+
+_correlation_id: contextvars.ContextVar = contextvars.ContextVar('correlation_id', default='-')
+_STANDARD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {
+    'message', 'asctime', 'correlation_id',
+}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_configure_lock = threading.Lock()
+
+
+def new_correlation_id() -> str:
+    """Return a short random id for tagging one submission's log records."""
+    return uuid.uuid4().hex[:16]
+
+
+def get_correlation_id() -> str:
+    """Return the correlation id active in the current context ('-' if none)."""
+    return _correlation_id.get()
+
+
+@contextlib.contextmanager
+def correlation_scope(correlation_id: Optional[str] = None) -> Iterator[str]:
+    """Tag every record logged inside the block with ``correlation_id`` (new if omitted)."""
+    correlation_id = correlation_id or new_correlation_id()
+    token = _correlation_id.set(correlation_id)
+    try:
+        yield correlation_id
+    finally:
+        _correlation_id.reset(token)
+
+
+class CorrelationFilter(logging.Filter):
+    """Stamp records with the correlation id of the thread that logged them."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'correlation_id'):
+            record.correlation_id = _correlation_id.get()
+        return True
+
+
+class TracebackQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that keeps a record's traceback apart from its message.
+
+    The stock prepare() folds the formatted traceback into ``msg``; here it is
+    rendered into ``exc_text`` instead (traceback objects are not held past
+    the call), so the listener's formatter still sees it as exception info.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+            'correlation_id': getattr(record, 'correlation_id', '-'),
+            'thread': record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _STANDARD_ATTRS and key not in entry:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc_info'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(level: Optional[str] = None, log_file: Optional[str] = None,
+                      log_format: Optional[str] = None, force: bool = False) -> None:
+    """
+    Route all logging through a background queue listener.
+
+    Safe to call on every Streamlit rerun: only the first call (or one with
+    ``force``) installs handlers.
+
+    Args:
+        level: Root log level name (defaults to LOG_LEVEL)
+        log_file: Rotating log file path; empty string disables file output
+        log_format: 'json' or 'text' (defaults to LOG_FORMAT)
+        force: Replace an existing configuration
+    """
+    global _listener
+    with _configure_lock:
+        if _listener is not None and not force:
+            return
+        if _listener is not None:
+            _listener.stop()
+
+        log_file = LOG_FILE if log_file is None else log_file
+        if (log_format or LOG_FORMAT) == 'json':
+            formatter: logging.Formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(TEXT_FORMAT)
+
+        handlers = [logging.StreamHandler(sys.stdout)]
+        if log_file:
+            handlers.append(logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+            ))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        record_queue: queue.Queue = queue.Queue(-1)
+        queue_handler = TracebackQueueHandler(record_queue)
+        queue_handler.addFilter(CorrelationFilter())
+
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        root.setLevel((level or LOG_LEVEL).upper())
+
+        _listener = logging.handlers.QueueListener(record_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    with _configure_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,228 @@
+"""
+Module for hot-path metrics on the submission pipeline.
+
+Provides counters and latency histograms, a Prometheus text exposition (served
+on METRICS_PORT) and an optional periodic dump to the log. When metrics are
+disabled every instrumentation call returns after a single flag check, and
+timers hand back a shared no-op context manager.
+"""
+import bisect
+import contextlib
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from utils.config import METRICS_DUMP_INTERVAL, METRICS_ENABLED, METRICS_PORT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_enabled = METRICS_ENABLED
+_NOOP = contextlib.nullcontext()
+
+
+def enable(enabled: bool = True) -> None:
+    """Turn instrumentation on or off at runtime."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _label_text(labelnames: Sequence[str], labelvalues: Tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Counter:
+    """Monotonic counter, optionally split by label values."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        if not _enabled:
+            return
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labelvalues, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_label_text(self.labelnames, labelvalues)} {value:g}")
+        return lines
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {','.join(key) or 'total': value for key, value in self._values.items()}
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed durations in seconds."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labelvalues -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        if not _enabled:
+            return
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    @contextlib.contextmanager
+    def _timer(self, labelvalues: Tuple[str, ...]) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labelvalues)
+
+    def time(self, *labelvalues: str):
+        """Context manager recording the duration of its block."""
+        if not _enabled:
+            return _NOOP
+        return self._timer(labelvalues)
+
+    def count(self, *labelvalues: str) -> int:
+        series = self._series.get(labelvalues)
+        return int(sum(series[:-1])) if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labelvalues, series in sorted(self._series.items()):
+                cumulative = 0.0
+                for bound, count in zip(self.buckets + (float('inf'),), series[:-1]):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else f'{bound:g}'
+                    label = _label_text(self.labelnames, labelvalues, f'le="{le}"')
+                    lines.append(f"{self.name}_bucket{label} {cumulative:g}")
+                label = _label_text(self.labelnames, labelvalues)
+                lines.append(f"{self.name}_sum{label} {series[-1]:.6f}")
+                lines.append(f"{self.name}_count{label} {cumulative:g}")
+        return lines
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                ','.join(key) or 'total': {'count': sum(series[:-1]), 'sum': series[-1]}
+                for key, series in self._series.items()
+            }
+
+
+STAGE_SECONDS = Histogram(
+    'resumerocket_stage_seconds', 'Time spent in each submission pipeline stage.', ['stage']
+)
+SUBMISSIONS = Counter(
+    'resumerocket_submissions_total', 'Form submissions by outcome.', ['outcome']
+)
+WEBHOOK_REQUESTS = Counter(
+    'resumerocket_webhook_requests_total', 'Webhook delivery attempts by outcome.', ['outcome']
+)
+PDF_RENDERS = Counter(
+    'resumerocket_pdf_renders_total', 'Rendered PDF documents.'
+)
+REGISTRY = [STAGE_SECONDS, SUBMISSIONS, WEBHOOK_REQUESTS, PDF_RENDERS]
+
+
+def stage_timer(stage: str):
+    """Time a pipeline stage (upload_read, validation, upload_validation, serialization, http_round_trip, pdf_generation)."""
+    if not _enabled:
+        return _NOOP
+    return STAGE_SECONDS._timer((stage,))
+
+
+def render_prometheus() -> str:
+    """Return every metric in the Prometheus text exposition format."""
+    lines: List[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+
+def snapshot() -> Dict[str, object]:
+    """Return a JSON-friendly view of every metric."""
+    return {metric.name: metric.snapshot() for metric in REGISTRY}
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = render_prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_dump_thread: Optional[threading.Thread] = None
+_start_lock = threading.Lock()
+
+
+def start_http_server(port: int = METRICS_PORT, address: str = '0.0.0.0') -> Optional[ThreadingHTTPServer]:
+    """Serve /metrics on ``port`` from a daemon thread (once per process)."""
+    global _server
+    with _start_lock:
+        if _server is None and port:
+            _server = ThreadingHTTPServer((address, port), _MetricsHandler)
+            threading.Thread(target=_server.serve_forever, name='metrics-http', daemon=True).start()
+            logger.info("Serving metrics on port %d", _server.server_port)
+    return _server
+
+
+def start_periodic_dump(interval: float = METRICS_DUMP_INTERVAL) -> None:
+    """Log a JSON snapshot of all metrics every ``interval`` seconds (once per process)."""
+    global _dump_thread
+    with _start_lock:
+        if _dump_thread is not None or interval <= 0:
+            return
+
+        def dump() -> None:
+            while True:
+                time.sleep(interval)
+                logger.info("metrics %s", json.dumps(snapshot()))
+
+        _dump_thread = threading.Thread(target=dump, name='metrics-dump', daemon=True)
+        _dump_thread.start()
+
+
+def start_exporters() -> None:
+    """Start whichever exporters are configured, if metrics are enabled."""
+    if _enabled:
+        start_http_server()
+        start_periodic_dump()
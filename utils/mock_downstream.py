@@ -0,0 +1,174 @@
+"""
+Module for a local stand-in of the downstream webhook pipeline.
+
+Emulates the Zapier catch hook that fronts Airparser/Make.com: every POST is
+drained (multipart uploads included), held for a configurable latency and
+answered with Zapier's JSON acknowledgement, or with an error at a
+configurable rate. Used by the load-test harness and handy for running the
+app without touching the real hook.
+
+Usage:
+    python -m utils.mock_downstream --port 8085 --latency 0.3 --jitter 0.2 --error-rate 0.02
+    WEBHOOK_URL=http://127.0.0.1:8085/hooks/catch/local/ streamlit run main.py
+"""
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from utils.logging_config import configure_logging
+
+logger = logging.getLogger(__name__)
+
+_READ_CHUNK = 64 * 1024
+
+
+class _CatchHookHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: "_DownstreamServer"
+
+    def do_POST(self):
+        downstream = self.server.downstream
+        received = 0
+        remaining = int(self.headers.get('Content-Length') or 0)
+        while remaining > 0:
+            chunk = self.rfile.read(min(_READ_CHUNK, remaining))
+            if not chunk:
+                break
+            received += len(chunk)
+            remaining -= len(chunk)
+
+        time.sleep(downstream.next_latency())
+        status = downstream.record(received)
+        if status == 200:
+            request_id = uuid.uuid4().hex
+            body = json.dumps({'attempt': request_id, 'id': request_id,
+                               'request_id': request_id, 'status': 'success'}).encode('utf-8')
+        else:
+            body = json.dumps({'status': 'error', 'message': 'Simulated downstream failure'}).encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if status == 429:
+            self.send_header('Retry-After', '1')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _DownstreamServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+    downstream: "MockDownstream"
+
+
+class MockDownstream:
+    """Threaded HTTP server answering like the Zapier catch hook."""
+
+    def __init__(self, latency: float = 0.2, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 500, host: str = '127.0.0.1', port: int = 0,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            latency: Base seconds to hold each request before answering
+            jitter: Extra uniformly distributed seconds added to each latency
+            error_rate: Fraction of requests answered with ``error_status``
+            error_status: HTTP status for simulated failures (429 adds Retry-After)
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+            seed: Seed for reproducible latency/error sequences
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.host = host
+        self.port = port
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[_DownstreamServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.counters = {'requests': 0, 'errors': 0, 'bytes': 0}
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/hooks/catch/local/"
+
+    def next_latency(self) -> float:
+        with self._lock:
+            return self.latency + self._random.uniform(0.0, self.jitter)
+
+    def record(self, received: int) -> int:
+        """Count a request and decide its status code."""
+        with self._lock:
+            self.counters['requests'] += 1
+            self.counters['bytes'] += received
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.counters['errors'] += 1
+                return self.error_status
+        return 200
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.counters)
+
+    def start(self) -> "MockDownstream":
+        if self._server is None:
+            self._server = _DownstreamServer((self.host, self.port), _CatchHookHandler)
+            self._server.downstream = self
+            self.port = self._server.server_port
+            self._thread = threading.Thread(target=self._server.serve_forever,
+                                            name='mock-downstream', daemon=True)
+            self._thread.start()
+            logger.info("Mock downstream listening on %s", self.url)
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> "MockDownstream":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the Zapier catch hook.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8085)
+    parser.add_argument('--latency', type=float, default=0.2, help='base response latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='extra random latency in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests that fail')
+    parser.add_argument('--error-status', type=int, default=500)
+    args = parser.parse_args(argv)
+
+    configure_logging(level='INFO', log_file='', log_format='text')
+    downstream = MockDownstream(args.latency, args.jitter, args.error_rate, args.error_status,
+                                args.host, args.port).start()
+    print(f"Mock downstream listening on {downstream.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        downstream.stop()
+        print(json.dumps(downstream.stats()))
+
+
+if __name__ == '__main__':
+    main()
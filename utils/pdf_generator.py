@@ -3,70 +3,183 @@ from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from io import BytesIO
+import os
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple
 
-def generate_pdf(personal_info, education, experience, skills, template):
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
-    styles = getSampleStyleSheet()
-    story = []
+from utils import metrics
+from utils.process_pool import get_executor
+from utils.resume_model import Resume, as_education, as_experience, as_personal_info, as_skills
+
+DEFAULT_TEMPLATE = "Classic"
+DEFAULT_CHUNK_SIZE = 64 * 1024
+TEMPLATE_COLORS = {
+    "Professional": colors.navy,
+    "Modern": colors.darkgreen,
+    "Classic": colors.black,
+}
+
+
+class CompiledTemplate(NamedTuple):
+    """Style objects and page settings built once per template."""
+    name: str
+    title: ParagraphStyle
+    heading: ParagraphStyle
+    normal: ParagraphStyle
+    page: Dict[str, Any]
+
+
+@lru_cache(maxsize=1)
+def _sample_styles():
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=None)
+def get_template(template):
+    """Return the compiled template, falling back to Classic for unknown names."""
+    if template not in TEMPLATE_COLORS:
+        template = DEFAULT_TEMPLATE
+    styles = _sample_styles()
+    title_style = ParagraphStyle(
+        f'{template}Title',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=TEMPLATE_COLORS[template],
+        spaceAfter=30
+    )
+    return CompiledTemplate(template, title_style, styles["Heading2"], styles["Normal"], {'pagesize': letter})
 
-    # Custom styles based on template
-    if template == "Professional":
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.navy,
-            spaceAfter=30
-        )
-    elif template == "Modern":
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.darkgreen,
-            spaceAfter=30
-        )
-    else:  # Classic
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.black,
-            spaceAfter=30
-        )
+
+def _build_story(personal_info, education, experience, skills, compiled):
+    story = []
+    normal = compiled.normal
+    personal_info = as_personal_info(personal_info)
 
     # Personal Information
     if personal_info:
-        story.append(Paragraph(f"{personal_info.get('name', '')}", title_style))
-        story.append(Paragraph(f"Email: {personal_info.get('email', '')}", styles["Normal"]))
-        story.append(Paragraph(f"Phone: {personal_info.get('phone', '')}", styles["Normal"]))
+        story.append(Paragraph(f"{personal_info.display_name}", compiled.title))
+        story.append(Paragraph(f"Email: {personal_info.email}", normal))
+        story.append(Paragraph(f"Phone: {personal_info.phone}", normal))
         story.append(Spacer(1, 20))
 
     # Education Section
-    story.append(Paragraph("Education", styles["Heading2"]))
-    for edu in education:
-        if edu.get('institution'):
-            story.append(Paragraph(f"<b>{edu.get('institution')}</b>", styles["Normal"]))
-            story.append(Paragraph(f"{edu.get('degree')} - {edu.get('graduation_year')}", styles["Normal"]))
+    story.append(Paragraph("Education", compiled.heading))
+    for edu in as_education(education):
+        if edu.institution:
+            story.append(Paragraph(f"<b>{edu.institution}</b>", normal))
+            story.append(Paragraph(f"{edu.degree} - {edu.graduation_year}", normal))
             story.append(Spacer(1, 10))
 
     # Experience Section
-    story.append(Paragraph("Professional Experience", styles["Heading2"]))
-    for exp in experience:
-        if exp.get('company'):
-            story.append(Paragraph(f"<b>{exp.get('company')}</b>", styles["Normal"]))
-            story.append(Paragraph(f"{exp.get('position')} ({exp.get('duration')})", styles["Normal"]))
-            story.append(Paragraph(f"{exp.get('description')}", styles["Normal"]))
+    story.append(Paragraph("Professional Experience", compiled.heading))
+    for exp in as_experience(experience):
+        if exp.company:
+            story.append(Paragraph(f"<b>{exp.company}</b>", normal))
+            story.append(Paragraph(f"{exp.position} ({exp.duration})", normal))
+            story.append(Paragraph(f"{exp.description}", normal))
             story.append(Spacer(1, 10))
 
     # Skills Section
     if skills:
-        story.append(Paragraph("Skills", styles["Heading2"]))
-        skills_text = ", ".join(skills)
-        story.append(Paragraph(skills_text, styles["Normal"]))
+        story.append(Paragraph("Skills", compiled.heading))
+        skills_text = ", ".join(as_skills(skills))
+        story.append(Paragraph(skills_text, normal))
+
+    return story
+
+
+def write_pdf(output, personal_info, education, experience, skills, template):
+    """
+    Render a resume into ``output``.
 
-    doc.build(story)
+    ReportLab still assembles the whole document in memory before writing it
+    out; writing to the caller's file or stream only saves the extra bytes
+    copy that generate_pdf() makes with getvalue().
+
+    Args:
+        output: File path or writable binary stream (temp file, HTTP response, ...)
+    """
+    with metrics.stage_timer('pdf_generation'):
+        compiled = get_template(template)
+        doc = SimpleDocTemplate(output, **compiled.page)
+        doc.build(_build_story(personal_info, education, experience, skills, compiled))
+    metrics.PDF_RENDERS.inc()
+
+
+def iter_pdf(personal_info, education, experience, skills, template, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield the PDF in ``chunk_size`` pieces for chunked responses.
+
+    The document is fully rendered into a buffer first; chunks are sliced from
+    it without a getvalue() copy of the whole file.
+    """
+    buffer = BytesIO()
+    write_pdf(buffer, personal_info, education, experience, skills, template)
+    with buffer.getbuffer() as view:
+        for offset in range(0, len(view), chunk_size):
+            yield bytes(view[offset:offset + chunk_size])
+    buffer.close()
+
+
+def generate_pdf(personal_info, education, experience, skills, template):
+    buffer = BytesIO()
+    write_pdf(buffer, personal_info, education, experience, skills, template)
     pdf_bytes = buffer.getvalue()
     buffer.close()
     return pdf_bytes
+
+
+def _resume_args(resume):
+    if isinstance(resume, Resume):
+        return (resume.personal_info, resume.education, resume.experience, resume.skills, resume.template)
+    return (
+        resume.get('personal_info') or {},
+        resume.get('education') or [],
+        resume.get('experience') or [],
+        resume.get('skills') or [],
+        resume.get('template', DEFAULT_TEMPLATE),
+    )
+
+
+def _generate_from_dict(resume):
+    return generate_pdf(*_resume_args(resume))
+
+
+def _export_to_path(job):
+    resume, path = job
+    write_pdf(path, *_resume_args(resume))
+    return path
+
+
+def generate_pdfs(resumes: Iterable[Dict[str, Any]], chunksize: int = 4) -> List[bytes]:
+    """
+    Render many resumes in parallel on the shared process pool.
+
+    Args:
+        resumes: Resume models, or dicts with 'personal_info', 'education',
+            'experience', 'skills' and 'template' keys
+        chunksize: Resumes handed to a worker per task
+
+    Returns:
+        PDF bytes for each resume, in input order
+    """
+    return list(get_executor().map(_generate_from_dict, resumes, chunksize=chunksize))
+
+
+def export_pdfs(resumes: Iterable[Dict[str, Any]], directory: str, chunksize: int = 4) -> List[str]:
+    """
+    Render many resumes straight to files in ``directory`` on the process pool.
+
+    Workers write the files themselves, so no PDF bytes are pickled back to the
+    caller. Dict resumes may carry a 'file_name'; otherwise resume_<n>.pdf is used.
+
+    Returns:
+        Paths of the written files, in input order
+    """
+    os.makedirs(directory, exist_ok=True)
+    jobs = [
+        (resume, os.path.join(directory, os.path.basename(
+            (isinstance(resume, dict) and resume.get('file_name')) or f"resume_{index}.pdf")))
+        for index, resume in enumerate(resumes)
+    ]
+    return list(get_executor().map(_export_to_path, jobs, chunksize=chunksize))
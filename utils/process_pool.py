@@ -0,0 +1,38 @@
+"""
+Module for the shared process pool used by CPU-bound work.
+
+Resume text extraction and PDF rendering are pure-Python/CPU-heavy, so they run
+in worker processes instead of competing for the Streamlit server's GIL.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from utils.config import PARSER_WORKERS
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # spawn avoids forking the threaded Streamlit server
+                _executor = ProcessPoolExecutor(
+                    max_workers=max_workers or PARSER_WORKERS or None,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Shut down the shared process pool if it was started."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
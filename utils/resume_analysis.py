@@ -0,0 +1,287 @@
+"""
+Module for the in-process resume analysis engine.
+
+Scores extracted resume text against consultant-specific rules (section
+presence, quantified impact, action verbs, weak phrasing, length, contact
+details) and turns failed rules into feedback. The rule table and its
+patterns are built once at import, so each pool worker compiles them a
+single time; a batch is split into chunks and every rule is applied across a
+whole chunk in one pass. Results are cached by content in the 'analysis'
+cache namespace.
+"""
+import json
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from utils.process_pool import get_executor
+from utils.resume_cache import content_key, get_cache
+from utils.text_extraction import structure_lines
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_VERSION = "1"
+
+REQUIRED_SECTIONS = ('experience', 'education', 'skills')
+ACTION_VERBS = frozenset("""
+    accelerated achieved advised analyzed architected assessed automated built championed coached
+    cut created decreased defined delivered designed developed directed drove enabled established
+    evaluated executed expanded facilitated forecasted founded generated grew guided identified
+    implemented improved increased influenced initiated launched led managed mentored modeled
+    negotiated optimized orchestrated organized oversaw partnered piloted pioneered presented
+    prioritized produced rebuilt recommended redesigned reduced restructured revamped saved scaled
+    secured shaped spearheaded streamlined structured synthesized transformed unlocked won
+""".split())
+
+# Target ranges for a one- to two-page consulting resume
+MIN_WORDS, MAX_WORDS = 350, 1000
+MAX_BULLET_WORDS = 40
+QUANTIFIED_TARGET = 0.5
+ACTION_VERB_TARGET = 0.8
+
+_WORD = re.compile(r"[A-Za-z][A-Za-z'&-]*")
+_FIRST_WORD = re.compile(r"^\W*([A-Za-z]+)")
+_DATE_RANGE = re.compile(
+    r'\b(?:19|20)\d{2}\b.*?(?:-|–|—|\bto\b).*?(?:\b(?:19|20)\d{2}\b|present|current)',
+    re.IGNORECASE,
+)
+# Money, percentages, multiples, magnitudes and counts (years are not impact)
+_QUANTIFIED = re.compile(
+    r'[$£€]\s?\d|\d\s?(?:%|percent\b|x\b|bps\b|k\b|mm?\b|bn?\b|million\b|billion\b)'
+    r'|\b(?!(?:19|20)\d{2}\b)\d{2,}(?:,\d{3})*\b|\b\d+[- ](?:person|people|member|country|countries'
+    r'|market|markets|client|clients|site|sites|week|weeks|month|months)\b',
+    re.IGNORECASE,
+)
+_WEAK_PHRASE = re.compile(
+    r'\b(?:responsible for|duties included|helped|assisted(?: with)?|worked on|involved in'
+    r'|participated in|tasked with)\b',
+    re.IGNORECASE,
+)
+_EMAIL = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+_PHONE = re.compile(r'(?:\+?\d{1,3}[ .-]?)?\(?\d{3}\)?[ .-]?\d{3}[ .-]?\d{4}')
+
+
+@dataclass(frozen=True)
+class Features:
+    """Per-resume measurements every rule reads from."""
+    sections: Tuple[str, ...]
+    words: int
+    bullets: int
+    quantified: int
+    action_verbs: int
+    weak_phrases: int
+    long_bullets: int
+    has_email: bool
+    has_phone: bool
+
+
+RuleResult = Tuple[float, str]
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    weight: float
+    evaluate: Callable[[Features], RuleResult]
+
+
+def _ratio(count: int, total: int) -> float:
+    return count / total if total else 0.0
+
+
+def _sections_rule(features: Features) -> RuleResult:
+    missing = [name for name in REQUIRED_SECTIONS if name not in features.sections]
+    score = 1 - len(missing) / len(REQUIRED_SECTIONS)
+    return score, f"Add clearly headed section(s): {', '.join(missing)}." if missing else ''
+
+
+def _summary_rule(features: Features) -> RuleResult:
+    if 'summary' in features.sections:
+        return 1.0, ''
+    return 0.0, "Open with a two- or three-line professional summary."
+
+
+def _quantified_rule(features: Features) -> RuleResult:
+    ratio = _ratio(features.quantified, features.bullets)
+    if ratio >= QUANTIFIED_TARGET:
+        return 1.0, ''
+    return ratio / QUANTIFIED_TARGET, (
+        f"Only {features.quantified} of {features.bullets} experience bullets quantify impact; "
+        f"add figures (%, $, team size, markets) to at least half."
+    )
+
+
+def _action_verb_rule(features: Features) -> RuleResult:
+    ratio = _ratio(features.action_verbs, features.bullets)
+    if ratio >= ACTION_VERB_TARGET:
+        return 1.0, ''
+    return ratio / ACTION_VERB_TARGET, (
+        f"{features.bullets - features.action_verbs} bullet(s) do not start with a strong action verb "
+        f"(e.g. Led, Delivered, Reduced)."
+    )
+
+
+def _weak_phrase_rule(features: Features) -> RuleResult:
+    if not features.weak_phrases:
+        return 1.0, ''
+    return 1 - _ratio(features.weak_phrases, features.bullets), (
+        f"Replace passive phrasing such as 'responsible for' or 'helped' in "
+        f"{features.weak_phrases} bullet(s) with what you delivered."
+    )
+
+
+def _length_rule(features: Features) -> RuleResult:
+    if features.words < MIN_WORDS:
+        return features.words / MIN_WORDS, (
+            f"At {features.words} words the resume is thin; aim for {MIN_WORDS}-{MAX_WORDS}."
+        )
+    if features.words > MAX_WORDS:
+        return max(0.0, 2 - features.words / MAX_WORDS), (
+            f"At {features.words} words the resume is long; trim towards {MAX_WORDS} (two pages)."
+        )
+    return 1.0, ''
+
+
+def _bullet_length_rule(features: Features) -> RuleResult:
+    if not features.long_bullets:
+        return 1.0, ''
+    return 1 - _ratio(features.long_bullets, features.bullets), (
+        f"Shorten {features.long_bullets} bullet(s) to under {MAX_BULLET_WORDS} words."
+    )
+
+
+def _contact_rule(features: Features) -> RuleResult:
+    missing = [label for label, present in (('email', features.has_email), ('phone', features.has_phone))
+               if not present]
+    return 1 - len(missing) / 2, f"Add your {' and '.join(missing)} to the header." if missing else ''
+
+
+RULES: Tuple[Rule, ...] = (
+    Rule('quantified_impact', 3.0, _quantified_rule),
+    Rule('action_verbs', 2.0, _action_verb_rule),
+    Rule('sections', 2.0, _sections_rule),
+    Rule('weak_phrases', 1.5, _weak_phrase_rule),
+    Rule('length', 1.0, _length_rule),
+    Rule('bullet_length', 1.0, _bullet_length_rule),
+    Rule('contact', 1.0, _contact_rule),
+    Rule('summary', 0.5, _summary_rule),
+)
+_TOTAL_WEIGHT = sum(rule.weight for rule in RULES)
+
+
+def _features(resume: Dict[str, Any]) -> Features:
+    sections = resume['sections']
+    experience = sections.get('experience') or resume['paragraphs']
+    # Position headers carry the date range; everything else is an achievement bullet
+    bullets = [paragraph for paragraph in experience if not _DATE_RANGE.search(paragraph)]
+
+    quantified = action_verbs = weak_phrases = long_bullets = 0
+    for bullet in bullets:
+        quantified += bool(_QUANTIFIED.search(bullet))
+        first = _FIRST_WORD.match(bullet)
+        action_verbs += bool(first and first.group(1).lower() in ACTION_VERBS)
+        weak_phrases += bool(_WEAK_PHRASE.search(bullet))
+        long_bullets += len(bullet.split()) > MAX_BULLET_WORDS
+
+    header = '\n'.join(resume['contact']) or resume['text']
+    return Features(
+        sections=tuple(name for name, paragraphs in sections.items() if paragraphs),
+        words=len(_WORD.findall(resume['text'])),
+        bullets=len(bullets),
+        quantified=quantified,
+        action_verbs=action_verbs,
+        weak_phrases=weak_phrases,
+        long_bullets=long_bullets,
+        has_email=bool(_EMAIL.search(header)),
+        has_phone=bool(_PHONE.search(header)),
+    )
+
+
+def _analyze_chunk(resumes: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Score a chunk of structured resumes, applying each rule across the whole chunk."""
+    features = [_features(resume) for resume in resumes]
+    outcomes = {rule.name: [rule.evaluate(item) for item in features] for rule in RULES}
+
+    results = []
+    for index, item in enumerate(features):
+        rules = {}
+        weighted = 0.0
+        for rule in RULES:
+            score, message = outcomes[rule.name][index]
+            weighted += rule.weight * score
+            rules[rule.name] = {'score': round(score, 3), 'passed': not message, 'message': message}
+        results.append({
+            'score': round(100 * weighted / _TOTAL_WEIGHT, 1),
+            'rules': rules,
+            # Highest-weight rules first, so the most valuable fix leads the feedback
+            'feedback': [rules[rule.name]['message'] for rule in RULES if rules[rule.name]['message']],
+            'stats': {'words': item.words, 'bullets': item.bullets, 'quantified': item.quantified,
+                      'action_verbs': item.action_verbs},
+        })
+    return results
+
+
+def _prepare(resume: Union[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Reduce extracted text, a structure_lines() dict or a process_resume() result
+    to what rules read; None for a process_resume() error result.
+    """
+    if isinstance(resume, str):
+        resume = structure_lines(resume.splitlines())
+    elif 'status' in resume:
+        if resume['status'] != 'success':
+            return None
+        resume = resume['data']
+    return {key: resume[key] for key in ('contact', 'sections', 'paragraphs', 'text')}
+
+
+def _cache_key(resume: Dict[str, Any]) -> str:
+    # contact + sections determine paragraphs and text, so they identify the input
+    content = json.dumps([resume['contact'], resume['sections']], separators=(',', ':'), sort_keys=True)
+    return content_key(content.encode('utf-8'), f"analysis-{ANALYSIS_VERSION}")
+
+
+def analyze_batch(resumes: Iterable[Union[str, Dict[str, Any]]], chunksize: int = 32,
+                  parallel: bool = True) -> List[Dict[str, Any]]:
+    """
+    Score many resumes, spreading uncached ones over the process pool.
+
+    Args:
+        resumes: Plain text, structure_lines()/extract_text() dicts or
+            process_resume() results
+        chunksize: Resumes scored per worker task
+        parallel: Use the process pool when more than one chunk is uncached
+
+    Returns:
+        One analysis dict ('score', 'rules', 'feedback', 'stats') per input,
+        in input order; a process_resume() error result yields
+        {'status': 'error', 'message': ...} in its place
+    """
+    resumes = list(resumes)
+    prepared = [_prepare(resume) for resume in resumes]
+    keys = [_cache_key(resume) if resume is not None else None for resume in prepared]
+    cache = get_cache('analysis')
+    results = [cache.get(key) if key is not None else
+               {'status': 'error', 'message': resume.get('message', 'Resume could not be parsed')}
+               for resume, key in zip(resumes, keys)]
+
+    misses = [index for index, result in enumerate(results) if result is None]
+    chunks = [misses[start:start + chunksize] for start in range(0, len(misses), chunksize)]
+    payloads = [[prepared[index] for index in chunk] for chunk in chunks]
+    if parallel and len(chunks) > 1:
+        scored = get_executor().map(_analyze_chunk, payloads)
+    else:
+        scored = map(_analyze_chunk, payloads)
+
+    for chunk, chunk_results in zip(chunks, scored):
+        for index, result in zip(chunk, chunk_results):
+            results[index] = result
+            cache.set(keys[index], result)
+    logger.debug("Analyzed %d resumes (%d cached)", len(results), len(results) - len(misses))
+    return results
+
+
+def analyze_resume(resume: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Score a single resume in the current process."""
+    return analyze_batch([resume], parallel=False)[0]
@@ -0,0 +1,212 @@
+"""
+Module for a content-addressed cache of parsed resumes and analysis results.
+
+Entries are keyed on a BLAKE2 hash of the file bytes plus the producer's
+version, so resubmitting an identical file skips the work entirely. A bounded
+in-memory LRU tier sits in front of an on-disk tier with TTL expiry and
+size-based eviction.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils.config import CACHE_DISK_BYTES, CACHE_MEMORY_ITEMS, CACHE_TTL_SECONDS, data_path
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def content_key(content: bytes, version: str = "") -> str:
+    """
+    Derive a cache key from file bytes and the version of the code consuming them.
+
+    Args:
+        content: Binary content of the file
+        version: Version string of the parser/analyzer producing the cached value
+
+    Returns:
+        Hex digest identifying the (content, version) pair
+    """
+    digest = hashlib.blake2b(content, digest_size=20)
+    digest.update(b"\0" + version.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResumeCache:
+    """Two-tier (memory LRU + disk) cache for JSON-serialisable results."""
+
+    def __init__(self, namespace: str, max_items: int = CACHE_MEMORY_ITEMS,
+                 disk_dir: Optional[str] = None, max_disk_bytes: int = CACHE_DISK_BYTES,
+                 ttl: Optional[float] = CACHE_TTL_SECONDS):
+        """
+        Args:
+            namespace: Name separating this cache's entries from other caches
+            max_items: Entries kept in the in-memory tier
+            disk_dir: Directory of the on-disk tier (defaults to the data directory);
+                pass an empty string to disable the disk tier
+            max_disk_bytes: Size above which the oldest disk entries are evicted
+            ttl: Seconds an entry stays valid, or None for no expiry
+        """
+        self.namespace = namespace
+        self.max_items = max_items
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl = ttl
+        if disk_dir is None:
+            disk_dir = data_path("cache", namespace)
+        self.disk_dir = disk_dir or None
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._counters = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0}
+        self._disk_bytes = 0
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], f"{key}.json")
+
+    def _disk_entries(self):
+        for root, _, names in os.walk(self.disk_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _remember(self, key: str, stored_at: float, value: Any) -> None:
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` when missing or expired."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self._memory.move_to_end(key)
+                    self._counters['memory_hits'] += 1
+                    return entry[1]
+                del self._memory[key]
+
+            value = self._read_disk(key) if self.disk_dir else _MISSING
+            if value is _MISSING:
+                self._counters['misses'] += 1
+                return default
+            self._counters['disk_hits'] += 1
+            return value
+
+    def _read_disk(self, key: str) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as cache_file:
+                record = json.load(cache_file)
+        except (FileNotFoundError, ValueError):
+            return _MISSING
+        if self._expired(record['stored_at']):
+            self._remove(path)
+            return _MISSING
+        self._remember(key, record['stored_at'], record['value'])
+        return record['value']
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` in both tiers, evicting old disk entries if over budget."""
+        stored_at = time.time()
+        with self._lock:
+            self._remember(key, stored_at, value)
+            if not self.disk_dir:
+                return
+            path = self._path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as cache_file:
+                json.dump({'stored_at': stored_at, 'value': value}, cache_file, separators=(",", ":"))
+            os.replace(tmp_path, path)
+            self._disk_bytes += os.path.getsize(path) - previous
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any],
+                       should_cache: Callable[[Any], bool] = lambda value: True) -> Any:
+        """
+        Return the cached value for ``key``, computing and storing it on a miss.
+
+        Args:
+            key: Cache key, usually from content_key()
+            compute: Zero-argument callable producing the value
+            should_cache: Predicate deciding whether a computed value is stored
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = compute()
+        if should_cache(value):
+            self.set(key, value)
+        return value
+
+    def _remove(self, path: str) -> None:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        self._disk_bytes -= size
+
+    def _evict_disk(self) -> None:
+        # Drop expired entries first, then the oldest until back under 90% of the budget
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        target = self.max_disk_bytes * 0.9
+        for path, _, mtime in entries:
+            if self._disk_bytes <= target and not self._expired(mtime):
+                continue
+            self._remove(path)
+            self._counters['evictions'] += 1
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self.disk_dir:
+                for path, _, _ in list(self._disk_entries()):
+                    self._remove(path)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and tier sizes."""
+        with self._lock:
+            lookups = self._counters['memory_hits'] + self._counters['disk_hits'] + self._counters['misses']
+            hits = lookups - self._counters['misses']
+            return {
+                **self._counters,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'memory_items': len(self._memory),
+                'disk_bytes': self._disk_bytes,
+            }
+
+
+_caches: Dict[str, ResumeCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(namespace: str) -> ResumeCache:
+    """Return the process-wide cache for ``namespace`` (e.g. 'parsed', 'analysis')."""
+    with _caches_lock:
+        if namespace not in _caches:
+            _caches[namespace] = ResumeCache(namespace)
+        return _caches[namespace]
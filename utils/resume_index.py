@@ -0,0 +1,441 @@
+"""
+Module for local full-text search over submitted resumes.
+
+Extracted resume text and contact details are kept in SQLite; an inverted
+index maps each term to its postings (document ids and term frequencies).
+New documents land in an in-memory buffer that is searchable immediately and
+is flushed to immutable on-disk segments. Each segment stores its postings
+as flat uint32 arrays that are memory-mapped and sliced without copying, so
+a query only touches the pages of the terms it asks for. Queries support
+required (+term) and excluded (-term) terms and rank matches with BM25.
+
+Usage:
+    python -m utils.resume_index search "python +mckinsey -intern"
+    python -m utils.resume_index stats
+"""
+import argparse
+import heapq
+import json
+import logging
+import math
+import mmap
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from utils.config import data_path
+from utils.resume_cache import content_key
+from utils.resume_parser import NOT_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#&]*(?:[.'-][a-z0-9+#&]+)*")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or our that the their this to was were with".split()
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    content_key TEXT NOT NULL UNIQUE,
+    email TEXT,
+    name TEXT,
+    file_name TEXT,
+    length INTEGER NOT NULL,
+    added_at REAL NOT NULL,
+    text TEXT NOT NULL
+);
+"""
+
+# Postings for one term from one source: parallel (doc ids, term frequencies)
+Postings = Tuple[Any, Any]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase terms with stopwords removed; keeps tokens like c++, c#, m&a and node.js."""
+    return [token for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class _Segment:
+    """Immutable on-disk postings: <name>.terms (JSON) and <name>.postings (uint32s, memory-mapped)."""
+
+    def __init__(self, directory: str, name: str):
+        self.name = name
+        with open(os.path.join(directory, f"{name}.terms"), encoding="utf-8") as terms_file:
+            # term -> [offset, count] in uint32 units; doc ids then frequencies
+            self.terms: Dict[str, List[int]] = json.load(terms_file)
+        self._file = open(os.path.join(directory, f"{name}.postings"), "rb")
+        self._mmap = None
+        if os.fstat(self._file.fileno()).st_size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap).cast("I")
+        else:
+            self._view = memoryview(array("I"))
+
+    def postings(self, term: str) -> Optional[Postings]:
+        entry = self.terms.get(term)
+        if entry is None:
+            return None
+        offset, count = entry
+        return self._view[offset:offset + count], self._view[offset + count:offset + 2 * count]
+
+    def copy(self, term: str) -> Tuple[array, array]:
+        """Copy a term's postings out of the map (used when merging, before the map is closed)."""
+        offset, count = self.terms[term]
+        docs, freqs = array("I"), array("I")
+        itemsize = docs.itemsize
+        docs.frombytes(self._mmap[offset * itemsize:(offset + count) * itemsize])
+        freqs.frombytes(self._mmap[(offset + count) * itemsize:(offset + 2 * count) * itemsize])
+        return docs, freqs
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    @staticmethod
+    def write(directory: str, name: str, postings: Dict[str, Tuple[array, array]]) -> None:
+        terms: Dict[str, List[int]] = {}
+        offset = 0
+        tmp_postings = os.path.join(directory, f"{name}.postings.tmp")
+        with open(tmp_postings, "wb") as output:
+            for term in sorted(postings):
+                docs, freqs = postings[term]
+                docs.tofile(output)
+                freqs.tofile(output)
+                terms[term] = [offset, len(docs)]
+                offset += 2 * len(docs)
+        tmp_terms = os.path.join(directory, f"{name}.terms.tmp")
+        with open(tmp_terms, "w", encoding="utf-8") as output:
+            json.dump(terms, output, separators=(",", ":"))
+        os.replace(tmp_postings, os.path.join(directory, f"{name}.postings"))
+        os.replace(tmp_terms, os.path.join(directory, f"{name}.terms"))
+
+
+class ResumeIndex:
+    """Persistent resume store with an incremental inverted index and BM25 ranking."""
+
+    def __init__(self, directory: Optional[str] = None, flush_every: int = 1000,
+                 max_segments: int = 8):
+        """
+        Args:
+            directory: Where the database and segments live (defaults to the data directory)
+            flush_every: Buffered documents that trigger writing a new segment
+            max_segments: Segment count above which all segments are merged into one
+        """
+        self.directory = directory or data_path("index")
+        self.flush_every = flush_every
+        self.max_segments = max_segments
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(os.path.join(self.directory, "documents.sqlite3"),
+                                     check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+        self._lengths = array("I")
+        self._total_length = 0
+        self._documents = 0
+        self._norms: Optional[array] = None
+        self._buffer: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._buffered = 0
+
+        manifest = self._read_manifest()
+        self._next_segment = manifest["next_segment"]
+        self._indexed_upto = manifest["indexed_upto"]
+        self._segments = [_Segment(self.directory, name) for name in manifest["segments"]]
+        for row in self._conn.execute("SELECT id, length FROM documents ORDER BY id"):
+            self._set_length(row["id"], row["length"])
+            self._documents += 1
+        # Documents stored after the last flush were only buffered; rebuild their postings
+        for row in self._conn.execute("SELECT id, text FROM documents WHERE id > ? ORDER BY id",
+                                      (self._indexed_upto,)):
+            self._buffer_document(row["id"], tokenize(row["text"]))
+
+    # -- persistence -------------------------------------------------------
+
+    @property
+    def _manifest_path(self) -> str:
+        return os.path.join(self.directory, "segments.json")
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(self._manifest_path, encoding="utf-8") as manifest_file:
+                return json.load(manifest_file)
+        except FileNotFoundError:
+            return {"segments": [], "next_segment": 1, "indexed_upto": 0}
+
+    def _write_manifest(self) -> None:
+        tmp_path = self._manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as manifest_file:
+            json.dump({"segments": [segment.name for segment in self._segments],
+                       "next_segment": self._next_segment,
+                       "indexed_upto": self._indexed_upto}, manifest_file)
+        os.replace(tmp_path, self._manifest_path)
+
+    def _new_segment_name(self) -> str:
+        name = f"seg_{self._next_segment:06d}"
+        self._next_segment += 1
+        return name
+
+    def _length_norms(self) -> array:
+        """BM25 length normalisation per doc id, rebuilt only after documents are added."""
+        if self._norms is None:
+            average = self._total_length / max(self._documents, 1) or 1.0
+            self._norms = array("d", (BM25_K1 * (1 - BM25_B + BM25_B * length / average)
+                                      for length in self._lengths))
+        return self._norms
+
+    def _set_length(self, doc_id: int, length: int) -> None:
+        self._norms = None
+        if len(self._lengths) <= doc_id:
+            self._lengths.extend([0] * (doc_id + 1 - len(self._lengths)))
+        self._total_length += length - self._lengths[doc_id]
+        self._lengths[doc_id] = length
+
+    def _buffer_document(self, doc_id: int, tokens: List[str]) -> None:
+        for term, frequency in Counter(tokens).items():
+            self._buffer[term][doc_id] = frequency
+        self._buffered += 1
+
+    def flush(self) -> None:
+        """Write buffered postings to a new segment, merging segments when there are too many."""
+        with self._lock:
+            if not self._buffered:
+                return
+            postings = {
+                term: (array("I", sorted(docs)), array("I", (docs[doc] for doc in sorted(docs))))
+                for term, docs in self._buffer.items()
+            }
+            name = self._new_segment_name()
+            _Segment.write(self.directory, name, postings)
+            self._segments.append(_Segment(self.directory, name))
+            self._indexed_upto = max(self._indexed_upto, len(self._lengths) - 1)
+            self._buffer = defaultdict(dict)
+            self._buffered = 0
+            if len(self._segments) > self.max_segments:
+                self._merge_segments()
+            self._write_manifest()
+
+    def _merge_segments(self) -> None:
+        # Segments hold ascending, disjoint doc id ranges, so concatenation keeps postings sorted
+        merged: Dict[str, Tuple[array, array]] = {}
+        for segment in self._segments:
+            for term in segment.terms:
+                docs, freqs = segment.copy(term)
+                if term in merged:
+                    merged[term][0].extend(docs)
+                    merged[term][1].extend(freqs)
+                else:
+                    merged[term] = (docs, freqs)
+        name = self._new_segment_name()
+        _Segment.write(self.directory, name, merged)
+        old, self._segments = self._segments, [_Segment(self.directory, name)]
+        for segment in old:
+            segment.close()
+            for suffix in (".terms", ".postings"):
+                os.remove(os.path.join(self.directory, segment.name + suffix))
+        logger.info("Merged %d index segments into %s", len(old), name)
+
+    def close(self) -> None:
+        """Flush buffered documents and release the segment maps and database."""
+        with self._lock:
+            self.flush()
+            for segment in self._segments:
+                segment.close()
+            self._segments = []
+            self._conn.close()
+
+    # -- indexing ----------------------------------------------------------
+
+    def add(self, text: str, email: str = "", name: str = "", file_name: str = "") -> int:
+        """
+        Store a resume and index its text; the same text from the same email is stored once.
+
+        Returns:
+            Document id (the existing id when the submitter's text was already indexed)
+        """
+        # Keyed per submitter, so candidates with identical text are each findable
+        key = content_key(text.encode("utf-8"), email.strip().lower())
+        tokens = tokenize(text)
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM documents WHERE content_key = ?", (key,)).fetchone()
+            if row is not None:
+                return row["id"]
+            cursor = self._conn.execute(
+                "INSERT INTO documents (content_key, email, name, file_name, length, added_at, text)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, email, name, file_name, len(tokens), time.time(), text),
+            )
+            doc_id = cursor.lastrowid
+            self._set_length(doc_id, len(tokens))
+            self._documents += 1
+            self._buffer_document(doc_id, tokens)
+            if self._buffered >= self.flush_every:
+                self.flush()
+        return doc_id
+
+    def add_parsed(self, parsed: Dict[str, Any], email: str = "", name: str = "",
+                   file_name: str = "") -> int:
+        """Index a process_resume()/extract_text() result, taking contact details from its profile."""
+        data = parsed.get("data", parsed)
+        contact = data.get("profile", {}).get("contact", {})
+        found = {key: value for key, value in contact.items() if value != NOT_AVAILABLE}
+        return self.add(data["text"], email=email or found.get("email", ""),
+                        name=name or found.get("name", ""), file_name=file_name)
+
+    def __len__(self) -> int:
+        return self._documents
+
+    # -- querying ----------------------------------------------------------
+
+    def _postings(self, term: str) -> Iterator[Postings]:
+        for segment in self._segments:
+            found = segment.postings(term)
+            if found is not None:
+                yield found
+        buffered = self._buffer.get(term)
+        if buffered:
+            yield list(buffered), list(buffered.values())
+
+    def _doc_ids(self, term: str) -> Set[int]:
+        ids: Set[int] = set()
+        for docs, _ in self._postings(term):
+            ids.update(docs)
+        return ids
+
+    @staticmethod
+    def parse_query(query: str) -> Tuple[List[str], List[str], List[str]]:
+        """Split a query into (required, optional, excluded) terms; +term is required, -term excluded."""
+        required, optional, excluded = [], [], []
+        for word in query.split():
+            target = optional
+            if word[0] in "+-" and len(word) > 1:
+                target = required if word[0] == "+" else excluded
+                word = word[1:]
+            target.extend(tokenize(word))
+        return required, optional, excluded
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Rank documents for ``query`` with BM25.
+
+        Documents must contain every +term and none of the -terms; the
+        remaining terms only contribute to the score.
+
+        Returns:
+            Up to ``limit`` dicts with id, score, email, name and file_name,
+            best match first
+        """
+        required, optional, excluded = self.parse_query(query)
+        with self._lock:
+            candidates: Optional[Set[int]] = None
+            for term in required:
+                ids = self._doc_ids(term)
+                candidates = ids if candidates is None else candidates & ids
+                if not candidates:
+                    return []
+            rejected: Set[int] = set()
+            for term in excluded:
+                rejected |= self._doc_ids(term)
+
+            total_docs = len(self)
+            if not total_docs:
+                return []
+            norms = self._length_norms()
+            # Only documents in the query terms' postings are touched; filters apply after scoring
+            scores: Dict[int, float] = {}
+            for term in dict.fromkeys(required + optional):
+                sources = list(self._postings(term))
+                frequency = sum(len(docs) for docs, _ in sources)
+                weight = math.log(1 + (total_docs - frequency + 0.5) / (frequency + 0.5)) * (BM25_K1 + 1)
+                for docs, freqs in sources:
+                    for doc_id, tf in zip(docs, freqs):
+                        scores[doc_id] = scores.get(doc_id, 0.0) + weight * tf / (tf + norms[doc_id])
+
+            matches = (scores.keys() if candidates is None else candidates) - rejected
+            top = heapq.nlargest(limit, matches, key=lambda doc_id: scores.get(doc_id, 0.0))
+            if not top:
+                return []
+            rows = self._conn.execute(
+                f"SELECT id, email, name, file_name FROM documents WHERE id IN ({','.join('?' * len(top))})",
+                top,
+            ).fetchall()
+        details = {row["id"]: dict(row) for row in rows}
+        return [{**details[doc_id], "score": round(scores.get(doc_id, 0.0), 4)} for doc_id in top]
+
+    def document(self, doc_id: int) -> Optional[Dict[str, Any]]:
+        """Return the stored record (including text) for ``doc_id``."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM documents WHERE id = ?", (doc_id,)).fetchone()
+        return dict(row) if row else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "documents": len(self),
+                "segments": len(self._segments),
+                "buffered": self._buffered,
+                "terms": len(set().union(*(segment.terms for segment in self._segments), self._buffer)),
+            }
+
+
+_index: Optional[ResumeIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_resume_index() -> ResumeIndex:
+    """
+    Return the process-wide index in the data directory.
+
+    An index directory has a single writer: the app server adds form
+    submissions here, so run ``batch_ingest --index`` against it while the
+    server is stopped.
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = ResumeIndex()
+        return _index
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Search the local resume index.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    search = commands.add_parser("search", help="ranked search; +term required, -term excluded")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=20)
+    commands.add_parser("stats", help="index size")
+    args = parser.parse_args(argv)
+
+    index = ResumeIndex()
+    try:
+        if args.command == "stats":
+            print(json.dumps(index.stats()))
+            return 0
+        start = time.perf_counter()
+        results = index.search(args.query, args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+        for result in results:
+            print(f"{result['score']:8.3f}  {result['name'] or '-':30s} {result['email'] or '-':35s} "
+                  f"{result['file_name'] or ''}")
+        print(f"{len(results)} result(s) in {elapsed:.1f} ms", file=sys.stderr)
+        return 0
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
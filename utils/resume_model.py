@@ -0,0 +1,212 @@
+"""
+Module for the shared, typed resume data model.
+
+Slotted dataclasses replace the loose dicts previously passed between the
+forms, preview, PDF generator and webhook payload. Each record serialises to a
+compact positional row (a JSON array, or msgpack when installed) instead of a
+dict repeating every key name.
+"""
+import json
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+try:
+    import msgpack
+except ImportError:  # optional dependency
+    msgpack = None
+
+
+def _from_mapping(cls, data: Mapping[str, Any]):
+    # Missing keys fall back to defaults; None values are treated as empty
+    return cls(**{f.name: data.get(f.name) or '' for f in fields(cls) if f.name in data})
+
+
+@dataclass(slots=True)
+class PersonalInfo:
+    """Candidate contact details."""
+    first_name: str = ''
+    last_name: str = ''
+    email: str = ''
+    phone: str = ''
+    name: str = ''
+
+    @property
+    def display_name(self) -> str:
+        return self.name or f"{self.first_name} {self.last_name}".strip()
+
+    def __bool__(self) -> bool:
+        return any((self.first_name, self.last_name, self.email, self.phone, self.name))
+
+    def to_row(self) -> list:
+        return [self.first_name, self.last_name, self.email, self.phone, self.name]
+
+    @classmethod
+    def from_row(cls, row: Sequence[str]) -> "PersonalInfo":
+        return cls(*row)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "PersonalInfo":
+        return _from_mapping(cls, data)
+
+    def to_dict(self) -> Dict[str, str]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True)
+class Education:
+    """One education entry."""
+    institution: str = ''
+    degree: str = ''
+    graduation_year: str = ''
+
+    def to_row(self) -> list:
+        return [self.institution, self.degree, self.graduation_year]
+
+    @classmethod
+    def from_row(cls, row: Sequence[str]) -> "Education":
+        return cls(*row)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Education":
+        education = _from_mapping(cls, data)
+        education.graduation_year = str(education.graduation_year)
+        return education
+
+    def to_dict(self) -> Dict[str, str]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True)
+class Experience:
+    """One position held."""
+    company: str = ''
+    position: str = ''
+    duration: str = ''
+    description: str = ''
+
+    def to_row(self) -> list:
+        return [self.company, self.position, self.duration, self.description]
+
+    @classmethod
+    def from_row(cls, row: Sequence[str]) -> "Experience":
+        return cls(*row)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Experience":
+        return _from_mapping(cls, data)
+
+    def to_dict(self) -> Dict[str, str]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True)
+class Skills:
+    """Ordered list of skill names."""
+    items: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def to_row(self) -> list:
+        return list(self.items)
+
+    @classmethod
+    def from_row(cls, row: Iterable[str]) -> "Skills":
+        return cls([str(item) for item in row])
+
+
+@dataclass(slots=True)
+class Resume:
+    """A complete resume as edited in the builder."""
+    personal_info: PersonalInfo = field(default_factory=PersonalInfo)
+    education: List[Education] = field(default_factory=list)
+    experience: List[Experience] = field(default_factory=list)
+    skills: Skills = field(default_factory=Skills)
+    template: str = 'Classic'
+
+    def to_row(self) -> list:
+        return [
+            self.personal_info.to_row(),
+            [entry.to_row() for entry in self.education],
+            [entry.to_row() for entry in self.experience],
+            self.skills.to_row(),
+            self.template,
+        ]
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "Resume":
+        personal_info, education, experience, skills, template = row
+        return cls(
+            PersonalInfo.from_row(personal_info),
+            [Education.from_row(entry) for entry in education],
+            [Experience.from_row(entry) for entry in experience],
+            Skills.from_row(skills),
+            template,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Resume":
+        """Build from the legacy dict layout (personal_info/education/experience/skills/template)."""
+        return cls(
+            as_personal_info(data.get('personal_info')),
+            as_education(data.get('education')),
+            as_experience(data.get('experience')),
+            as_skills(data.get('skills')),
+            data.get('template') or 'Classic',
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'personal_info': self.personal_info.to_dict(),
+            'education': [entry.to_dict() for entry in self.education],
+            'experience': [entry.to_dict() for entry in self.experience],
+            'skills': self.skills.to_row(),
+            'template': self.template,
+        }
+
+    def dumps(self) -> str:
+        """Serialise to compact JSON (positional rows, no key names or whitespace)."""
+        return json.dumps(self.to_row(), separators=(',', ':'), ensure_ascii=False)
+
+    @classmethod
+    def loads(cls, data: Union[str, bytes]) -> "Resume":
+        return cls.from_row(json.loads(data))
+
+    def packb(self) -> bytes:
+        """Serialise with msgpack (falls back to compact JSON bytes when unavailable)."""
+        if msgpack is None:
+            return self.dumps().encode('utf-8')
+        return msgpack.packb(self.to_row(), use_bin_type=True)
+
+    @classmethod
+    def unpackb(cls, data: bytes) -> "Resume":
+        if msgpack is None:
+            return cls.loads(data)
+        return cls.from_row(msgpack.unpackb(data, raw=False))
+
+
+def as_personal_info(value: Optional[Union[PersonalInfo, Mapping[str, Any]]]) -> PersonalInfo:
+    """Accept a PersonalInfo or a legacy dict."""
+    if isinstance(value, PersonalInfo):
+        return value
+    return PersonalInfo.from_dict(value or {})
+
+
+def as_education(values: Optional[Iterable[Union[Education, Mapping[str, Any]]]]) -> List[Education]:
+    """Accept Education entries or legacy dicts."""
+    return [value if isinstance(value, Education) else Education.from_dict(value) for value in values or []]
+
+
+def as_experience(values: Optional[Iterable[Union[Experience, Mapping[str, Any]]]]) -> List[Experience]:
+    """Accept Experience entries or legacy dicts."""
+    return [value if isinstance(value, Experience) else Experience.from_dict(value) for value in values or []]
+
+
+def as_skills(value: Optional[Union[Skills, Iterable[str]]]) -> Skills:
+    """Accept Skills or a plain list of strings."""
+    if isinstance(value, Skills):
+        return value
+    return Skills.from_row(value or [])
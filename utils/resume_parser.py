@@ -3,32 +3,195 @@ Module for handling resume parsing and processing.
 """
 import logging
 import os
-from typing import Dict, Any
+import re
+from dataclasses import asdict, dataclass
+from typing import Dict, Any, Iterable, List, Optional, Sequence
+
+from utils import text_extraction
+from utils.resume_cache import content_key, get_cache
+from utils.upload_validation import check_upload
 
 logger = logging.getLogger(__name__)
 
-def process_resume(file_path: str, file_content: bytes, file_name: str) -> Dict[str, Any]:
+PARSE_TIMEOUT = 60
+PARSER_VERSION = "1"
+NOT_AVAILABLE = 'No information available'
+
+_MONTH = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.?'
+_DATE = rf'(?:{_MONTH}\s+)?(?:19|20)\d{{2}}'
+_DATE_RANGE = re.compile(
+    rf'{_DATE}\s*(?:-|–|—|to)\s*(?:{_DATE}|Present|Current|Now)', re.IGNORECASE
+)
+
+# One alternation so the text is scanned once for every contact field
+_CONTACT = re.compile(
+    r'(?P<email>[\w.+-]+@[\w-]+(?:\.[\w-]+)+)'
+    r'|(?P<linkedin>(?:https?://)?(?:www\.)?linkedin\.com/in/[\w%-]+/?)'
+    r'|(?P<phone>(?<![\d(])(?:\+?1[ .-]?)?(?:\(\d{3}\)|\d{3})[ .-]?\d{3}[ .-]?\d{4}(?!\d))'
+    r'|(?P<location>\b[A-Z][a-z]+(?: [A-Z][a-z]+)*, ?[A-Z]{2}\b)'
+)
+_CONTACT_FIELDS = ('email', 'linkedin', 'phone', 'location')
+_NAME = re.compile(r"^[A-Z][A-Za-z'.-]+(?:\s+[A-Z][A-Za-z'.-]+){1,3}$")
+_TITLE_COMPANY_SPLIT = re.compile(r'\s+[-–—|@]\s+|\s+at\s+|,\s*')
+_STRIP = ' \t()[]|,-–—'
+
+
+@dataclass(slots=True)
+class ContactInfo:
+    """Contact fields extracted from the top of a resume."""
+    name: str = NOT_AVAILABLE
+    email: str = NOT_AVAILABLE
+    phone: str = NOT_AVAILABLE
+    location: str = NOT_AVAILABLE
+    linkedin: str = NOT_AVAILABLE
+
+    def __getitem__(self, key: str) -> str:
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, str]:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class Position:
+    """Most recent position held by the candidate."""
+    title: str = NOT_AVAILABLE
+    company: str = NOT_AVAILABLE
+    duration: str = NOT_AVAILABLE
+
+    def __getitem__(self, key: str) -> str:
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, str]:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class ResumeProfile:
+    """Contact block and most recent position of one resume."""
+    contact: ContactInfo
+    position: Position
+
+    def to_dict(self) -> Dict[str, Dict[str, str]]:
+        return {'contact': self.contact.to_dict(), 'position': self.position.to_dict()}
+
+
+class ResumeParser:
+    """
+    Regex-based extractor for contact details and the most recent position.
+
+    All patterns are compiled once at import time and the contact fields are
+    found in a single scan of the text.
+    """
+
+    def parse(self, text: str, paragraphs: Optional[Sequence[str]] = None) -> ResumeProfile:
+        """
+        Extract the contact block and most recent position from resume text.
+
+        Args:
+            text: Full resume text
+            paragraphs: Experience paragraphs in document order; defaults to the
+                lines of ``text``
+
+        Returns:
+            ResumeProfile with missing fields set to NOT_AVAILABLE
+        """
+        if paragraphs is None:
+            paragraphs = text.splitlines()
+        return ResumeProfile(self._extract_contact_info(text), self._extract_most_recent_position(paragraphs))
+
+    def parse_many(self, texts: Iterable[str]) -> List[ResumeProfile]:
+        """Parse a batch of resume texts."""
+        parse = self.parse
+        return [parse(text) for text in texts]
+
+    def _extract_contact_info(self, text: str) -> ContactInfo:
+        contact = ContactInfo()
+        for line in text.splitlines()[:5]:
+            line = line.strip()
+            if line:
+                if _NAME.match(line) and '@' not in line:
+                    contact.name = line
+                break
+
+        remaining = len(_CONTACT_FIELDS)
+        for match in _CONTACT.finditer(text):
+            field = match.lastgroup
+            if getattr(contact, field) == NOT_AVAILABLE:
+                setattr(contact, field, match.group(field))
+                remaining -= 1
+                if not remaining:
+                    break
+        return contact
+
+    def _extract_most_recent_position(self, paragraphs: Iterable[str]) -> Position:
+        for paragraph in paragraphs:
+            match = _DATE_RANGE.search(paragraph)
+            if match is None:
+                continue
+            rest = f"{paragraph[:match.start()]} {paragraph[match.end():]}".strip(_STRIP)
+            parts = [part.strip(_STRIP) for part in _TITLE_COMPANY_SPLIT.split(rest, maxsplit=1)]
+            position = Position(duration=match.group(0))
+            if parts and parts[0]:
+                position.title = parts[0]
+            if len(parts) > 1 and parts[1]:
+                position.company = parts[1]
+            return position
+        return Position()
+
+
+_parser = ResumeParser()
+
+def _extract_and_profile(file_content: bytes, file_name: str) -> Dict[str, Any]:
+    data = text_extraction.submit(file_content, file_name).result(timeout=PARSE_TIMEOUT)
+    experience = data['sections'].get('experience') or data['paragraphs']
+    data['profile'] = _parser.parse(data['text'], experience).to_dict()
+    return data
+
+def process_resume(file_path: str, file_content: Optional[bytes], file_name: str) -> Dict[str, Any]:
     """
     Process the uploaded resume file.
 
+    Text extraction runs on the shared process pool so PDF decoding does not
+    block the calling thread's interpreter. Results are cached by content hash,
+    so resubmitting an identical file returns without re-parsing.
+
     Args:
-        file_path: Path to the temporary file
+        file_path: Path to the temporary file (read when file_content is None)
         file_content: Binary content of the file
         file_name: Original filename
 
     Returns:
-        Dict containing processing status
+        Dict containing processing status and, on success, the extracted
+        contact block, sections, paragraphs, text and parsed profile under 'data'
     """
     try:
-        logger.info(f"Processing resume file: {file_name}")
-        # The actual processing will be handled by Zapier
+        logger.info("Processing resume file: %s", file_name)
+        if file_content is None:
+            with open(file_path, 'rb') as resume_file:
+                file_content = resume_file.read()
+        file_name = file_name or os.path.basename(file_path or '')
+        upload_error = check_upload(file_content, file_name)
+        if upload_error:
+            return {
+                'status': 'error',
+                'message': f'Invalid file: {upload_error}'
+            }
+        cache_key = content_key(
+            file_content, f"extractor-{text_extraction.EXTRACTOR_VERSION}/parser-{PARSER_VERSION}"
+        )
+        data = get_cache('parsed').get_or_compute(
+            cache_key, lambda: _extract_and_profile(file_content, file_name)
+        )
         return {
             'status': 'success',
-            'message': 'Resume ready for processing'
+            'message': 'Resume ready for processing',
+            'cache_key': cache_key,
+            'data': data
         }
     except Exception as e:
-        logger.error(f"Error processing resume: {str(e)}")
+        logger.error("Error processing resume: %s", e)
         return {
             'status': 'error',
             'message': f'Error processing file: {str(e)}'
-        }
\ No newline at end of file
+        }
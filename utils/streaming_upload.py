@@ -0,0 +1,139 @@
+"""
+Module for streaming multipart/form-data uploads.
+
+Builds the request body lazily from a file object so a resume is read from the
+upload (or its spooled copy) in fixed-size chunks while it is being sent,
+rather than being copied into one in-memory multipart body first.
+"""
+import io
+import os
+import shutil
+import uuid
+from typing import IO, Iterator, List, Mapping, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def file_size(fileobj: IO[bytes]) -> int:
+    """
+    Return the size of a seekable file object without reading it.
+
+    Args:
+        fileobj: Seekable binary file object
+
+    Returns:
+        Size in bytes; the current position is left unchanged
+    """
+    position = fileobj.tell()
+    try:
+        fileobj.seek(0, os.SEEK_END)
+        return fileobj.tell()
+    finally:
+        fileobj.seek(position)
+
+
+def as_file(content: Union[bytes, IO[bytes]]) -> IO[bytes]:
+    """Wrap raw bytes in a file object; file objects are returned unchanged."""
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return io.BytesIO(content)
+    return content
+
+
+def copy_to_path(content: Union[bytes, IO[bytes]], path: str,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Write bytes or a file object to ``path`` chunk by chunk.
+
+    Returns:
+        Number of bytes written
+    """
+    source = as_file(content)
+    source.seek(0)
+    with open(path, "wb") as target:
+        shutil.copyfileobj(source, target, chunk_size)
+        return target.tell()
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartStream:
+    """
+    File-like multipart/form-data body that reads the file part on demand.
+
+    The total length is computed up front (the file is sized via seek/tell), so
+    requests sends a regular Content-Length body and reads it through ``read``
+    in small blocks; peak memory per upload is bounded by the chunk size.
+    """
+
+    def __init__(self, fields: Mapping[str, str], file_field: Optional[str] = None,
+                 file_name: Optional[str] = None, fileobj: Optional[IO[bytes]] = None,
+                 file_type: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 boundary: Optional[str] = None):
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self._parts: List[Union[bytes, IO[bytes]]] = []
+        self._length = 0
+
+        for name, value in fields.items():
+            self._add(
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"'
+                f'\r\n\r\n'.encode("utf-8") + str(value).encode("utf-8") + b"\r\n"
+            )
+
+        if fileobj is not None:
+            header = (
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(file_field or "file")}";'
+                f' filename="{_quote(file_name or "upload")}"\r\n'
+                f'Content-Type: {file_type or "application/octet-stream"}\r\n\r\n'
+            )
+            self._add(header.encode("utf-8"))
+            fileobj.seek(0)
+            self._parts.append(fileobj)
+            self._length += file_size(fileobj)
+            self._add(b"\r\n")
+
+        self._add(f"--{self.boundary}--\r\n".encode("utf-8"))
+        self._index = 0
+        self._offset = 0
+
+    def _add(self, data: bytes) -> None:
+        self._parts.append(data)
+        self._length += len(data)
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes (at most one chunk when size is negative)."""
+        if size is None or size < 0:
+            size = self.chunk_size
+        size = min(size, self.chunk_size)
+        out = bytearray()
+        while len(out) < size and self._index < len(self._parts):
+            part = self._parts[self._index]
+            if isinstance(part, bytes):
+                piece = part[self._offset:self._offset + size - len(out)]
+                self._offset += len(piece)
+                if self._offset >= len(part):
+                    self._index += 1
+                    self._offset = 0
+            else:
+                piece = part.read(size - len(out))
+                if not piece:
+                    self._index += 1
+                    continue
+            out += piece
+        return bytes(out)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
@@ -0,0 +1,187 @@
+"""
+Module for local text extraction from PDF and DOCX resumes.
+
+Turns uploaded file bytes into structured text (contact block, sections and
+paragraphs). PDF decoding is CPU-bound, so extraction runs in a shared
+process pool to keep it off the Streamlit server's GIL; a batch API
+parses many files in parallel.
+"""
+import io
+import logging
+import os
+import re
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.process_pool import get_executor
+
+logger = logging.getLogger(__name__)
+
+EXTRACTOR_VERSION = "1"
+
+SECTION_HEADINGS = {
+    'summary': 'summary', 'professional summary': 'summary', 'profile': 'summary',
+    'objective': 'summary', 'about': 'summary',
+    'experience': 'experience', 'professional experience': 'experience',
+    'work experience': 'experience', 'employment': 'experience',
+    'employment history': 'experience', 'career history': 'experience',
+    'consulting experience': 'experience',
+    'education': 'education', 'academic background': 'education',
+    'skills': 'skills', 'technical skills': 'skills', 'core competencies': 'skills',
+    'skills & interests': 'skills', 'skills and interests': 'skills',
+    'certifications': 'certifications', 'licenses & certifications': 'certifications',
+    'publications': 'publications', 'awards': 'awards', 'honors': 'awards',
+    'languages': 'languages', 'interests': 'interests',
+    'additional information': 'additional', 'leadership': 'leadership',
+    'volunteer experience': 'volunteer', 'projects': 'projects',
+}
+
+_HEADING_CLEANUP = re.compile(r'[^a-z& ]+')
+_WHITESPACE = re.compile(r'[ \t\u00a0]+')
+# PDF text extraction often maps bullet glyphs to private-use or control characters
+_BULLET = re.compile('^[\u2022\u25cf\u25aa\u25e6\u25a0\u25cb\u2013\uf0b7\uf0a7\x7f*-]\\s*')
+_DATE_RANGE = re.compile(
+    r'\b(?:19|20)\d{2}\b.*?(?:-|–|—|\bto\b).*?(?:\b(?:19|20)\d{2}\b|present|current)',
+    re.IGNORECASE,
+)
+
+def _detect_type(content: bytes, file_name: str) -> str:
+    if content[:5] == b'%PDF-':
+        return 'pdf'
+    if content[:4] == b'PK\x03\x04':
+        return 'docx'
+    extension = os.path.splitext(file_name or '')[1].lower().lstrip('.')
+    if extension in ('pdf', 'docx'):
+        return extension
+    raise ValueError(f"Unsupported file type: {file_name}")
+
+
+def _pdf_lines(content: bytes) -> List[str]:
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(io.BytesIO(content))
+    lines: List[str] = []
+    for page in reader.pages:
+        lines.extend((page.extract_text() or '').splitlines())
+        lines.append('')
+    return lines
+
+
+def _docx_lines(content: bytes) -> List[str]:
+    import docx
+
+    document = docx.Document(io.BytesIO(content))
+    lines = [paragraph.text for paragraph in document.paragraphs]
+    for table in document.tables:
+        for row in table.rows:
+            lines.append(' | '.join(cell.text.strip() for cell in row.cells if cell.text.strip()))
+    return lines
+
+
+def _section_key(line: str) -> Optional[str]:
+    if len(line) > 40:
+        return None
+    return SECTION_HEADINGS.get(_HEADING_CLEANUP.sub('', line.lower()).strip())
+
+
+def structure_lines(lines: Iterable[str]) -> Dict[str, Any]:
+    """
+    Group raw text lines into a contact block, sections and paragraphs.
+
+    Lines before the first recognised heading form the contact block. Blank
+    lines, bullet markers and lines carrying a date range (position headers)
+    start new paragraphs.
+
+    Args:
+        lines: Raw text lines in document order
+
+    Returns:
+        Dict with 'contact', 'sections', 'paragraphs' and 'text' keys
+    """
+    contact: List[str] = []
+    sections: Dict[str, List[str]] = {}
+    paragraphs: List[str] = []
+    current_section: Optional[str] = None
+    current: List[str] = []
+
+    def flush() -> None:
+        if current:
+            paragraph = ' '.join(current)
+            paragraphs.append(paragraph)
+            if current_section is not None:
+                sections[current_section].append(paragraph)
+            current.clear()
+
+    for raw in lines:
+        line = _WHITESPACE.sub(' ', raw).strip()
+        if not line:
+            flush()
+            continue
+        heading = _section_key(line)
+        if heading is not None:
+            flush()
+            current_section = heading
+            sections.setdefault(heading, [])
+            continue
+        if current_section is None:
+            contact.append(line)
+            continue
+        if _BULLET.match(line):
+            flush()
+            line = _BULLET.sub('', line)
+        elif _DATE_RANGE.search(line):
+            flush()
+        current.append(line)
+    flush()
+
+    text = '\n'.join(contact + paragraphs)
+    return {'contact': contact, 'sections': sections, 'paragraphs': paragraphs, 'text': text}
+
+
+def extract_text(content: bytes, file_name: str = '') -> Dict[str, Any]:
+    """
+    Extract structured text from PDF or DOCX bytes in the current process.
+
+    Args:
+        content: Binary content of the file
+        file_name: Original filename, used when the type cannot be sniffed
+
+    Returns:
+        Dict with 'file_type', 'contact', 'sections', 'paragraphs' and 'text'
+    """
+    file_type = _detect_type(content, file_name)
+    lines = _pdf_lines(content) if file_type == 'pdf' else _docx_lines(content)
+    result = structure_lines(lines)
+    result['file_type'] = file_type
+    return result
+
+
+def submit(content: bytes, file_name: str = '') -> Future:
+    """Schedule extraction of one file on the process pool."""
+    return get_executor().submit(extract_text, content, file_name)
+
+
+def _extract_safely(content: bytes, file_name: str) -> Dict[str, Any]:
+    try:
+        return {'status': 'success', 'file_name': file_name, 'data': extract_text(content, file_name)}
+    except Exception as e:
+        return {'status': 'error', 'file_name': file_name, 'message': str(e)}
+
+
+def extract_batch(files: Iterable[Tuple[str, bytes]], chunksize: int = 4) -> List[Dict[str, Any]]:
+    """
+    Extract many files in parallel on the process pool.
+
+    Args:
+        files: Iterable of (file_name, file_content) pairs
+        chunksize: Files handed to a worker per task
+
+    Returns:
+        One result dict per input file, in input order; failures are reported
+        with status 'error' instead of aborting the batch
+    """
+    names, contents = [], []
+    for file_name, content in files:
+        names.append(file_name)
+        contents.append(content)
+    return list(get_executor().map(_extract_safely, contents, names, chunksize=chunksize))
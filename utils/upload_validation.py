@@ -0,0 +1,170 @@
+"""
+Module for cheap pre-validation of uploaded resumes.
+
+Runs before any webhook or parse work: the file is sized with seek/tell, its
+first bytes are matched against the PDF and ZIP magic numbers, PDFs are
+checked for a trailing %%EOF and have their page tree counted by scanning the
+raw bytes, and DOCX files have only their ZIP central directory read (no
+member is inflated apart from the tiny docProps/app.xml). Corrupt, mislabelled
+or oversized files are rejected in milliseconds instead of costing a full
+upload and downstream round trip.
+"""
+import logging
+import os
+import re
+import zipfile
+from typing import IO, NamedTuple, Optional, Union
+
+from utils import metrics
+from utils.config import UPLOAD_MAX_BYTES, UPLOAD_MAX_PAGES, UPLOAD_MAX_UNCOMPRESSED
+from utils.streaming_upload import as_file, file_size
+
+logger = logging.getLogger(__name__)
+
+PDF_MAGIC = b'%PDF-'
+ZIP_MAGIC = b'PK\x03\x04'
+DOCX_DOCUMENT = 'word/document.xml'
+
+_HEADER_BYTES = 1024
+_TRAILER_BYTES = 1024
+_SCAN_CHUNK = 1024 * 1024
+_SCAN_OVERLAP = 8 * 1024
+_APP_XML_MAX = 64 * 1024
+
+# Page tree root (/Type /Pages ... /Count N, keys in either order) and leaf pages
+_PAGES_COUNT = re.compile(
+    rb'/Type\s*/Pages\b[^>]{0,4000}?/Count\s+(\d+)|/Count\s+(\d+)[^>]{0,4000}?/Type\s*/Pages\b'
+)
+_PAGE_LEAF = re.compile(rb'/Type\s*/Page(?![A-Za-z])')
+_APP_PAGES = re.compile(rb'<Pages>(\d+)</Pages>')
+
+
+class InvalidUpload(ValueError):
+    """Raised when an upload fails pre-validation; the message is safe to show users."""
+
+
+class UploadInfo(NamedTuple):
+    file_type: str
+    size: int
+    pages: Optional[int]
+
+
+def _pdf_page_count(fileobj: IO[bytes]) -> Optional[int]:
+    """
+    Count pages by scanning the raw bytes in chunks, without parsing objects.
+
+    Returns the /Count of the page tree root when it is visible, otherwise the
+    number of leaf /Page objects, or None when both live in compressed object
+    streams.
+    """
+    fileobj.seek(0)
+    root_count = 0
+    leaves = 0
+    carry = b''
+    while True:
+        chunk = fileobj.read(_SCAN_CHUNK)
+        if not chunk:
+            break
+        buffer = carry + chunk
+        # Matches ending inside the carried-over tail were counted last round
+        for match in _PAGE_LEAF.finditer(buffer):
+            if match.end() > len(carry):
+                leaves += 1
+        for match in _PAGES_COUNT.finditer(buffer):
+            root_count = max(root_count, int(match.group(1) or match.group(2)))
+        carry = buffer[-_SCAN_OVERLAP:]
+    return root_count or leaves or None
+
+
+def _inspect_pdf(fileobj: IO[bytes], size: int) -> Optional[int]:
+    fileobj.seek(max(0, size - _TRAILER_BYTES))
+    if b'%%EOF' not in fileobj.read(_TRAILER_BYTES):
+        raise InvalidUpload("the PDF appears to be truncated or corrupt")
+    return _pdf_page_count(fileobj)
+
+
+def _inspect_docx(fileobj: IO[bytes]) -> Optional[int]:
+    fileobj.seek(0)
+    try:
+        # ZipFile only reads the end-of-central-directory record and the directory itself
+        archive = zipfile.ZipFile(fileobj)
+    except zipfile.BadZipFile:
+        raise InvalidUpload("the DOCX file appears to be truncated or corrupt") from None
+
+    with archive:
+        entries = {info.filename: info for info in archive.infolist()}
+        if DOCX_DOCUMENT not in entries:
+            raise InvalidUpload("the file is not a Word document")
+        if sum(info.file_size for info in entries.values()) > UPLOAD_MAX_UNCOMPRESSED:
+            raise InvalidUpload("the DOCX file expands beyond the allowed size")
+
+        app = entries.get('docProps/app.xml')
+        if app is None or app.file_size > _APP_XML_MAX:
+            return None
+        try:
+            match = _APP_PAGES.search(archive.read(app))
+        except (zipfile.BadZipFile, OSError, EOFError):
+            raise InvalidUpload("the DOCX file appears to be truncated or corrupt") from None
+        return int(match.group(1)) if match else None
+
+
+def inspect_upload(content: Union[bytes, IO[bytes]], file_name: str = '',
+                   max_bytes: int = UPLOAD_MAX_BYTES,
+                   max_pages: int = UPLOAD_MAX_PAGES) -> UploadInfo:
+    """
+    Validate an upload from its size, leading bytes and container metadata.
+
+    Args:
+        content: Raw bytes or a seekable binary file object (position is restored)
+        file_name: Original filename; its extension must agree with the content
+        max_bytes: Largest accepted file size
+        max_pages: Largest accepted page count (0 disables the check)
+
+    Returns:
+        UploadInfo with the detected type, size and page count (None if unknown)
+
+    Raises:
+        InvalidUpload: If the file is empty, too large, of the wrong type,
+            corrupt, or has too many pages
+    """
+    fileobj = as_file(content)
+    position = fileobj.tell()
+    try:
+        size = file_size(fileobj)
+        if size == 0:
+            raise InvalidUpload("the file is empty")
+        if size > max_bytes:
+            raise InvalidUpload(
+                f"the file is {size / (1024 * 1024):.1f}MB; the limit is {max_bytes / (1024 * 1024):.0f}MB"
+            )
+
+        fileobj.seek(0)
+        head = fileobj.read(_HEADER_BYTES)
+        if PDF_MAGIC in head:
+            file_type = 'pdf'
+        elif head.startswith(ZIP_MAGIC):
+            file_type = 'docx'
+        else:
+            raise InvalidUpload("the file is not a PDF or DOCX document")
+
+        extension = os.path.splitext(file_name or '')[1].lower().lstrip('.')
+        if extension and extension != file_type:
+            raise InvalidUpload(f"the file is named .{extension} but contains a {file_type.upper()} document")
+
+        pages = _inspect_pdf(fileobj, size) if file_type == 'pdf' else _inspect_docx(fileobj)
+        if max_pages and pages is not None and pages > max_pages:
+            raise InvalidUpload(f"the document has {pages} pages; the limit is {max_pages}")
+        return UploadInfo(file_type, size, pages)
+    finally:
+        fileobj.seek(position)
+
+
+def check_upload(content: Union[bytes, IO[bytes]], file_name: str = '', **limits) -> Optional[str]:
+    """Return why the upload is rejected, or None if it passes pre-validation."""
+    with metrics.stage_timer('upload_validation'):
+        try:
+            inspect_upload(content, file_name, **limits)
+        except InvalidUpload as e:
+            logger.info("Rejected upload %s: %s", file_name, e)
+            return str(e)
+    return None
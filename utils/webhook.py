@@ -0,0 +1,101 @@
+"""
+Module for delivering form submissions to the downstream webhook.
+"""
+import logging
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+from utils import http_transport, idempotency, metrics
+from utils.config import WEBHOOK_URL
+from utils.resume_model import PersonalInfo, as_personal_info
+from utils.streaming_upload import MultipartStream, as_file, file_size
+
+logger = logging.getLogger(__name__)
+
+
+def build_payload(form_data: Union[dict, PersonalInfo]) -> dict:
+    """Stamp the submission time and return the form fields the webhook expects."""
+    timestamp = datetime.now(timezone.utc).isoformat()
+    if isinstance(form_data, dict):
+        form_data['timestamp'] = timestamp
+    personal_info = as_personal_info(form_data)
+
+    return {
+        "first_name": personal_info.first_name.strip(),
+        "last_name": personal_info.last_name.strip(),
+        "email": personal_info.email.strip(),
+        "timestamp": timestamp
+    }
+
+
+def send_to_webhook(form_data: Union[dict, PersonalInfo], file_data: Optional[tuple] = None) -> bool:
+    """
+    Send form data to webhook with improved logging and validation.
+
+    Submissions are keyed by email + file content: a key already delivered from
+    this process within the idempotency window is skipped and reported as
+    delivered, one still in flight is reported as not delivered (so callers
+    retry it), and the key is sent as an Idempotency-Key header.
+    """
+    key = None
+    try:
+        webhook_url = WEBHOOK_URL
+        logger.info("Initiating webhook submission...")
+
+        if not webhook_url:
+            logger.error("Webhook URL not configured")
+            return False
+
+        with metrics.stage_timer('serialization'):
+            payload = build_payload(form_data)
+            fileobj = as_file(file_data[1]) if file_data else None
+            key = idempotency.idempotency_key(payload['email'], fileobj)
+            if not idempotency.recent_keys().claim(key):
+                if idempotency.recent_keys().is_sent(key):
+                    key = None
+                    metrics.WEBHOOK_REQUESTS.inc('duplicate')
+                    logger.info("Skipping duplicate webhook submission")
+                    return True
+                # The first attempt may still fail, so this one has not been delivered
+                key = None
+                metrics.WEBHOOK_REQUESTS.inc('in_flight')
+                logger.warning("Identical webhook submission already in flight")
+                return False
+
+            data, headers = payload, {idempotency.HEADER: key}
+            if file_data:
+                file_name, _, file_type = file_data
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("File details - Name: %s, Type: %s, Size: %d bytes",
+                                 file_name, file_type, file_size(fileobj))
+                # Stream the multipart body from the file instead of building it in memory
+                data = MultipartStream(payload, 'resume', file_name, fileobj, file_type)
+                headers['Content-Type'] = data.content_type
+
+        with metrics.stage_timer('http_round_trip'):
+            response = http_transport.post(
+                webhook_url,
+                data=data,
+                headers=headers,
+                timeout=30
+            )
+
+        if response.status_code == 200:
+            idempotency.recent_keys().mark_sent(key)
+            metrics.WEBHOOK_REQUESTS.inc('success')
+            logger.info("Webhook submission successful")
+            return True
+        else:
+            metrics.WEBHOOK_REQUESTS.inc('failure')
+            logger.error("Webhook failed. Status: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Webhook response body: %.500s", response.text)
+            idempotency.recent_keys().release(key)
+            return False
+
+    except Exception as e:
+        metrics.WEBHOOK_REQUESTS.inc('error')
+        logger.error("Error sending data to webhook: %s", e)
+        if key is not None:
+            idempotency.recent_keys().release(key)
+        return False
@@ -0,0 +1,367 @@
+"""
+Module for durable, asynchronous webhook delivery.
+
+Submissions are written to a local SQLite queue (with uploaded files spooled
+to disk) and acknowledged immediately. A pool of worker threads drains the
+queue in the background, retrying failed deliveries with exponential backoff
+and moving submissions that keep failing to a dead-letter state.
+"""
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from utils import job_status, metrics
+from utils.config import IDEMPOTENCY_TTL_SECONDS, data_path
+from utils.idempotency import idempotency_key
+from utils.logging_config import correlation_scope, get_correlation_id
+from utils.resume_model import PersonalInfo
+from utils.streaming_upload import copy_to_path
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+DELIVERED = "delivered"
+DEAD = "dead"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload TEXT NOT NULL,
+    file_name TEXT,
+    file_type TEXT,
+    file_path TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    enqueued_at REAL NOT NULL,
+    delivered_at REAL,
+    last_error TEXT,
+    correlation_id TEXT,
+    idempotency_key TEXT,
+    job_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_submissions_due ON submissions (status, next_attempt_at);
+"""
+
+DeliverFn = Callable[[dict, Optional[tuple]], bool]
+# Called with (job_id, job state, detail) as a job's submission moves through the queue
+StatusFn = Callable[[str, str, Optional[str]], Any]
+
+
+class WebhookQueue:
+    """Disk-backed submission queue drained by a background worker pool."""
+
+    def __init__(self, deliver: DeliverFn, db_path: Optional[str] = None,
+                 spool_dir: Optional[str] = None, workers: int = 2,
+                 max_attempts: int = 5, base_delay: float = 2.0,
+                 max_delay: float = 300.0, poll_interval: float = 1.0,
+                 on_status: Optional[StatusFn] = None):
+        """
+        Args:
+            deliver: Callable performing one delivery attempt; returns True on success
+            db_path: SQLite database file (defaults to the data directory)
+            spool_dir: Directory where uploaded files are kept until delivered
+            workers: Number of delivery threads
+            max_attempts: Attempts before a submission is dead-lettered
+            base_delay: Backoff delay in seconds after the first failure
+            max_delay: Upper bound for the backoff delay in seconds
+            poll_interval: Longest time an idle worker sleeps between queue checks
+            on_status: Told about job state changes (queued, uploading, delivered,
+                failed) of submissions enqueued with a job id, e.g. JobStore.transition
+        """
+        self.deliver = deliver
+        self.on_status = on_status
+        self.db_path = db_path or data_path("webhook_queue.sqlite3")
+        self.spool_dir = spool_dir or data_path("spool")
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+
+        os.makedirs(self.spool_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._latencies: Deque[float] = deque(maxlen=1000)
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(submissions)")}
+        if "correlation_id" not in columns:
+            self._conn.execute("ALTER TABLE submissions ADD COLUMN correlation_id TEXT")
+        if "idempotency_key" not in columns:
+            self._conn.execute("ALTER TABLE submissions ADD COLUMN idempotency_key TEXT")
+        if "job_id" not in columns:
+            self._conn.execute("ALTER TABLE submissions ADD COLUMN job_id TEXT")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_submissions_key ON submissions (idempotency_key, enqueued_at)"
+        )
+
+    def _find_duplicate(self, key: str, now: float) -> Optional[int]:
+        row = self._conn.execute(
+            "SELECT id FROM submissions WHERE idempotency_key = ? AND enqueued_at > ? AND status != ?"
+            " ORDER BY id LIMIT 1", (key, now - IDEMPOTENCY_TTL_SECONDS, DEAD),
+        ).fetchone()
+        return row["id"] if row else None
+
+    def enqueue(self, form_data: Union[dict, PersonalInfo], file_data: Optional[tuple] = None,
+                job_id: Optional[str] = None) -> int:
+        """
+        Persist a submission for background delivery.
+
+        A submission with the same email and file content as one queued within
+        the idempotency window (and not dead-lettered) is not stored again.
+
+        Args:
+            form_data: Form fields to forward to the webhook
+            file_data: Optional (file_name, file_content, file_type) tuple; the
+                content may be bytes or a file object and is spooled in chunks
+            job_id: Job whose state follows this submission (see ``on_status``)
+
+        Returns:
+            Queue id of the stored submission, or of the earlier duplicate
+        """
+        if isinstance(form_data, PersonalInfo):
+            form_data = form_data.to_dict()
+        key = idempotency_key(form_data.get("email", ""), file_data[1] if file_data else None)
+        with self._lock:
+            duplicate = self._find_duplicate(key, time.time())
+        if duplicate is not None:
+            logger.info("Submission is a duplicate of queued submission %s", duplicate)
+            return duplicate
+
+        file_name = file_type = file_path = None
+        if file_data:
+            file_name, file_content, file_type = file_data
+            file_path = os.path.join(self.spool_dir, uuid.uuid4().hex)
+            with metrics.stage_timer('upload_read'):
+                copy_to_path(file_content, file_path)
+
+        now = time.time()
+        with self._lock:
+            # A concurrent rerun may have queued the same submission while we spooled
+            duplicate = self._find_duplicate(key, now)
+            if duplicate is None:
+                cursor = self._conn.execute(
+                    "INSERT INTO submissions (payload, file_name, file_type, file_path, status,"
+                    " next_attempt_at, enqueued_at, correlation_id, idempotency_key, job_id)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (json.dumps(form_data), file_name, file_type, file_path, PENDING, now, now,
+                     get_correlation_id(), key, job_id),
+                )
+                submission_id = cursor.lastrowid
+        if duplicate is not None:
+            if file_path:
+                os.remove(file_path)
+            logger.info("Submission is a duplicate of queued submission %s", duplicate)
+            return duplicate
+
+        logger.info("Queued submission %s for webhook delivery", submission_id)
+        with self._wakeup:
+            self._wakeup.notify()
+        return submission_id
+
+    def start(self) -> None:
+        """
+        Start the worker pool, recovering submissions left in flight by a crash.
+
+        Recovery assumes in-flight rows belong to a previous run, so only one
+        process (the app server) should start workers on a queue database;
+        others may enqueue without starting.
+        """
+        if self._threads:
+            return
+        with self._lock:
+            self._conn.execute(
+                "UPDATE submissions SET status = ? WHERE status = ?", (PENDING, IN_FLIGHT)
+            )
+        self._stopping.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._run, name=f"webhook-worker-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Signal the workers to exit and wait for them to finish."""
+        self._stopping.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def close(self) -> None:
+        """Stop the workers and close the database connection."""
+        self.stop()
+        self._conn.close()
+
+    def depth(self) -> int:
+        """Return the number of submissions still awaiting delivery."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM submissions WHERE status IN (?, ?)", (PENDING, IN_FLIGHT)
+            ).fetchone()
+        return row[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report queue depth per status and recent delivery latency.
+
+        Returns:
+            Dict with per-status counts and latency figures in seconds
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM submissions GROUP BY status"
+            ).fetchall()
+        counts = {PENDING: 0, IN_FLIGHT: 0, DELIVERED: 0, DEAD: 0}
+        counts.update({row[0]: row[1] for row in rows})
+
+        latencies = sorted(self._latencies)
+        latency = {'count': len(latencies), 'mean': None, 'p50': None, 'p95': None, 'max': None}
+        if latencies:
+            latency.update({
+                'mean': sum(latencies) / len(latencies),
+                'p50': latencies[int(0.50 * (len(latencies) - 1))],
+                'p95': latencies[int(0.95 * (len(latencies) - 1))],
+                'max': latencies[-1],
+            })
+        return {'depth': counts[PENDING] + counts[IN_FLIGHT], 'counts': counts, 'latency': latency}
+
+    def dead_letters(self) -> List[Dict[str, Any]]:
+        """Return submissions that exhausted their delivery attempts."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, payload, file_name, attempts, last_error FROM submissions"
+                " WHERE status = ? ORDER BY id", (DEAD,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def requeue_dead_letters(self) -> int:
+        """Move dead-lettered submissions back to pending with a fresh attempt budget."""
+        with self._lock:
+            jobs = [row["job_id"] for row in self._conn.execute(
+                "SELECT job_id FROM submissions WHERE status = ? AND job_id IS NOT NULL", (DEAD,)
+            )]
+            cursor = self._conn.execute(
+                "UPDATE submissions SET status = ?, attempts = 0, next_attempt_at = ?"
+                " WHERE status = ?", (PENDING, time.time(), DEAD)
+            )
+        for job_id in jobs:
+            self._notify(job_id, job_status.QUEUED, "requeued")
+        with self._wakeup:
+            self._wakeup.notify_all()
+        return cursor.rowcount
+
+    def _claim(self) -> Tuple[Optional[sqlite3.Row], Optional[float]]:
+        """Atomically take the next due submission; otherwise return when one is due."""
+        now = time.time()
+        with self._lock:
+            while True:
+                row = self._conn.execute(
+                    "SELECT * FROM submissions WHERE status = ? ORDER BY next_attempt_at LIMIT 1",
+                    (PENDING,),
+                ).fetchone()
+                if row is None:
+                    return None, None
+                if row["next_attempt_at"] > now:
+                    return None, row["next_attempt_at"]
+                # Conditional on the status, so a row another process claimed first is skipped
+                cursor = self._conn.execute(
+                    "UPDATE submissions SET status = ?, attempts = attempts + 1 WHERE id = ? AND status = ?",
+                    (IN_FLIGHT, row["id"], PENDING),
+                )
+                if cursor.rowcount == 1:
+                    return row, None
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            row, due_at = self._claim()
+            if row is None:
+                wait = self.poll_interval
+                if due_at is not None:
+                    wait = min(wait, max(0.0, due_at - time.time()))
+                with self._wakeup:
+                    self._wakeup.wait(wait)
+                continue
+            # Keep the submitting request's correlation id on the worker's log records
+            with correlation_scope(row["correlation_id"]):
+                self._attempt(row)
+
+    def _notify(self, job_id: Optional[str], state: str, detail: Optional[str] = None) -> None:
+        if job_id and self.on_status is not None:
+            try:
+                self.on_status(job_id, state, detail)
+            except Exception as e:
+                logger.error("Job status update for %s failed: %s", job_id, e)
+
+    def _attempt(self, row: sqlite3.Row) -> None:
+        attempt = row["attempts"] + 1
+        self._notify(row["job_id"], job_status.UPLOADING, f"attempt {attempt}")
+        spool_file = None
+        file_data = None
+        if row["file_path"]:
+            # Hand the open spool file to the deliverer so it can stream it
+            spool_file = open(row["file_path"], "rb")
+            file_data = (row["file_name"], spool_file, row["file_type"])
+
+        error = None
+        try:
+            delivered = self.deliver(json.loads(row["payload"]), file_data)
+        except Exception as e:
+            delivered = False
+            error = str(e)
+        finally:
+            if spool_file is not None:
+                spool_file.close()
+
+        now = time.time()
+        if delivered:
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE submissions SET status = ?, delivered_at = ?, last_error = NULL"
+                    " WHERE id = ?", (DELIVERED, now, row["id"]),
+                )
+            self._latencies.append(now - row["enqueued_at"])
+            if row["file_path"] and os.path.exists(row["file_path"]):
+                os.remove(row["file_path"])
+            logger.info("Delivered submission %s after %d attempt(s)", row["id"], attempt)
+            self._notify(row["job_id"], job_status.DELIVERED)
+            return
+
+        error = error or "Webhook delivery failed"
+        if attempt >= self.max_attempts:
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE submissions SET status = ?, last_error = ? WHERE id = ?",
+                    (DEAD, error, row["id"]),
+                )
+            logger.error("Dead-lettered submission %s after %d attempts: %s",
+                         row["id"], attempt, error)
+            self._notify(row["job_id"], job_status.FAILED, error)
+            return
+
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay *= random.uniform(0.5, 1.0)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE submissions SET status = ?, next_attempt_at = ?, last_error = ?"
+                " WHERE id = ?", (PENDING, now + delay, error, row["id"]),
+            )
+        logger.warning("Delivery of submission %s failed (attempt %d), retrying in %.1fs",
+                       row["id"], attempt, delay)
+        self._notify(row["job_id"], job_status.QUEUED, f"retrying in {delay:.0f}s")